@@ -131,7 +131,7 @@ class MainWindow(QMainWindow):
         import logging
         logger = logging.getLogger("songfactory.sync")
 
-        if self.db.get_config("auto_import_on_startup", "false").lower() != "true":
+        if not self.db.get_bool("auto_import_on_startup"):
             return
         sync_folder = self.db.get_config("sync_folder", "")
         if not sync_folder:
@@ -26,7 +26,32 @@ logger = logging.getLogger("songfactory.automation.diagnostics")
 SCREENSHOT_DIR = Path.home() / ".songfactory" / "screenshots"
 
 
-@dataclass
+# Static parts of DiagnosticReport.to_html(), built once at import
+_STATUS_COLORS = {
+    "pass": "#4CAF50",
+    "fail": "#f44336",
+    "warn": "#FF9800",
+    "skip": "#888888",
+}
+_HTML_HEADER = "\n".join([
+    "<html><body style='font-family: monospace; background: #1e1e1e; color: #e0e0e0;'>",
+    "<h2>Pipeline Diagnostic Report</h2>",
+    "<p>Overall: <b>{overall}</b></p>",
+    "<table border='1' cellpadding='6' cellspacing='0' style='border-color: #555;'>",
+    "<tr><th>Phase</th><th>Name</th><th>Status</th><th>Duration</th><th>Detail</th></tr>",
+])
+_ROW_TMPL = (
+    "<tr>"
+    "<td>{phase}</td>"
+    "<td>{name}</td>"
+    "<td style='color: {color}; font-weight: bold;'>{status}</td>"
+    "<td>{duration:.1f}s</td>"
+    "<td>{detail}</td>"
+    "</tr>"
+)
+
+
+@dataclass(slots=True)
 class DiagnosticResult:
     """Result of a single diagnostic phase."""
     phase: str
@@ -40,7 +65,7 @@ class DiagnosticResult:
     detail: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class DiagnosticReport:
     """Aggregated results from a full diagnostic run."""
     results: list[DiagnosticResult] = field(default_factory=list)
@@ -59,41 +84,26 @@ class DiagnosticReport:
 
     def to_html(self) -> str:
         """Render the report as an HTML string for display."""
-        lines = [
-            "<html><body style='font-family: monospace; background: #1e1e1e; color: #e0e0e0;'>",
-            "<h2>Pipeline Diagnostic Report</h2>",
-            f"<p>Overall: <b>{self.overall_status.upper()}</b></p>",
-            "<table border='1' cellpadding='6' cellspacing='0' style='border-color: #555;'>",
-            "<tr><th>Phase</th><th>Name</th><th>Status</th><th>Duration</th><th>Detail</th></tr>",
-        ]
-        status_colors = {
-            "pass": "#4CAF50",
-            "fail": "#f44336",
-            "warn": "#FF9800",
-            "skip": "#888888",
-        }
+        lines = [_HTML_HEADER.format(overall=self.overall_status.upper())]
         for r in self.results:
-            color = status_colors.get(r.status, "#e0e0e0")
             detail = r.detail or r.error_category or ""
             if r.selector_matched:
                 detail += f" (matched: {r.selector_matched})"
-            lines.append(
-                f"<tr>"
-                f"<td>{r.phase}</td>"
-                f"<td>{r.name}</td>"
-                f"<td style='color: {color}; font-weight: bold;'>{r.status.upper()}</td>"
-                f"<td>{r.duration:.1f}s</td>"
-                f"<td>{detail}</td>"
-                f"</tr>"
-            )
+            lines.append(_ROW_TMPL.format(
+                phase=r.phase,
+                name=r.name,
+                color=_STATUS_COLORS.get(r.status, "#e0e0e0"),
+                status=r.status.upper(),
+                duration=r.duration,
+                detail=detail,
+            ))
         lines.append("</table>")
 
         # List screenshots
         screenshots = [r.screenshot_path for r in self.results if r.screenshot_path]
         if screenshots:
             lines.append("<h3>Screenshots</h3><ul>")
-            for s in screenshots:
-                lines.append(f"<li>{s}</li>")
+            lines.extend(f"<li>{s}</li>" for s in screenshots)
             lines.append("</ul>")
 
         lines.append("</body></html>")
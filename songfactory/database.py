@@ -8,11 +8,12 @@ application configuration.
 Database location: ~/.songfactory/songfactory.db
 """
 
-import glob as _glob
 import json
 import os
+import re
 import shutil
 import sqlite3
+import time
 from datetime import datetime
 from pathlib import Path
 from contextlib import contextmanager
@@ -22,6 +23,11 @@ from typing import Any, Optional
 DB_DIR = Path.home() / ".songfactory"
 DB_PATH = DB_DIR / "songfactory.db"
 
+# Backup file names: songfactory_backup_YYYYMMDD_HHMMSS.db
+_BACKUP_NAME_RE = re.compile(
+    r"songfactory_backup_(\d{4})(\d{2})(\d{2})_(\d{2})(\d{2})(\d{2})\.db"
+)
+
 # ---------------------------------------------------------------------------
 # SQL: Table creation
 # ---------------------------------------------------------------------------
@@ -180,19 +186,39 @@ CREATE TABLE IF NOT EXISTS song_tags (
 );
 """
 
-_SCHEMA_VERSION = 5  # Increment for each new migration
+_CREATE_LORE_SUMMARY_CACHE = """
+CREATE TABLE IF NOT EXISTS lore_summary_cache (
+    url_hash  TEXT PRIMARY KEY,
+    category  TEXT,
+    json      TEXT NOT NULL,
+    ts        INTEGER NOT NULL
+);
+"""
+
+_CREATE_SEARCH_CACHE = """
+CREATE TABLE IF NOT EXISTS search_cache (
+    key   TEXT PRIMARY KEY,
+    json  TEXT NOT NULL,
+    ts    INTEGER NOT NULL
+);
+"""
+
+_SCHEMA_VERSION = 7  # Increment for each new migration
 
 
 class Database:
     """SQLite database interface for the Song Factory application."""
 
-    def __init__(self, db_path: str = None) -> None:
+    def __init__(self, db_path: str = None, assume_migrated: bool = False) -> None:
         """Initialise the database: create the storage directory, open a
         connection, and ensure all tables exist.
 
         Args:
             db_path: Optional override for the database file path.
                      Defaults to ``~/.songfactory/songfactory.db``.
+            assume_migrated: Skip table creation and migrations.  Only
+                     pass this for a file already opened by this version
+                     of Song Factory, e.g. a copy of a prepared template.
         """
         if db_path is not None:
             self._db_path = db_path
@@ -200,17 +226,47 @@ class Database:
         else:
             DB_DIR.mkdir(parents=True, exist_ok=True)
             self._db_path = str(DB_PATH)
-        self._conn = sqlite3.connect(self._db_path)
-        self._conn.row_factory = sqlite3.Row
-        self._conn.execute("PRAGMA journal_mode=WAL;")
-        self._conn.execute("PRAGMA foreign_keys=ON;")
-        self._create_tables()
-        self._run_migrations()
+        self._tx_depth = 0  # open transaction() blocks
+        self._conn = self._connect()
+        if not assume_migrated:
+            self._create_tables()
+            self._run_migrations()
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to ``_db_path`` with the standard pragmas.
+
+        WAL lets readers and a writer proceed concurrently, and with WAL
+        ``synchronous=NORMAL`` is still crash-safe while skipping an fsync
+        on every commit.  The page cache (40 MB) and memory map (256 MB)
+        are sized so a typical library is read from memory after the
+        first query.
+        """
+        conn = sqlite3.connect(self._db_path)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL;")
+        conn.execute("PRAGMA synchronous=NORMAL;")
+        conn.execute("PRAGMA temp_store=MEMORY;")
+        conn.execute("PRAGMA cache_size=-40000;")
+        conn.execute("PRAGMA mmap_size=268435456;")
+        conn.execute("PRAGMA foreign_keys=ON;")
+        # Cached query results belong to the previous connection
+        self._songs_cache = None
+        return conn
+
+    def _data_version(self) -> tuple[int, int]:
+        """Return a token that changes whenever the database is written.
+
+        ``PRAGMA data_version`` moves when another connection commits;
+        ``total_changes`` counts this connection's own writes.
+        """
+        with self._cursor() as cur:
+            cur.execute("PRAGMA data_version;")
+            return cur.fetchone()[0], self._conn.total_changes
+
     def _create_tables(self) -> None:
         """Create all tables if they do not already exist."""
         with self._cursor() as cur:
@@ -225,6 +281,8 @@ class Database:
             cur.execute(_CREATE_ARTISTS)
             cur.execute(_CREATE_TAGS)
             cur.execute(_CREATE_SONG_TAGS)
+            cur.execute(_CREATE_LORE_SUMMARY_CACHE)
+            cur.execute(_CREATE_SEARCH_CACHE)
 
     # ------------------------------------------------------------------
     # Versioned migrations (PRAGMA user_version)
@@ -254,6 +312,12 @@ class Database:
         if current < 5:
             self._migrate_v5_tags_tables()
 
+        if current < 6:
+            self._migrate_v6_lore_summary_cache()
+
+        if current < 7:
+            self._migrate_v7_search_cache()
+
         self._conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
         self._conn.commit()
 
@@ -500,20 +564,66 @@ class Database:
                 )
         self._conn.commit()
 
+    def _migrate_v6_lore_summary_cache(self) -> None:
+        """v6: Create the lore_summary_cache table used by Lore Discovery."""
+        self._conn.execute(_CREATE_LORE_SUMMARY_CACHE)
+        self._conn.commit()
+
+    def _migrate_v7_search_cache(self) -> None:
+        """v7: Create the search_cache table used by Lore Discovery."""
+        self._conn.execute(_CREATE_SEARCH_CACHE)
+        self._conn.commit()
+
     @contextmanager
     def _cursor(self):
         """Yield a cursor inside a transaction.  Commits on success,
-        rolls back on failure."""
+        rolls back on failure (deferred to the enclosing transaction()
+        block, if any)."""
         cur = self._conn.cursor()
         try:
             yield cur
-            self._conn.commit()
+            self._commit()
         except sqlite3.Error:
-            self._conn.rollback()
+            if not self._tx_depth:
+                self._rollback()
             raise
         finally:
             cur.close()
 
+    def _commit(self) -> None:
+        """Commit, unless a transaction() block will commit later."""
+        if not self._tx_depth:
+            self._conn.commit()
+
+    def _rollback(self) -> None:
+        """Roll back, dropping caches that may hold rolled-back rows.
+
+        A rollback changes neither ``data_version`` nor ``total_changes``,
+        so the song cache key alone would not notice it.
+        """
+        self._songs_cache = None
+        self._conn.rollback()
+
+    @contextmanager
+    def transaction(self):
+        """Group several writes into a single commit.
+
+        Writes made inside the block are committed together when it
+        exits, or all rolled back if it raises.  Blocks may be nested;
+        only the outermost one commits.
+        """
+        self._tx_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._tx_depth -= 1
+            if not self._tx_depth:
+                self._rollback()
+            raise
+        self._tx_depth -= 1
+        if not self._tx_depth:
+            self._conn.commit()
+
     @staticmethod
     def _row_to_dict(row: Optional[sqlite3.Row]) -> Optional[dict]:
         """Convert a sqlite3.Row to a plain dict, or return None."""
@@ -553,9 +663,15 @@ class Database:
         filename = f"songfactory_backup_{timestamp}.db"
         dest_path = os.path.join(directory, filename)
 
+        # Fold the WAL back into the main file first; the backup reads
+        # through the connection either way, but this keeps the WAL short
+        self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE);")
+
         dest_conn = sqlite3.connect(dest_path)
         try:
-            self._conn.backup(dest_conn)
+            # pages=-1 copies the whole database in a single step rather
+            # than in page-sized increments
+            self._conn.backup(dest_conn, pages=-1)
         finally:
             dest_conn.close()
 
@@ -564,13 +680,20 @@ class Database:
     def restore_from(self, backup_path: str) -> None:
         """Replace the current database with the contents of *backup_path*.
 
-        Before overwriting, creates a safety copy of the current database
+        The backup is checked first, so a damaged or unrelated file is
+        rejected while the live database is still untouched.  Before
+        overwriting, creates a safety copy of the current database
         as ``songfactory_pre_restore.db`` in the database directory.
         After copying, removes any leftover WAL/SHM files, reopens the
         connection, and runs table creation / migration.
+
+        Raises:
+            FileNotFoundError: If *backup_path* does not exist.
+            ValueError: If *backup_path* is not a Song Factory database.
         """
         if not os.path.isfile(backup_path):
             raise FileNotFoundError(f"Backup file not found: {backup_path}")
+        self._check_backup(backup_path)
 
         # Close current connection
         if self._conn:
@@ -582,7 +705,8 @@ class Database:
         if os.path.isfile(self._db_path):
             shutil.copy2(self._db_path, safety_path)
 
-        # Overwrite with backup
+        # Overwrite with backup (shutil copies via sendfile() on Linux, so
+        # the data never passes through a Python-level buffer)
         shutil.copy2(backup_path, self._db_path)
 
         # Remove stale WAL/SHM files (they belong to the old database)
@@ -592,12 +716,30 @@ class Database:
                 os.remove(wal_path)
 
         # Reopen and ensure schema is up to date
-        self._conn = sqlite3.connect(self._db_path)
-        self._conn.row_factory = sqlite3.Row
-        self._conn.execute("PRAGMA journal_mode=WAL;")
-        self._conn.execute("PRAGMA foreign_keys=ON;")
+        self._conn = self._connect()
         self._create_tables()
 
+    @staticmethod
+    def _check_backup(backup_path: str) -> None:
+        """Raise ValueError unless *backup_path* is a Song Factory database."""
+        # immutable=1: a WAL-mode backup opened with plain mode=ro still
+        # wants to create -wal/-shm files, which fails in read-only folders
+        # and litters writable ones.
+        uri = Path(backup_path).resolve().as_uri() + "?mode=ro&immutable=1"
+        try:
+            conn = sqlite3.connect(uri, uri=True)
+            try:
+                row = conn.execute(
+                    "SELECT 1 FROM sqlite_master "
+                    "WHERE type = 'table' AND name = 'songs';"
+                ).fetchone()
+            finally:
+                conn.close()
+        except sqlite3.DatabaseError as exc:
+            raise ValueError(f"Not a valid backup file: {exc}") from exc
+        if row is None:
+            raise ValueError("Not a Song Factory backup: no songs table")
+
     @staticmethod
     def detect_backups(directory: str) -> list[dict]:
         """Scan *directory* for Song Factory backup files.
@@ -605,27 +747,32 @@ class Database:
         Returns a list of dicts sorted newest-first, each containing:
         ``path``, ``filename``, ``date`` (human-readable), ``size`` (bytes).
         """
-        if not os.path.isdir(directory):
+        # One directory read; DirEntry.stat() reuses what scandir fetched
+        try:
+            with os.scandir(directory) as it:
+                entries = [
+                    e for e in it
+                    if e.name.startswith("songfactory_backup_")
+                    and e.name.endswith(".db")
+                    and e.is_file()
+                ]
+        except OSError:
             return []
 
-        pattern = os.path.join(directory, "songfactory_backup_*.db")
-        matches = _glob.glob(pattern)
-
         results: list[dict] = []
-        for path in matches:
-            filename = os.path.basename(path)
-            # Extract date from filename: songfactory_backup_YYYYMMDD_HHMMSS.db
-            try:
-                parts = filename.replace("songfactory_backup_", "").replace(".db", "")
-                dt = datetime.strptime(parts, "%Y%m%d_%H%M%S")
-                date_str = dt.strftime("%Y-%m-%d %H:%M:%S")
-            except ValueError:
+        for entry in entries:
+            filename = entry.name
+            # Read the date straight out of the filename
+            m = _BACKUP_NAME_RE.fullmatch(filename)
+            if m:
+                date_str = "{}-{}-{} {}:{}:{}".format(*m.groups())
+            else:
                 date_str = "Unknown"
             results.append({
-                "path": path,
+                "path": entry.path,
                 "filename": filename,
                 "date": date_str,
-                "size": os.path.getsize(path),
+                "size": entry.stat().st_size,
             })
 
         results.sort(key=lambda r: r["filename"], reverse=True)
@@ -673,6 +820,33 @@ class Database:
             )
             return cur.lastrowid
 
+    def add_lore_bulk(self, rows: list[dict]) -> int:
+        """Insert many lore entries in a single transaction.
+
+        Each row is a dict with ``title`` and ``content`` and optional
+        ``category`` / ``active`` keys (same defaults as add_lore).
+        Returns the number of rows inserted.
+        """
+        if not rows:
+            return 0
+        with self._cursor() as cur:
+            cur.executemany(
+                """
+                INSERT INTO lore (title, content, category, active)
+                VALUES (?, ?, ?, ?);
+                """,
+                [
+                    (
+                        r["title"],
+                        r["content"],
+                        r.get("category", "general"),
+                        int(r.get("active", True)),
+                    )
+                    for r in rows
+                ],
+            )
+            return len(rows)
+
     def update_lore(self, lore_id: int, **kwargs: Any) -> bool:
         """Update one or more columns of a lore entry.
 
@@ -739,6 +913,17 @@ class Database:
                 (int(active), category),
             )
 
+    def get_category_active_stats(self, category: str) -> tuple[int, int]:
+        """Return ``(active_count, total)`` for lore entries in *category*."""
+        with self._cursor() as cur:
+            cur.execute(
+                "SELECT COALESCE(SUM(active), 0) AS active_count, "
+                "COUNT(*) AS total FROM lore WHERE category = ?;",
+                (category,),
+            )
+            row = cur.fetchone()
+            return (row["active_count"], row["total"]) if row else (0, 0)
+
     def set_lore_active_bulk(self, lore_ids: list[int], active: bool) -> None:
         """Set the active flag on the lore entries whose ids are in *lore_ids*."""
         if not lore_ids:
@@ -814,6 +999,75 @@ class Database:
         if preset:
             self.set_lore_active_bulk(preset, True)
 
+    # ------------------------------------------------------------------
+    # Lore summary cache
+    # ------------------------------------------------------------------
+
+    def get_cached_summary(self, url_hash: str, max_age_s: int) -> Optional[dict]:
+        """Return a cached Lore Discovery summary, or None if missing/stale."""
+        cutoff = int(time.time()) - max_age_s
+        with self._cursor() as cur:
+            cur.execute(
+                "SELECT json FROM lore_summary_cache WHERE url_hash = ? AND ts >= ?;",
+                (url_hash, cutoff),
+            )
+            row = cur.fetchone()
+        if row is None:
+            return None
+        try:
+            return json.loads(row["json"])
+        except (json.JSONDecodeError, TypeError):
+            return None
+
+    def put_cached_summary(self, url_hash: str, category: str, summary: dict) -> None:
+        """Insert or replace a cached Lore Discovery summary."""
+        with self._cursor() as cur:
+            cur.execute(
+                "INSERT OR REPLACE INTO lore_summary_cache "
+                "(url_hash, category, json, ts) VALUES (?, ?, ?, ?);",
+                (url_hash, category, json.dumps(summary), int(time.time())),
+            )
+
+    @staticmethod
+    def _search_cache_key(query: str, max_results: int) -> str:
+        return f"{query.strip().lower()}\x00{max_results}"
+
+    def get_search_cache(
+        self, query: str, max_results: int, max_age_s: int
+    ) -> Optional[list[dict]]:
+        """Return cached web search results, or None if missing/stale.
+
+        Queries are matched case-insensitively.
+        """
+        cutoff = int(time.time()) - max_age_s
+        with self._cursor() as cur:
+            cur.execute(
+                "SELECT json FROM search_cache WHERE key = ? AND ts >= ?;",
+                (self._search_cache_key(query, max_results), cutoff),
+            )
+            row = cur.fetchone()
+        if row is None:
+            return None
+        try:
+            return json.loads(row["json"])
+        except (json.JSONDecodeError, TypeError):
+            return None
+
+    def put_search_cache(
+        self, query: str, max_results: int, results: list[dict]
+    ) -> None:
+        """Insert or replace the cached results for a web search."""
+        with self._cursor() as cur:
+            cur.execute(
+                "INSERT OR REPLACE INTO search_cache (key, json, ts) "
+                "VALUES (?, ?, ?);",
+                (
+                    self._search_cache_key(query, max_results),
+                    json.dumps(results),
+                    int(time.time()),
+                ),
+            )
+
     # ==================================================================
     # GENRES
     # ==================================================================
@@ -904,9 +1158,39 @@ class Database:
     # ==================================================================
 
     def get_all_songs(self) -> list[dict]:
-        """Return every song, most recent first."""
+        """Return every song, most recent first.
+
+        The rows are cached until the next write to the database (from
+        any connection); callers get fresh dict copies they may modify.
+        """
+        version = self._data_version()
+        if self._songs_cache is None or self._songs_cache[0] != version:
+            with self._cursor() as cur:
+                cur.execute("SELECT * FROM songs ORDER BY created_at DESC;")
+                self._songs_cache = (version, self._rows_to_dicts(cur.fetchall()))
+        return [dict(song) for song in self._songs_cache[1]]
+
+    def get_songs_for_picker(self) -> list[dict]:
+        """Return songs that have an audio file, with only the picker's columns.
+
+        Each dict has ``id``, ``title``, ``genre_label``,
+        ``duration_seconds``, ``file_path_1`` and ``search_text`` -- title,
+        genre and lyrics joined by a unit separator in SQL, so the full
+        lyrics are never loaded as a column of their own.  Sorted by
+        title, then genre, ignoring case.
+        """
         with self._cursor() as cur:
-            cur.execute("SELECT * FROM songs ORDER BY created_at DESC;")
+            cur.execute(
+                """
+                SELECT id, title, genre_label, duration_seconds, file_path_1,
+                       coalesce(title, '') || char(31) ||
+                       coalesce(genre_label, '') || char(31) ||
+                       coalesce(lyrics, '') AS search_text
+                FROM songs
+                WHERE file_path_1 IS NOT NULL AND file_path_1 != ''
+                ORDER BY title COLLATE NOCASE, genre_label COLLATE NOCASE;
+                """
+            )
             return self._rows_to_dicts(cur.fetchall())
 
     def get_songs_by_status(self, status: str) -> list[dict]:
@@ -1067,6 +1351,41 @@ class Database:
                 (key, value),
             )
 
+    @staticmethod
+    def parse_bool(value: Optional[str], default: bool = False) -> bool:
+        """Interpret a stored config value as a boolean.
+
+        Booleans are stored as ``"true"`` / ``"false"``; ``"1"``, ``"yes"``
+        and ``"on"`` are also accepted.  ``None`` yields *default*.
+        """
+        if value is None:
+            return default
+        return value.strip().lower() in ("true", "1", "yes", "on")
+
+    @staticmethod
+    def format_bool(value: bool) -> str:
+        """Return the stored text form of a boolean config value."""
+        return "true" if value else "false"
+
+    def get_bool(self, key: str, default: bool = False) -> bool:
+        """Retrieve a boolean configuration value."""
+        return self.parse_bool(self.get_config(key), default)
+
+    def set_bool(self, key: str, value: bool) -> None:
+        """Store a boolean configuration value."""
+        self.set_config(key, self.format_bool(value))
+
+    def set_configs(self, values: dict[str, str]) -> None:
+        """Insert or update several configuration pairs in one transaction."""
+        with self._cursor() as cur:
+            cur.executemany(
+                """
+                INSERT INTO config (key, value) VALUES (?, ?)
+                ON CONFLICT(key) DO UPDATE SET value = excluded.value;
+                """,
+                list(values.items()),
+            )
+
     def get_all_config(self) -> dict[str, str]:
         """Return every configuration entry as a plain dict."""
         with self._cursor() as cur:
@@ -1340,7 +1659,7 @@ class Database:
             "INSERT INTO artists (name, legal_name, is_default, bio) VALUES (?, ?, ?, ?)",
             (name, legal_name, int(is_default), bio),
         )
-        self._conn.commit()
+        self._commit()
         return cur.lastrowid
 
     def update_artist(self, artist_id: int, **kwargs: Any) -> bool:
@@ -1356,7 +1675,7 @@ class Database:
         self._conn.execute(
             f"UPDATE artists SET {set_clause} WHERE id = ?", values
         )
-        self._conn.commit()
+        self._commit()
         return True
 
     def delete_artist(self, artist_id: int) -> bool:
@@ -1365,7 +1684,7 @@ class Database:
         if artist and artist.get("is_default"):
             return False
         self._conn.execute("DELETE FROM artists WHERE id = ?", (artist_id,))
-        self._conn.commit()
+        self._commit()
         return True
 
     # ==================================================================
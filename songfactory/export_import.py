@@ -26,17 +26,50 @@ from typing import Optional
 
 from secure_config import SENSITIVE_KEYS
 
+# orjson is optional: several times faster than the stdlib json module
+# for the multi-megabyte exports, with the same output
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ijson (optional) lets bundle previews count entries without loading them
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 logger = logging.getLogger("songfactory.export_import")
 
 EXPORT_VERSION = 1
 BUNDLE_VERSION = 1
 
-# Config keys safe to include in personal bundles
-_BUNDLE_CONFIG_KEYS = {
+# Config keys safe to include in personal bundles.  SENSITIVE_KEYS are
+# subtracted up front so export and import need a single membership test.
+_BUNDLE_CONFIG_KEYS = frozenset({
     "ai_model", "submission_mode", "browser_path", "download_dir",
     "max_prompt_length", "use_xvfb", "dk_artist", "dk_songwriter",
     "lalals_username",
-}
+}) - SENSITIVE_KEYS
+
+
+def _write_json(path: str, data) -> None:
+    """Write *data* to *path* as indented UTF-8 JSON."""
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+
+
+def _read_json(path: str):
+    """Load and return the JSON document at *path*."""
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
 
 
 def export_json(
@@ -83,8 +116,7 @@ def export_json(
         data["songs"] = all_songs
 
     os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+    _write_json(path, data)
 
     logger.info("Exported data to %s", path)
     return os.path.abspath(path)
@@ -139,8 +171,7 @@ def import_json(db, path: str) -> dict:
             lore_created, lore_skipped,
             genres_created, genres_skipped
     """
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = _read_json(path)
 
     version = data.get("version", 0)
     if version > EXPORT_VERSION:
@@ -239,8 +270,7 @@ def preview_import(path: str) -> dict:
         dict with keys: song_count, lore_count, genre_count,
                         exported_at, version
     """
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = _read_json(path)
 
     return {
         "version": data.get("version", 0),
@@ -257,23 +287,18 @@ def preview_import(path: str) -> dict:
 # ======================================================================
 
 
-def export_personal_bundle(
-    db,
-    path: str,
-    lore_only: bool = False,
-) -> str:
-    """Export a personal data bundle to a JSON file.
+def build_personal_bundle(db, lore_only: bool = False) -> dict:
+    """Build a personal data bundle as a JSON-ready dict.
 
     Includes lore, genres, presets, artists, and non-sensitive config.
     Sensitive keys (API keys, passwords) are never included.
 
     Args:
         db: Database instance.
-        path: Output file path.
         lore_only: If True, only export lore entries.
 
     Returns:
-        The absolute path to the written file.
+        The bundle dict, as written by export_personal_bundle().
     """
     data: dict = {
         "bundle_version": BUNDLE_VERSION,
@@ -333,12 +358,33 @@ def export_personal_bundle(
         all_config = db.get_all_config()
         data["config"] = {
             k: v for k, v in all_config.items()
-            if k in _BUNDLE_CONFIG_KEYS and k not in SENSITIVE_KEYS
+            if k in _BUNDLE_CONFIG_KEYS
         }
 
+    return data
+
+
+def export_personal_bundle(
+    db,
+    path: str,
+    lore_only: bool = False,
+) -> str:
+    """Export a personal data bundle to a JSON file.
+
+    See build_personal_bundle() for the contents.
+
+    Args:
+        db: Database instance.
+        path: Output file path.
+        lore_only: If True, only export lore entries.
+
+    Returns:
+        The absolute path to the written file.
+    """
+    data = build_personal_bundle(db, lore_only=lore_only)
+
     os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+    _write_json(path, data)
 
     logger.info("Exported personal bundle to %s", path)
     return os.path.abspath(path)
@@ -359,9 +405,16 @@ def import_personal_bundle(db, path: str) -> dict:
         lore_updated, presets_created, presets_updated, artists_created,
         artists_updated, config_updated.
     """
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = _read_json(path)
+    return apply_personal_bundle(db, data)
+
 
+def apply_personal_bundle(db, data: dict) -> dict:
+    """Upsert an already-loaded bundle dict into *db*.
+
+    This is the body of import_personal_bundle(); the return value is
+    the same report dict.
+    """
     bundle_ver = data.get("bundle_version", 0)
     if bundle_ver > BUNDLE_VERSION:
         raise ValueError(
@@ -380,104 +433,105 @@ def import_personal_bundle(db, path: str) -> dict:
         "config_updated": 0,
     }
 
-    # --- Genres: upsert by name ---
-    if "genres" in data:
-        existing = {g["name"].lower(): g for g in db.get_all_genres()}
-        for genre in data["genres"]:
-            name = genre.get("name", "")
-            key = name.lower()
-            if key in existing:
-                db.update_genre(
-                    existing[key]["id"],
-                    prompt_template=genre.get("prompt_template", ""),
-                    description=genre.get("description", ""),
-                    bpm_range=genre.get("bpm_range", ""),
-                    active=genre.get("active", True),
-                )
-                report["genres_updated"] += 1
-            else:
-                db.add_genre(
-                    name=name,
-                    prompt_template=genre.get("prompt_template", ""),
-                    description=genre.get("description", ""),
-                    bpm_range=genre.get("bpm_range", ""),
-                    active=genre.get("active", True),
-                )
-                report["genres_created"] += 1
-
-    # --- Lore: upsert by title ---
-    if "lore" in data:
-        existing = {e["title"].lower(): e for e in db.get_all_lore()}
-        for entry in data["lore"]:
-            title = entry.get("title", "")
-            key = title.lower()
-            if key in existing:
-                db.update_lore(
-                    existing[key]["id"],
-                    content=entry.get("content", ""),
-                    category=entry.get("category", "general"),
-                    active=entry.get("active", True),
-                )
-                report["lore_updated"] += 1
-            else:
-                db.add_lore(
-                    title=title,
-                    content=entry.get("content", ""),
-                    category=entry.get("category", "general"),
-                    active=entry.get("active", True),
-                )
-                report["lore_created"] += 1
-
-    # --- Presets: upsert by name, resolve lore titles to IDs ---
-    if "presets" in data:
-        # Build current title→id map after lore import
-        lore_title_to_id = {e["title"].lower(): e["id"] for e in db.get_all_lore()}
-        existing = {p["name"].lower(): p for p in db.get_all_lore_presets()}
-
-        for preset in data["presets"]:
-            name = preset.get("name", "")
-            lore_titles = preset.get("lore_titles", [])
-            lore_ids = [
-                lore_title_to_id[t.lower()]
-                for t in lore_titles
-                if t.lower() in lore_title_to_id
-            ]
-
-            key = name.lower()
-            if key in existing:
-                db.update_lore_preset(existing[key]["id"], lore_ids=lore_ids)
-                report["presets_updated"] += 1
-            else:
-                db.add_lore_preset(name, lore_ids)
-                report["presets_created"] += 1
-
-    # --- Artists: upsert by name ---
-    if "artists" in data:
-        existing = {a["name"].lower(): a for a in db.get_all_artists()}
-        for artist in data["artists"]:
-            name = artist.get("name", "")
-            key = name.lower()
-            if key in existing:
-                db.update_artist(
-                    existing[key]["id"],
-                    is_default=artist.get("is_default", False),
-                )
-                report["artists_updated"] += 1
-            else:
-                db.add_artist(
-                    name=name,
-                    is_default=artist.get("is_default", False),
-                )
-                report["artists_created"] += 1
-
-    # --- Config: merge non-sensitive keys ---
-    if "config" in data:
-        for key, value in data["config"].items():
-            if key in SENSITIVE_KEYS:
-                continue
-            if key in _BUNDLE_CONFIG_KEYS:
-                db.set_config(key, str(value))
-                report["config_updated"] += 1
+    # One transaction for the whole bundle: a single commit instead of
+    # one per row, and a failed import leaves the database untouched.
+    with db.transaction():
+        # --- Genres: upsert by name ---
+        if "genres" in data:
+            existing = {g["name"].lower(): g for g in db.get_all_genres()}
+            for genre in data["genres"]:
+                name = genre.get("name", "")
+                key = name.lower()
+                if key in existing:
+                    db.update_genre(
+                        existing[key]["id"],
+                        prompt_template=genre.get("prompt_template", ""),
+                        description=genre.get("description", ""),
+                        bpm_range=genre.get("bpm_range", ""),
+                        active=genre.get("active", True),
+                    )
+                    report["genres_updated"] += 1
+                else:
+                    db.add_genre(
+                        name=name,
+                        prompt_template=genre.get("prompt_template", ""),
+                        description=genre.get("description", ""),
+                        bpm_range=genre.get("bpm_range", ""),
+                        active=genre.get("active", True),
+                    )
+                    report["genres_created"] += 1
+
+        # --- Lore: upsert by title ---
+        if "lore" in data:
+            existing = {e["title"].lower(): e for e in db.get_all_lore()}
+            for entry in data["lore"]:
+                title = entry.get("title", "")
+                key = title.lower()
+                if key in existing:
+                    db.update_lore(
+                        existing[key]["id"],
+                        content=entry.get("content", ""),
+                        category=entry.get("category", "general"),
+                        active=entry.get("active", True),
+                    )
+                    report["lore_updated"] += 1
+                else:
+                    db.add_lore(
+                        title=title,
+                        content=entry.get("content", ""),
+                        category=entry.get("category", "general"),
+                        active=entry.get("active", True),
+                    )
+                    report["lore_created"] += 1
+
+        # --- Presets: upsert by name, resolve lore titles to IDs ---
+        if "presets" in data:
+            # Build current title→id map after lore import
+            lore_title_to_id = {e["title"].lower(): e["id"] for e in db.get_all_lore()}
+            existing = {p["name"].lower(): p for p in db.get_all_lore_presets()}
+
+            for preset in data["presets"]:
+                name = preset.get("name", "")
+                lore_titles = preset.get("lore_titles", [])
+                lore_ids = [
+                    lore_title_to_id[t.lower()]
+                    for t in lore_titles
+                    if t.lower() in lore_title_to_id
+                ]
+
+                key = name.lower()
+                if key in existing:
+                    db.update_lore_preset(existing[key]["id"], lore_ids=lore_ids)
+                    report["presets_updated"] += 1
+                else:
+                    db.add_lore_preset(name, lore_ids)
+                    report["presets_created"] += 1
+
+        # --- Artists: upsert by name ---
+        if "artists" in data:
+            existing = {a["name"].lower(): a for a in db.get_all_artists()}
+            for artist in data["artists"]:
+                name = artist.get("name", "")
+                key = name.lower()
+                if key in existing:
+                    db.update_artist(
+                        existing[key]["id"],
+                        is_default=artist.get("is_default", False),
+                    )
+                    report["artists_updated"] += 1
+                else:
+                    db.add_artist(
+                        name=name,
+                        is_default=artist.get("is_default", False),
+                    )
+                    report["artists_created"] += 1
+
+        # --- Config: merge non-sensitive keys ---
+        if "config" in data:
+            for key, value in data["config"].items():
+                if key in _BUNDLE_CONFIG_KEYS:
+                    db.set_config(key, str(value))
+                    report["config_updated"] += 1
 
     logger.info(
         "Personal bundle import complete: %s",
@@ -495,8 +549,10 @@ def preview_personal_bundle(path: str) -> dict:
     Returns:
         dict with counts and metadata.
     """
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    if ijson is not None:
+        return _stream_bundle_preview(path)
+
+    data = _read_json(path)
 
     return {
         "bundle_version": data.get("bundle_version", 0),
@@ -507,3 +563,45 @@ def preview_personal_bundle(path: str) -> dict:
         "artist_count": len(data.get("artists", [])),
         "config_keys": list(data.get("config", {}).keys()),
     }
+
+
+# Top-level bundle arrays and the preview keys that count them
+_PREVIEW_COUNTS = {
+    "lore": "lore_count",
+    "genres": "genre_count",
+    "presets": "preset_count",
+    "artists": "artist_count",
+}
+
+
+def _stream_bundle_preview(path: str) -> dict:
+    """preview_personal_bundle() via ijson, in a single streaming pass.
+
+    Array entries are counted as they start and config keys are
+    collected from map-key events, so no entry is ever built in memory.
+    """
+    preview = {
+        "bundle_version": 0,
+        "exported_at": "unknown",
+        "lore_count": 0,
+        "genre_count": 0,
+        "preset_count": 0,
+        "artist_count": 0,
+        "config_keys": [],
+    }
+    item_prefixes = {f"{key}.item": name for key, name in _PREVIEW_COUNTS.items()}
+
+    with open(path, "rb") as f:
+        for prefix, event, value in ijson.parse(f):
+            if prefix in item_prefixes:
+                # Each entry starts with one event at this prefix; keys
+                # and closing brackets of an entry share the prefix
+                if event not in ("map_key", "end_map", "end_array"):
+                    preview[item_prefixes[prefix]] += 1
+            elif prefix == "config" and event == "map_key":
+                preview["config_keys"].append(value)
+            elif prefix == "bundle_version" and event == "number":
+                preview["bundle_version"] = int(value)
+            elif prefix == "exported_at" and event == "string":
+                preview["exported_at"] = value
+    return preview
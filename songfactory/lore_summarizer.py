@@ -5,12 +5,17 @@ Uses the Anthropic API to summarize web content into songwriter-relevant
 lore entries focusing on names, places, stories, and cultural details.
 """
 
+import json
+import math
+import re
+from collections import Counter
+
 from anthropic import Anthropic
 
 from ai_models import DEFAULT_MODEL
 
 
-_SYSTEM_PROMPT = """\
+_SYSTEM_PROMPT_BODY = """\
 You are a research assistant for a songwriter who writes songs about Yakima, Washington \
 and the people, places, and stories connected to it.
 
@@ -24,9 +29,86 @@ Focus on:
 
 Write in a factual, note-taking style. Use short paragraphs or bullet points. \
 Keep the summary between 100-400 words. Do NOT invent details — only include \
-information present in the source material.
+information present in the source material."""
+
+_SYSTEM_PROMPT = (
+    _SYSTEM_PROMPT_BODY
+    + "\n\nRespond with ONLY the summary text, no preamble or extra formatting."
+)
+
+_MULTI_SYSTEM_PROMPT = (
+    _SYSTEM_PROMPT_BODY
+    + "\n\nYou will be given several numbered sources. Summarize each one "
+    "separately. Respond with ONLY a JSON array of strings — one summary per "
+    "source, in the same order — with no preamble or code fences."
+)
+
+_CODE_FENCE_RE = re.compile(r"^```(?:json)?\s*|\s*```$")
+
+# Page text longer than this is trimmed before it is sent for summary.
+_MAX_CONTENT_CHARS = 6000
+
+# Sentence boundary: terminal punctuation followed by whitespace and a
+# capital letter, digit or opening quote.
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+(?=[A-Z0-9\"'(])")
+_WORD_RE = re.compile(r"[a-z0-9']+")
+
+# Sentences shorter than this are usually navigation or boilerplate.
+_MIN_SENTENCE_CHARS = 25
+
+
+def preprocess_content(text: str, title: str = "",
+                       max_chars: int = _MAX_CONTENT_CHARS) -> str:
+    """Trim page text to the sentences most relevant to *title*.
 
-Respond with ONLY the summary text, no preamble or extra formatting."""
+    Whitespace is collapsed first; text that then fits in *max_chars* is
+    returned unchanged.  Longer text is split into sentences, each scored
+    by the IDF-weighted overlap of its words with the title (ties favour
+    earlier sentences), and the best are kept — in their original order —
+    until the budget is spent.
+
+    Args:
+        text: Plain-text page content.
+        title: The page title, used to rank sentences.
+        max_chars: Maximum length of the returned text.
+
+    Returns:
+        The trimmed text.
+    """
+    text = re.sub(r"\s+", " ", text).strip()
+    if len(text) <= max_chars:
+        return text
+
+    sentences = [
+        s for s in _SENTENCE_SPLIT_RE.split(text)
+        if len(s) >= _MIN_SENTENCE_CHARS
+    ]
+    if not sentences:
+        return text[:max_chars]
+
+    words = [set(_WORD_RE.findall(s.lower())) for s in sentences]
+    doc_freq = Counter(w for ws in words for w in ws)
+    n = len(sentences)
+    title_words = set(_WORD_RE.findall(title.lower()))
+
+    def score(i: int) -> float:
+        overlap = title_words & words[i]
+        return sum(math.log(1 + n / doc_freq[w]) for w in overlap)
+
+    ranked = sorted(range(n), key=lambda i: (-score(i), i))
+
+    keep = []
+    used = 0
+    for i in ranked:
+        length = len(sentences[i]) + 1
+        if used + length > max_chars:
+            continue
+        keep.append(i)
+        used += length
+
+    if not keep:
+        return sentences[0][:max_chars]
+    return " ".join(sentences[i] for i in sorted(keep))
 
 
 class LoreSummarizer:
@@ -56,21 +138,173 @@ class LoreSummarizer:
         Returns:
             dict with keys: title, content, category, source_url
         """
-        user_message = f"Article title: {title}\nSource URL: {url}\n\n"
+        response = self.client.messages.create(
+            **self._request_params(title, url, content, custom_instructions)
+        )
+        return self.build_summary(title, url, category, response.content[0].text)
 
-        if custom_instructions:
-            user_message += f"Additional instructions: {custom_instructions}\n\n"
+    def summarize_stream(
+        self,
+        title: str,
+        url: str,
+        content: str,
+        custom_instructions: str = "",
+    ):
+        """Stream a summary, yielding text deltas as they arrive.
 
-        user_message += f"Content to summarize:\n\n{content}"
+        Join the deltas and pass them to build_summary() to get the same
+        lore entry dict that summarize() returns.
+        """
+        params = self._request_params(title, url, content, custom_instructions)
+        with self.client.messages.stream(**params) as stream:
+            for text in stream.text_stream:
+                yield text
+
+    def summarize_many(self, items: list[dict], category: str = "general") -> list[dict]:
+        """Summarize several sources with a single API call.
+
+        Packing a handful of short sources into one prompt amortizes the
+        system prompt and saves round-trips.
+
+        Args:
+            items: dicts with keys title, url, content.
+            category: Lore category applied to every summary.
+
+        Returns:
+            One lore entry dict per item, in the same order.
+
+        Raises:
+            ValueError: If the response is not a JSON array with exactly
+                one summary per item.  Callers should fall back to
+                summarize() for each item.
+        """
+        parts = []
+        for n, item in enumerate(items, start=1):
+            parts.append(
+                f"### Source {n}\n"
+                f"Article title: {item['title']}\n"
+                f"Source URL: {item['url']}\n\n"
+                f"{item['content']}"
+            )
+        user_message = (
+            f"Summarize each of the following {len(items)} sources.\n\n"
+            + "\n\n".join(parts)
+        )
 
         response = self.client.messages.create(
             model=self.model,
-            max_tokens=1024,
-            system=_SYSTEM_PROMPT,
+            max_tokens=1024 * len(items),
+            system=_MULTI_SYSTEM_PROMPT,
             messages=[{"role": "user", "content": user_message}],
         )
 
-        summary_text = response.content[0].text.strip()
+        raw = _CODE_FENCE_RE.sub("", response.content[0].text.strip())
+        try:
+            texts = json.loads(raw)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"Summary response is not valid JSON: {exc}") from exc
+        if (
+            not isinstance(texts, list)
+            or len(texts) != len(items)
+            or not all(isinstance(t, str) for t in texts)
+        ):
+            raise ValueError(
+                f"Expected a JSON array of {len(items)} summaries"
+            )
+
+        return [
+            self.build_summary(item["title"], item["url"], category, text)
+            for item, text in zip(items, texts)
+        ]
+
+    # ------------------------------------------------------------------
+    # Message Batches API
+    # ------------------------------------------------------------------
+
+    def submit_batch(self, items: list[dict]) -> str:
+        """Submit many summaries as one Message Batch and return its id.
+
+        Batched requests are billed at half the normal rate but complete
+        asynchronously, so they suit large selections where a delay of a
+        few minutes is acceptable.
+
+        Args:
+            items: dicts with keys custom_id, title, url, content and
+                optionally custom_instructions.  ``custom_id`` must be
+                unique within the batch.
+
+        Returns:
+            The batch id, for use with get_batch() and batch_results().
+        """
+        requests = [
+            {
+                "custom_id": item["custom_id"],
+                "params": self._request_params(
+                    item["title"],
+                    item["url"],
+                    item["content"],
+                    item.get("custom_instructions", ""),
+                ),
+            }
+            for item in items
+        ]
+        batch = self.client.messages.batches.create(requests=requests)
+        return batch.id
+
+    def get_batch(self, batch_id: str):
+        """Return the current batch object (``processing_status``, counts)."""
+        return self.client.messages.batches.retrieve(batch_id)
+
+    def cancel_batch(self, batch_id: str) -> None:
+        """Stop a batch that is still processing.
+
+        Requests that have not started yet are not run (or billed).
+        """
+        self.client.messages.batches.cancel(batch_id)
+
+    def batch_results(self, batch_id: str):
+        """Yield ``(custom_id, text, error)`` for each entry of an ended batch.
+
+        Exactly one of *text* / *error* is set for each entry.
+        """
+        for entry in self.client.messages.batches.results(batch_id):
+            result = entry.result
+            if result.type == "succeeded":
+                yield entry.custom_id, result.message.content[0].text, None
+            else:
+                error = getattr(result, "error", None) or result.type
+                yield entry.custom_id, None, str(error)
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _request_params(
+        self,
+        title: str,
+        url: str,
+        content: str,
+        custom_instructions: str = "",
+    ) -> dict:
+        """Build the Messages API parameters for one summary request."""
+        user_message = f"Article title: {title}\nSource URL: {url}\n\n"
+
+        if custom_instructions:
+            user_message += f"Additional instructions: {custom_instructions}\n\n"
+
+        user_message += f"Content to summarize:\n\n{content}"
+
+        return {
+            "model": self.model,
+            "max_tokens": 1024,
+            "system": _SYSTEM_PROMPT,
+            "messages": [{"role": "user", "content": user_message}],
+        }
+
+    @staticmethod
+    def build_summary(title: str, url: str, category: str, text: str) -> dict:
+        """Wrap raw summary text into a lore entry dict."""
+        summary_text = text.strip()
         summary_text += f"\n\nSource: {url}"
 
         return {
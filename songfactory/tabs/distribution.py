@@ -784,7 +784,7 @@ class DistributionTab(BaseTab):
                 os.path.join(os.path.expanduser("~"), "Music", "SongFactory"),
             ),
             "browser_path": self.db.get_config("browser_path", ""),
-            "use_xvfb": self.db.get_config("use_xvfb", "false").lower() == "true",
+            "use_xvfb": self.db.get_bool("use_xvfb"),
         }
 
         self._worker = DistroKidWorker(
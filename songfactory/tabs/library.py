@@ -611,7 +611,7 @@ class SongLibraryTab(BaseTab):
                 "max_songs_per_session": int(
                     self.db.get_config("max_songs_per_session", "20")
                 ),
-                "dry_run": self.db.get_config("dry_run", "false").lower() == "true",
+                "dry_run": self.db.get_bool("dry_run"),
             }
             self._worker = MusicGptApiWorker(db_path, config)
         else:
@@ -622,7 +622,7 @@ class SongLibraryTab(BaseTab):
                     "download_dir",
                     str(os.path.join(os.path.expanduser("~"), "Music", "SongFactory")),
                 ),
-                "headless": self.db.get_config("headless", "false").lower() == "true",
+                "headless": self.db.get_bool("headless"),
                 "delay_between_songs": int(
                     self.db.get_config("delay_between_songs", "30")
                 ),
@@ -632,8 +632,8 @@ class SongLibraryTab(BaseTab):
                 "generation_timeout": int(
                     self.db.get_config("generation_timeout", "600000")
                 ),
-                "dry_run": self.db.get_config("dry_run", "false").lower() == "true",
-                "use_xvfb": self.db.get_config("use_xvfb", "false").lower() == "true",
+                "dry_run": self.db.get_bool("dry_run"),
+                "use_xvfb": self.db.get_bool("use_xvfb"),
             }
             self._worker = LalalsWorker(db_path, config)
 
@@ -738,7 +738,7 @@ class SongLibraryTab(BaseTab):
                 "max_songs_per_session": int(
                     self.db.get_config("max_songs_per_session", "20")
                 ),
-                "dry_run": self.db.get_config("dry_run", "false").lower() == "true",
+                "dry_run": self.db.get_bool("dry_run"),
             }
             self._worker = MusicGptApiWorker(db_path, config, song_ids=[song_id])
         else:
@@ -749,7 +749,7 @@ class SongLibraryTab(BaseTab):
                     "download_dir",
                     str(os.path.join(os.path.expanduser("~"), "Music", "SongFactory")),
                 ),
-                "headless": self.db.get_config("headless", "false").lower() == "true",
+                "headless": self.db.get_bool("headless"),
                 "delay_between_songs": int(
                     self.db.get_config("delay_between_songs", "30")
                 ),
@@ -759,7 +759,7 @@ class SongLibraryTab(BaseTab):
                 "generation_timeout": int(
                     self.db.get_config("generation_timeout", "600000")
                 ),
-                "dry_run": self.db.get_config("dry_run", "false").lower() == "true",
+                "dry_run": self.db.get_bool("dry_run"),
             }
             self._worker = LalalsWorker(db_path, config, song_ids=[song_id])
 
@@ -832,7 +832,7 @@ class SongLibraryTab(BaseTab):
 
         config = {
             "lalals_username": self.db.get_config("lalals_username", ""),
-            "use_xvfb": self.db.get_config("use_xvfb", "false").lower() == "true",
+            "use_xvfb": self.db.get_bool("use_xvfb"),
             "browser_path": self.db.get_config("browser_path", ""),
         }
 
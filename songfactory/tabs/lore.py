@@ -35,6 +35,19 @@ from validators import validate_lore
 _CATEGORIES = ["people", "places", "events", "themes", "rules", "general"]
 _FILTER_OPTIONS = ["All"] + _CATEGORIES
 
+# Shared per-button stylesheets, built once at import time.
+_SMALL_BTN_QSS = "QPushButton { font-size: 11px; padding: 2px 8px; }"
+_DELETE_SMALL_BTN_QSS = (
+    f"QPushButton {{ font-size: 11px; padding: 2px 8px; "
+    f"background-color: #c0392b; color: {Theme.TEXT}; }} "
+    f"QPushButton:hover {{ background-color: #e74c3c; }}"
+)
+_IO_SMALL_BTN_QSS = (
+    "QPushButton { font-size: 11px; padding: 2px 8px; "
+    "background-color: #444444; color: #e0e0e0; border: 1px solid #666; }"
+    "QPushButton:hover { background-color: #555555; }"
+)
+
 _STYLESHEET = f"""
     QWidget {{
         background-color: {Theme.BG};
@@ -171,6 +184,8 @@ class LoreEditorTab(BaseTab):
 
     def __init__(self, db, parent=None):
         self._presets_cache: list[dict] = []
+        # Lore id -> list item, rebuilt by load_lore_list for O(1) lookups.
+        self._id_to_item: dict[int, QListWidgetItem] = {}
         super().__init__(db, parent)
         self.refresh()
 
@@ -206,23 +221,17 @@ class LoreEditorTab(BaseTab):
 
         self.select_all_btn = QPushButton("Select All")
         self.select_all_btn.setFixedHeight(28)
-        self.select_all_btn.setStyleSheet(
-            f"QPushButton {{ font-size: 11px; padding: 2px 8px; }}"
-        )
+        self.select_all_btn.setStyleSheet(_SMALL_BTN_QSS)
         bulk_row.addWidget(self.select_all_btn)
 
         self.deselect_all_btn = QPushButton("Deselect All")
         self.deselect_all_btn.setFixedHeight(28)
-        self.deselect_all_btn.setStyleSheet(
-            f"QPushButton {{ font-size: 11px; padding: 2px 8px; }}"
-        )
+        self.deselect_all_btn.setStyleSheet(_SMALL_BTN_QSS)
         bulk_row.addWidget(self.deselect_all_btn)
 
         self.toggle_category_btn = QPushButton("Toggle Category")
         self.toggle_category_btn.setFixedHeight(28)
-        self.toggle_category_btn.setStyleSheet(
-            f"QPushButton {{ font-size: 11px; padding: 2px 8px; }}"
-        )
+        self.toggle_category_btn.setStyleSheet(_SMALL_BTN_QSS)
         self.toggle_category_btn.setEnabled(False)
         bulk_row.addWidget(self.toggle_category_btn)
 
@@ -251,23 +260,17 @@ class LoreEditorTab(BaseTab):
 
         self.preset_apply_btn = QPushButton("Apply")
         self.preset_apply_btn.setFixedHeight(28)
-        self.preset_apply_btn.setStyleSheet(
-            f"QPushButton {{ font-size: 11px; padding: 2px 8px; }}"
-        )
+        self.preset_apply_btn.setStyleSheet(_SMALL_BTN_QSS)
         preset_btn_row.addWidget(self.preset_apply_btn)
 
         self.preset_save_btn = QPushButton("Save New")
         self.preset_save_btn.setFixedHeight(28)
-        self.preset_save_btn.setStyleSheet(
-            f"QPushButton {{ font-size: 11px; padding: 2px 8px; }}"
-        )
+        self.preset_save_btn.setStyleSheet(_SMALL_BTN_QSS)
         preset_btn_row.addWidget(self.preset_save_btn)
 
         self.preset_update_btn = QPushButton("Update")
         self.preset_update_btn.setFixedHeight(28)
-        self.preset_update_btn.setStyleSheet(
-            f"QPushButton {{ font-size: 11px; padding: 2px 8px; }}"
-        )
+        self.preset_update_btn.setStyleSheet(_SMALL_BTN_QSS)
         self.preset_update_btn.setToolTip(
             "Overwrite the selected preset with the currently active lore entries"
         )
@@ -276,11 +279,7 @@ class LoreEditorTab(BaseTab):
         self.preset_delete_btn = QPushButton("Delete")
         self.preset_delete_btn.setFixedHeight(28)
         self.preset_delete_btn.setObjectName("deleteButton")
-        self.preset_delete_btn.setStyleSheet(
-            f"QPushButton {{ font-size: 11px; padding: 2px 8px; "
-            f"background-color: #c0392b; color: {Theme.TEXT}; }} "
-            f"QPushButton:hover {{ background-color: #e74c3c; }}"
-        )
+        self.preset_delete_btn.setStyleSheet(_DELETE_SMALL_BTN_QSS)
         preset_btn_row.addWidget(self.preset_delete_btn)
 
         presets_layout.addLayout(preset_btn_row)
@@ -295,21 +294,13 @@ class LoreEditorTab(BaseTab):
 
         self.export_lore_btn = QPushButton("Export Lore")
         self.export_lore_btn.setFixedHeight(28)
-        self.export_lore_btn.setStyleSheet(
-            "QPushButton { font-size: 11px; padding: 2px 8px; "
-            "background-color: #444444; color: #e0e0e0; border: 1px solid #666; }"
-            "QPushButton:hover { background-color: #555555; }"
-        )
+        self.export_lore_btn.setStyleSheet(_IO_SMALL_BTN_QSS)
         self.export_lore_btn.setToolTip("Export all lore entries to a JSON file")
         lore_io_row.addWidget(self.export_lore_btn)
 
         self.import_lore_btn = QPushButton("Import Lore")
         self.import_lore_btn.setFixedHeight(28)
-        self.import_lore_btn.setStyleSheet(
-            "QPushButton { font-size: 11px; padding: 2px 8px; "
-            "background-color: #444444; color: #e0e0e0; border: 1px solid #666; }"
-            "QPushButton:hover { background-color: #555555; }"
-        )
+        self.import_lore_btn.setStyleSheet(_IO_SMALL_BTN_QSS)
         self.import_lore_btn.setToolTip(
             "Import lore from a JSON file (personal bundle or lore-only)"
         )
@@ -435,6 +426,7 @@ class LoreEditorTab(BaseTab):
         prev_id = self._current_id
 
         self.lore_list.clear()
+        self._id_to_item = {}
         all_lore = self.db.get_all_lore()
 
         selected_filter = self.category_filter.currentText()
@@ -458,6 +450,7 @@ class LoreEditorTab(BaseTab):
                 item.setForeground(QColor(Theme.TEXT))
 
             self.lore_list.addItem(item)
+            self._id_to_item[entry["id"]] = item
 
             if entry["id"] == prev_id:
                 reselect_item = item
@@ -556,11 +549,39 @@ class LoreEditorTab(BaseTab):
         self._dirty = False
 
     def save_current(self):
-        """Save and refresh — called by the Save button and other explicit actions."""
+        """Save and refresh — called by the Save button and other explicit actions.
+
+        The saved row is updated in place; the list is only rebuilt when the
+        entry's new category no longer matches the active filter.
+        """
         self._save_to_db()
-        self.load_lore_list()
+        if not self._update_list_item(self._current_id):
+            self.load_lore_list()
         event_bus.lore_changed.emit()
 
+    def _update_list_item(self, lore_id: int | None) -> bool:
+        """Refresh a single list item from the editor fields.
+
+        Returns False if the item is missing or must leave the filtered list,
+        in which case the caller should rebuild the whole list.
+        """
+        item = self._id_to_item.get(lore_id)
+        if item is None:
+            return False
+
+        category = self.category_combo.currentText()
+        selected_filter = self.category_filter.currentText()
+        if selected_filter != "All" and category != selected_filter:
+            return False
+
+        tag = category if category else "general"
+        item.setText(f"{self.title_edit.text().strip()}  [{tag}]")
+        if self.active_check.isChecked():
+            item.setForeground(QColor(Theme.TEXT))
+        else:
+            item.setForeground(QColor(Theme.DIMMED))
+        return True
+
     def _on_save_clicked(self):
         """Handle Save button click with validation."""
         if self._current_id is None:
@@ -691,12 +712,10 @@ class LoreEditorTab(BaseTab):
             return
 
         # Determine majority state: if most are active, disable; otherwise enable.
-        all_lore = self.db.get_all_lore()
-        cat_entries = [e for e in all_lore if e["category"] == selected_filter]
-        if not cat_entries:
+        active_count, total = self.db.get_category_active_stats(selected_filter)
+        if not total:
             return
-        active_count = sum(1 for e in cat_entries if e["active"])
-        new_active = active_count <= len(cat_entries) // 2
+        new_active = active_count * 2 <= total
 
         self.db.set_category_lore_active(selected_filter, new_active)
         self.load_lore_list()
@@ -712,13 +731,11 @@ class LoreEditorTab(BaseTab):
             return
 
         self.toggle_category_btn.setEnabled(True)
-        all_lore = self.db.get_all_lore()
-        cat_entries = [e for e in all_lore if e["category"] == selected_filter]
-        if not cat_entries:
+        active_count, total = self.db.get_category_active_stats(selected_filter)
+        if not total:
             self.toggle_category_btn.setText(f"Enable {selected_filter}")
             return
-        active_count = sum(1 for e in cat_entries if e["active"])
-        if active_count > len(cat_entries) // 2:
+        if active_count * 2 > total:
             self.toggle_category_btn.setText(f"Disable {selected_filter}")
         else:
             self.toggle_category_btn.setText(f"Enable {selected_filter}")
@@ -3,9 +3,15 @@ Lore Discovery Tab — search the web, summarize content, and save as lore.
 
 Provides a two-panel layout: search results on the left with checkboxes,
 and summarized lore entries on the right with inline editing and save
-controls.  All network/API work runs on background QThreads.
+controls.  All network/API work runs as QRunnables on a tab-owned
+QThreadPool.
 """
 
+import hashlib
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -16,233 +22,459 @@ from PyQt6.QtWidgets import (
     QComboBox,
     QPushButton,
     QScrollArea,
-    QCheckBox,
+    QListView,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
+    QStyle,
+    QApplication,
     QTextEdit,
     QFrame,
     QMessageBox,
     QSizePolicy,
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import (
+    Qt,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    pyqtSignal,
+    QAbstractListModel,
+    QModelIndex,
+    QEvent,
+    QRect,
+    QSize,
+    QTimer,
+)
+from PyQt6.QtGui import QFont, QColor, QFontMetrics, QTextCursor
 
+from database import Database
 from tabs.base_tab import BaseTab
-from web_search import search, fetch_content, WebSearchError, SearchResult
-from lore_summarizer import LoreSummarizer
+from web_search import (
+    search, fetch_content_cached, fetch_many, WebSearchError, SearchResult,
+)
+from lore_summarizer import LoreSummarizer, preprocess_content
 from theme import Theme
+from timeouts import get_timeout
 
 _CATEGORIES = ["people", "places", "events", "themes", "rules"]
 
-_STYLESHEET = f"""
-    QWidget {{
-        background-color: {Theme.BG};
-        color: {Theme.TEXT};
-    }}
-    QSplitter::handle {{
-        background-color: #454545;
-        width: 3px;
-    }}
-    QLineEdit {{
-        background-color: {Theme.PANEL};
-        border: 1px solid #555555;
-        border-radius: 4px;
-        padding: 6px 8px;
-        color: {Theme.TEXT};
-        font-size: 14px;
-    }}
-    QLineEdit:focus {{
-        border-color: {Theme.ACCENT};
-    }}
-    QComboBox {{
-        background-color: {Theme.PANEL};
-        border: 1px solid #555555;
-        border-radius: 4px;
-        padding: 5px 8px;
-        color: {Theme.TEXT};
-        min-height: 24px;
-    }}
-    QComboBox::drop-down {{
-        border: none;
-    }}
-    QComboBox QAbstractItemView {{
-        background-color: {Theme.PANEL};
-        color: {Theme.TEXT};
-        selection-background-color: {Theme.ACCENT};
-        selection-color: #1e1e1e;
-    }}
-    QTextEdit {{
-        background-color: {Theme.PANEL};
-        border: 1px solid #555555;
-        border-radius: 4px;
-        padding: 6px;
-        color: {Theme.TEXT};
-        font-size: 13px;
-    }}
-    QTextEdit:focus {{
-        border-color: {Theme.ACCENT};
-    }}
-    QCheckBox {{
-        color: {Theme.TEXT};
-        spacing: 8px;
-        font-size: 13px;
-    }}
-    QCheckBox::indicator {{
-        width: 16px;
-        height: 16px;
-        border: 1px solid #555555;
-        border-radius: 3px;
-        background-color: {Theme.PANEL};
-    }}
-    QCheckBox::indicator:checked {{
-        background-color: {Theme.ACCENT};
-        border-color: {Theme.ACCENT};
-    }}
-    QPushButton {{
-        background-color: {Theme.ACCENT};
-        color: #1e1e1e;
-        border: none;
-        border-radius: 4px;
-        padding: 8px 16px;
-        font-weight: bold;
-        font-size: 13px;
-    }}
-    QPushButton:hover {{
-        background-color: #f0b848;
-    }}
-    QPushButton:pressed {{
-        background-color: #d09828;
-    }}
-    QPushButton:disabled {{
-        background-color: #3a3a3a;
-        color: #666666;
-        border: 1px solid #444444;
-    }}
-    QPushButton#secondaryBtn {{
-        background-color: #454545;
-        color: {Theme.TEXT};
-        border: 1px solid #555555;
-    }}
-    QPushButton#secondaryBtn:hover {{
-        background-color: #555555;
-        border-color: {Theme.ACCENT};
-    }}
-    QPushButton#secondaryBtn:disabled {{
-        background-color: #3a3a3a;
-        color: #666666;
-    }}
-    QLabel {{
-        color: {Theme.TEXT};
-        font-size: 12px;
-    }}
-    QLabel#sectionLabel {{
-        font-weight: bold;
-        font-size: 13px;
-        color: {Theme.ACCENT};
-    }}
-    QLabel#statusLabel {{
-        color: {Theme.DIMMED};
-        font-size: 12px;
-    }}
-    QScrollArea {{
-        border: 1px solid #555555;
-        border-radius: 4px;
-        background-color: {Theme.PANEL};
-    }}
-"""
+# Maximum number of pages fetched concurrently by SummarizeWorker.
+_FETCH_WORKERS = 8
+
+# Maximum number of concurrent Anthropic summarize calls — kept low to
+# stay clear of API rate limits.
+_SUMMARIZE_WORKERS = 4
+
+# Number of sources packed into one live summarize prompt.
+_SUMMARIES_PER_PROMPT = 5
+
+# Selections at least this large go through the (half-price) Message
+# Batches API instead of live calls.
+_BATCH_THRESHOLD = 10
+
+# Seconds between Message Batch status polls.
+_BATCH_POLL_S = 15
+
+# How long cached web search results are served without a new search.
+_SEARCH_CACHE_TTL_S = 6 * 3600
 
+# Number of results requested per web search.
+_SEARCH_MAX_RESULTS = 10
+
+# How long a cached Lore Discovery summary stays valid.  The cache key
+# includes a hash of the page text, so changed pages miss regardless.
+_SUMMARY_CACHE_TTL_S = 7 * 24 * 3600
 
 # ===================================================================
 # SearchWorker — runs DuckDuckGo search off the main thread
 # ===================================================================
 
-class SearchWorker(QThread):
-    """Background worker for web searches."""
+class _SearchSignals(QObject):
+    results_ready = pyqtSignal(int, list)   # (generation, list[SearchResult])
+    error = pyqtSignal(int, str)            # (generation, message)
 
-    results_ready = pyqtSignal(list)   # list[SearchResult]
-    error = pyqtSignal(str)
 
-    def __init__(self, query: str, max_results: int = 10, parent=None):
-        super().__init__(parent)
+class SearchWorker(QRunnable):
+    """Pooled runnable for web searches.
+
+    Every signal carries the generation the search was started with, so
+    the tab can drop results from a search that has been superseded.
+    """
+
+    def __init__(self, query: str, generation: int,
+                 max_results: int = _SEARCH_MAX_RESULTS,
+                 db_path: str | None = None):
+        super().__init__()
+        self.signals = _SearchSignals()
         self._query = query
+        self._gen = generation
         self._max_results = max_results
+        self._db_path = db_path
+        self._stop_requested = False
+        self.setAutoDelete(True)
+
+    def request_stop(self):
+        """Drop the results of this search once it returns."""
+        self._stop_requested = True
 
     def run(self):
+        if self._stop_requested:
+            return
         try:
             results = search(self._query, max_results=self._max_results)
-            self.results_ready.emit(results)
+            if self._db_path:
+                self._store(results)
+            if not self._stop_requested:
+                self.signals.results_ready.emit(self._gen, results)
         except WebSearchError as exc:
-            self.error.emit(str(exc))
+            self.signals.error.emit(self._gen, str(exc))
         except Exception as exc:
-            self.error.emit(f"Search error: {exc}")
+            self.signals.error.emit(self._gen, f"Search error: {exc}")
+
+    def _store(self, results: list[SearchResult]):
+        """Write *results* to the search cache; failures are ignored."""
+        try:
+            db = Database(db_path=self._db_path)
+            try:
+                db.put_search_cache(
+                    self._query, self._max_results,
+                    [_result_to_dict(r) for r in results],
+                )
+            finally:
+                db.close()
+        except Exception:
+            pass
+
+
+def _result_to_dict(result: SearchResult) -> dict:
+    """Return the constructor fields of *result* for JSON storage."""
+    return {
+        "title": result.title,
+        "url": result.url,
+        "snippet": result.snippet,
+        "body": result.body,
+    }
 
 
 # ===================================================================
 # SummarizeWorker — fetches pages + calls Anthropic to summarize
 # ===================================================================
 
-class SummarizeWorker(QThread):
-    """Background worker that fetches page content and summarizes it."""
+class _SummarizeSignals(QObject):
+    # Every signal leads with the generation the run was started with.
+    progress = pyqtSignal(int, str)             # status message
+    item_started = pyqtSignal(int, int)         # index — streaming is about to begin
+    chunk_received = pyqtSignal(int, int, str)  # (index, text_delta)
+    item_complete = pyqtSignal(int, int, dict)  # (index, summary_dict)
+    item_error = pyqtSignal(int, int, str)      # (index, error_message)
+    all_complete = pyqtSignal(int)
+
 
-    progress = pyqtSignal(str)            # status message
-    item_complete = pyqtSignal(int, dict)  # (index, summary_dict)
-    item_error = pyqtSignal(int, str)      # (index, error_message)
-    all_complete = pyqtSignal()
+class SummarizeWorker(QRunnable):
+    """Pooled runnable that fetches page content and summarizes it."""
 
     def __init__(
         self,
         api_key: str,
         items: list[tuple[int, SearchResult]],  # (index, result)
+        generation: int,
         category: str = "general",
-        parent=None,
+        db_path: str | None = None,
     ):
-        super().__init__(parent)
+        super().__init__()
+        self.signals = _SummarizeSignals()
+        self.setAutoDelete(True)
+        self._gen = generation
+        self._stop_requested = False
         self._api_key = api_key
         self._items = items
         self._category = category
+        self._db_path = db_path  # summary cache; connection opened in run()
+        # Cache key -> indices waiting on that summary (single-flight).
+        self._pending: dict[str, list[int]] = {}
+
+    def request_stop(self):
+        """Ask the run to stop at its next checkpoint."""
+        self._stop_requested = True
+
+    def _fetch_all(self, urls: list[str]) -> dict[str, str]:
+        """Fetch every URL concurrently and return ``{url: page_text}``.
+
+        URLs that fail to download (or come back empty) are omitted from
+        the result so the caller can retry or fall back to the search
+        snippet.
+        """
+        unique = list(dict.fromkeys(u for u in urls if u))
+        done = 0
+
+        def report(url: str, text: str) -> None:
+            nonlocal done
+            done += 1
+            self.signals.progress.emit(self._gen, f"Fetched {done}/{len(unique)} pages...")
+
+        texts = fetch_many(
+            unique, workers=_FETCH_WORKERS,
+            fetch=fetch_content_cached, on_result=report,
+        )
+        return {url: text for url, text in zip(unique, texts) if text}
+
+    @staticmethod
+    def _content_for(result: SearchResult, pages: dict[str, str]) -> str:
+        """Return the text to summarize for *result*."""
+        # Use the prefetched page; retry once, then fall back to snippet
+        page_text = pages.get(result.url)
+        if page_text is None:
+            try:
+                page_text = fetch_content_cached(result.url)
+            except WebSearchError:
+                page_text = ""
+        if page_text.strip():
+            return preprocess_content(page_text, result.title)
+        return result.snippet
+
+    @staticmethod
+    def _cache_key(url: str, category: str, content: str) -> str:
+        """Summary cache key — changes whenever the page content changes."""
+        content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        return hashlib.sha256(
+            f"{url}\0{category}\0{content_hash}".encode("utf-8")
+        ).hexdigest()
+
+    def _finish(self, db, key: str, summary: dict | None = None,
+                error: str | None = None):
+        """Report a summary (or failure) to every index waiting on *key*."""
+        for idx in self._pending.pop(key, []):
+            if error is None:
+                self.signals.item_complete.emit(self._gen, idx, summary)
+            else:
+                self.signals.item_error.emit(self._gen, idx, error)
+        if error is None and db is not None:
+            db.put_cached_summary(key, self._category, summary)
 
     def run(self):
+        db = Database(db_path=self._db_path) if self._db_path else None
+        try:
+            if self._items:
+                self._summarize_all(db)
+        finally:
+            if db is not None:
+                db.close()
+        self.signals.all_complete.emit(self._gen)
+
+    def _summarize_all(self, db):
         summarizer = LoreSummarizer(api_key=self._api_key)
+        pages = self._fetch_all([result.url for _, result in self._items])
 
+        # Serve cached summaries and collapse duplicate requests so each
+        # distinct page is summarized at most once.
+        jobs: list[tuple[str, SearchResult, str]] = []  # (key, result, content)
+        self._pending = {}
         for idx, result in self._items:
-            self.progress.emit(f"Summarizing: {result.title}...")
+            content = self._content_for(result, pages)
+            key = self._cache_key(result.url, self._category, content)
+            if key in self._pending:
+                self._pending[key].append(idx)
+                continue
+            cached = None
+            if db is not None:
+                cached = db.get_cached_summary(key, _SUMMARY_CACHE_TTL_S)
+            if cached is not None:
+                self.signals.item_complete.emit(self._gen, idx, cached)
+                continue
+            self._pending[key] = [idx]
+            jobs.append((key, result, content))
+
+        if not jobs:
+            return
 
-            # Try fetching the full page; fall back to snippet
-            content = result.snippet
+        total = len(jobs)
+        if total >= _BATCH_THRESHOLD:
             try:
-                page_text = fetch_content(result.url)
-                if page_text.strip():
-                    content = page_text
-            except WebSearchError:
-                pass  # use snippet as fallback
+                self._run_batch(summarizer, jobs, db)
+            except Exception as exc:
+                for key in list(self._pending):
+                    self._finish(db, key, error=f"Batch failed: {exc}")
+            return
 
+        self.signals.progress.emit(self._gen, f"Summarizing {total} items...")
+
+        # Pack a few sources per prompt, overlap the API calls, and report
+        # each chunk as soon as it finishes.
+        chunks = [
+            jobs[i:i + _SUMMARIES_PER_PROMPT]
+            for i in range(0, total, _SUMMARIES_PER_PROMPT)
+        ]
+        done = 0
+        workers = min(_SUMMARIZE_WORKERS, len(chunks))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(self._summarize_chunk, summarizer, chunk): chunk
+                for chunk in chunks
+            }
+            for future in as_completed(futures):
+                chunk = futures[future]
+                done += len(chunk)
+                self.signals.progress.emit(self._gen, f"Summarized {done}/{total}...")
+                try:
+                    outcomes = future.result()
+                except Exception as exc:
+                    for key, _, _ in chunk:
+                        self._finish(db, key, error=str(exc))
+                    continue
+                for key, summary, error in outcomes:
+                    self._finish(db, key, summary, error)
+
+    def _summarize_chunk(
+        self,
+        summarizer: LoreSummarizer,
+        chunk: list[tuple[str, SearchResult, str]],
+    ) -> list[tuple[str, dict | None, str | None]]:
+        """Summarize a chunk of jobs, returning ``(key, summary, error)``.
+
+        Multi-item chunks use one combined prompt; if that response can't
+        be parsed, each item is summarized on its own instead.
+        """
+        if len(chunk) > 1:
             try:
-                summary = summarizer.summarize(
-                    title=result.title,
-                    url=result.url,
-                    content=content,
+                summaries = summarizer.summarize_many(
+                    [
+                        {"title": result.title, "url": result.url,
+                         "content": content}
+                        for _, result, content in chunk
+                    ],
                     category=self._category,
                 )
-                self.item_complete.emit(idx, summary)
+            except ValueError:
+                pass
+            else:
+                return [
+                    (key, summary, None)
+                    for (key, _, _), summary in zip(chunk, summaries)
+                ]
+
+        outcomes = []
+        for key, result, content in chunk:
+            try:
+                summary = self._stream_item(summarizer, key, result, content)
             except Exception as exc:
-                self.item_error.emit(idx, str(exc))
+                outcomes.append((key, None, str(exc)))
+            else:
+                outcomes.append((key, summary, None))
+        return outcomes
+
+    def _stream_item(
+        self,
+        summarizer: LoreSummarizer,
+        key: str,
+        result: SearchResult,
+        content: str,
+    ) -> dict:
+        """Summarize one item, forwarding text deltas as they stream in."""
+        indices = list(self._pending.get(key, []))
+        for idx in indices:
+            self.signals.item_started.emit(self._gen, idx)
+
+        parts = []
+        for delta in summarizer.summarize_stream(
+            title=result.title, url=result.url, content=content,
+        ):
+            parts.append(delta)
+            for idx in indices:
+                self.signals.chunk_received.emit(self._gen, idx, delta)
+
+        return summarizer.build_summary(
+            result.title, result.url, self._category, "".join(parts),
+        )
 
-        self.all_complete.emit()
+    def _run_batch(
+        self,
+        summarizer: LoreSummarizer,
+        jobs: list[tuple[str, SearchResult, str]],
+        db,
+    ):
+        """Summarize every job through one Message Batch and poll for it."""
+        by_id: dict[str, tuple[str, SearchResult]] = {}
+        requests = []
+        for n, (key, result, content) in enumerate(jobs):
+            custom_id = f"item-{n}"
+            by_id[custom_id] = (key, result)
+            requests.append({
+                "custom_id": custom_id,
+                "title": result.title,
+                "url": result.url,
+                "content": content,
+            })
+
+        total = len(requests)
+        self.signals.progress.emit(self._gen, f"Submitting batch of {total} items...")
+        batch_id = summarizer.submit_batch(requests)
+
+        while True:
+            batch = summarizer.get_batch(batch_id)
+            if batch.processing_status == "ended":
+                break
+            counts = batch.request_counts
+            finished = total - counts.processing
+            self.signals.progress.emit(self._gen, f"Batch {finished}/{total} complete")
+            for _ in range(_BATCH_POLL_S):
+                if self._stop_requested:
+                    try:
+                        summarizer.cancel_batch(batch_id)
+                    finally:
+                        for key, _ in by_id.values():
+                            self._finish(db, key, error="Batch cancelled")
+                    return
+                time.sleep(1)
+
+        for custom_id, text, error in summarizer.batch_results(batch_id):
+            if custom_id not in by_id:
+                continue
+            key, result = by_id.pop(custom_id)
+            if error is not None:
+                self._finish(db, key, error=error)
+                continue
+            self._finish(db, key, summarizer.build_summary(
+                result.title, result.url, self._category, text,
+            ))
+
+        for key, _ in by_id.values():
+            self._finish(db, key, error="No result returned by batch")
 
 
 # ===================================================================
 # SummaryCard — inline editable summary widget
 # ===================================================================
 
+_CARD_QSS = (
+    f"QFrame {{ background-color: {Theme.PANEL}; border: 1px solid #555555; "
+    f"border-radius: 6px; padding: 8px; }}"
+)
+_SOURCE_LABEL_QSS = f"color: {Theme.DIMMED}; font-size: 11px;"
+_ERROR_LABEL_QSS = f"color: {Theme.ERROR}; font-size: 12px; padding: 8px;"
+
+
 class SummaryCard(QFrame):
     """An editable card showing a single summarized lore entry."""
 
+    # Shared by every card; built on first use because QFont needs a
+    # running QApplication.
+    _mono_font: QFont | None = None
+
+    @classmethod
+    def _content_font(cls) -> QFont:
+        if cls._mono_font is None:
+            cls._mono_font = QFont("Courier New", 11)
+            cls._mono_font.setStyleHint(QFont.StyleHint.Monospace)
+        return cls._mono_font
+
     def __init__(self, summary: dict, parent=None):
         super().__init__(parent)
         self.summary = summary
+        # Content is only loaded into the QTextEdit once the card is first
+        # scrolled into view (see hydrate()).
+        self._pending_content: str | None = summary.get("content", "")
         self.setFrameShape(QFrame.Shape.StyledPanel)
-        self.setStyleSheet(
-            f"QFrame {{ background-color: {Theme.PANEL}; border: 1px solid #555555; "
-            f"border-radius: 6px; padding: 8px; }}"
-        )
+        self.setStyleSheet(_CARD_QSS)
         self._build_ui()
 
     def _build_ui(self):
@@ -277,19 +509,16 @@ class SummaryCard(QFrame):
         layout.addWidget(content_label)
 
         self.content_edit = QTextEdit()
-        self.content_edit.setPlainText(self.summary.get("content", ""))
         self.content_edit.setMinimumHeight(120)
         self.content_edit.setMaximumHeight(200)
-        mono = QFont("Courier New", 11)
-        mono.setStyleHint(QFont.StyleHint.Monospace)
-        self.content_edit.setFont(mono)
+        self.content_edit.setFont(self._content_font())
         layout.addWidget(self.content_edit)
 
         # Source
         source_url = self.summary.get("source_url", "")
         if source_url:
             src_label = QLabel(f"Source: {source_url}")
-            src_label.setStyleSheet(f"color: {Theme.DIMMED}; font-size: 11px;")
+            src_label.setStyleSheet(_SOURCE_LABEL_QSS)
             src_label.setWordWrap(True)
             layout.addWidget(src_label)
 
@@ -298,53 +527,249 @@ class SummaryCard(QFrame):
         self.add_btn.setObjectName("secondaryBtn")
         layout.addWidget(self.add_btn)
 
+    def hydrate(self):
+        """Load the deferred summary text into the content editor."""
+        if self._pending_content is None:
+            return
+        self.content_edit.setPlainText(self._pending_content)
+        self._pending_content = None
+
+    def is_hydrated(self) -> bool:
+        return self._pending_content is None
+
+    def append_text(self, text: str):
+        """Append streamed text to the end of the content editor."""
+        self.hydrate()
+        cursor = self.content_edit.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(text)
+
+    def finalize(self, summary: dict):
+        """Replace streamed text with the finished summary and enable saving."""
+        self.summary = summary
+        self.title_edit.setText(summary.get("title", ""))
+        idx = self.category_combo.findText(summary.get("category", ""))
+        if idx >= 0:
+            self.category_combo.setCurrentIndex(idx)
+        self._pending_content = None
+        self.content_edit.setPlainText(summary.get("content", ""))
+        self.add_btn.setEnabled(True)
+
     def get_data(self) -> dict:
         """Return the current edited values."""
+        if self._pending_content is not None:
+            content = self._pending_content
+        else:
+            content = self.content_edit.toPlainText()
         return {
             "title": self.title_edit.text().strip(),
-            "content": self.content_edit.toPlainText(),
+            "content": content,
             "category": self.category_combo.currentText(),
             "source_url": self.summary.get("source_url", ""),
         }
 
 
 # ===================================================================
-# SearchResultRow — checkbox + info for a single search result
+# SearchResultModel / SearchResultDelegate — virtualized result list
 # ===================================================================
 
-class SearchResultRow(QFrame):
-    """A checkbox row for a search result."""
+def _is_checked(value) -> bool:
+    """Return True if a CheckStateRole value means "checked"."""
+    return value in (Qt.CheckState.Checked, Qt.CheckState.Checked.value)
 
-    def __init__(self, index: int, result: SearchResult, parent=None):
+
+class SearchResultModel(QAbstractListModel):
+    """List model over search results with a per-row check state."""
+
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.index = index
-        self.result = result
-        self.setFrameShape(QFrame.Shape.NoFrame)
-        self.setStyleSheet(
-            f"QFrame {{ border-bottom: 1px solid #444444; padding: 4px 0; }}"
+        self._results: list[SearchResult] = []
+        self._checked: set[int] = set()
+
+    # -- Qt model API --------------------------------------------------
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._results)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._results[row].title
+        if role == Qt.ItemDataRole.CheckStateRole:
+            if row in self._checked:
+                return Qt.CheckState.Checked
+            return Qt.CheckState.Unchecked
+        if role == Qt.ItemDataRole.UserRole:
+            return self._results[row]
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid() or role != Qt.ItemDataRole.CheckStateRole:
+            return False
+        if _is_checked(value):
+            self._checked.add(index.row())
+        else:
+            self._checked.discard(index.row())
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return (
+            Qt.ItemFlag.ItemIsEnabled
+            | Qt.ItemFlag.ItemIsSelectable
+            | Qt.ItemFlag.ItemIsUserCheckable
         )
-        self._build_ui()
 
-    def _build_ui(self):
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(4, 4, 4, 4)
-        layout.setSpacing(2)
-
-        self.checkbox = QCheckBox(self.result.title)
-        self.checkbox.setStyleSheet(f"font-weight: bold; font-size: 13px;")
-        layout.addWidget(self.checkbox)
-
-        snippet = QLabel(self.result.snippet[:200])
-        snippet.setWordWrap(True)
-        snippet.setStyleSheet(f"color: {Theme.TEXT}; font-size: 12px; padding-left: 26px;")
-        layout.addWidget(snippet)
-
-        url_label = QLabel(self.result.url)
-        url_label.setWordWrap(True)
-        url_label.setStyleSheet(
-            f"color: {Theme.DIMMED}; font-size: 11px; padding-left: 26px;"
+    # -- Helpers -------------------------------------------------------
+
+    def set_results(self, results: list[SearchResult]):
+        """Replace all rows and clear the check state."""
+        self.beginResetModel()
+        self._results = list(results)
+        self._checked.clear()
+        self.endResetModel()
+
+    def clear(self):
+        self.set_results([])
+
+    def set_all_checked(self, checked: bool):
+        """Check or uncheck every row with a single dataChanged."""
+        if not self._results:
+            return
+        if checked:
+            self._checked = set(range(len(self._results)))
+        else:
+            self._checked.clear()
+        self.dataChanged.emit(
+            self.index(0),
+            self.index(len(self._results) - 1),
+            [Qt.ItemDataRole.CheckStateRole],
         )
-        layout.addWidget(url_label)
+
+    def checked_rows(self) -> list[int]:
+        """Return the checked row numbers in ascending order."""
+        return sorted(self._checked)
+
+
+class SearchResultDelegate(QStyledItemDelegate):
+    """Paints a search result as checkbox + bold title, snippet, and URL.
+
+    Only rows scrolled into view are painted, so large result sets cost
+    no more than the handful of rows on screen.
+    """
+
+    _PAD = 6
+    _INDENT = 26
+    _SPACING = 2
+    _WRAP = Qt.TextFlag.TextWordWrap | Qt.AlignmentFlag.AlignLeft
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._title_font = QFont()
+        self._title_font.setPixelSize(13)
+        self._title_font.setBold(True)
+        self._snippet_font = QFont()
+        self._snippet_font.setPixelSize(12)
+        self._url_font = QFont()
+        self._url_font.setPixelSize(11)
+        # Built once and reused for every row painted.
+        self._title_metrics = QFontMetrics(self._title_font)
+        self._snippet_metrics = QFontMetrics(self._snippet_font)
+        self._url_metrics = QFontMetrics(self._url_font)
+        self._text_color = QColor(Theme.TEXT)
+        self._dimmed_color = QColor(Theme.DIMMED)
+        self._separator_color = QColor("#444444")
+
+    def _blocks(self, result: SearchResult):
+        """Yield (font, metrics, color, text) for each text block of a row."""
+        yield self._title_font, self._title_metrics, self._text_color, result.title
+        yield (self._snippet_font, self._snippet_metrics, self._text_color,
+               result.snippet_short)
+        yield self._url_font, self._url_metrics, self._dimmed_color, result.url
+
+    def _text_width(self, option) -> int:
+        width = option.rect.width()
+        view = self.parent()
+        if width <= 0 and view is not None:
+            width = view.viewport().width()
+        return max(width - self._INDENT - 2 * self._PAD, 50)
+
+    def sizeHint(self, option, index):
+        result = index.data(Qt.ItemDataRole.UserRole)
+        if result is None:
+            return super().sizeHint(option, index)
+        width = self._text_width(option)
+        height = 2 * self._PAD
+        for _, metrics, _, text in self._blocks(result):
+            bounds = metrics.boundingRect(
+                QRect(0, 0, width, 100000), self._WRAP, text
+            )
+            height += bounds.height() + self._SPACING
+        return QSize(width, height)
+
+    def paint(self, painter, option, index):
+        result = index.data(Qt.ItemDataRole.UserRole)
+        if result is None:
+            return
+        rect = option.rect
+        painter.save()
+
+        # Row separator
+        painter.setPen(self._separator_color)
+        painter.drawLine(rect.bottomLeft(), rect.bottomRight())
+
+        # Check indicator
+        check_opt = QStyleOptionViewItem(option)
+        check_opt.rect = QRect(rect.left() + self._PAD, rect.top() + self._PAD, 16, 16)
+        check_opt.state &= ~(QStyle.StateFlag.State_On | QStyle.StateFlag.State_Off)
+        if _is_checked(index.data(Qt.ItemDataRole.CheckStateRole)):
+            check_opt.state |= QStyle.StateFlag.State_On
+        else:
+            check_opt.state |= QStyle.StateFlag.State_Off
+        widget = option.widget
+        style = widget.style() if widget is not None else QApplication.style()
+        style.drawPrimitive(
+            QStyle.PrimitiveElement.PE_IndicatorItemViewItemCheck,
+            check_opt, painter, widget,
+        )
+
+        # Title, snippet, URL
+        left = rect.left() + self._PAD + self._INDENT
+        top = rect.top() + self._PAD
+        width = rect.width() - self._INDENT - 2 * self._PAD
+        for font, metrics, color, text in self._blocks(result):
+            painter.setFont(font)
+            painter.setPen(color)
+            bounds = metrics.boundingRect(
+                QRect(0, 0, width, 100000), self._WRAP, text
+            )
+            painter.drawText(
+                QRect(left, top, width, bounds.height()), self._WRAP, text
+            )
+            top += bounds.height() + self._SPACING
+
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        """Toggle the check state on click or Space."""
+        toggle = (
+            event.type() == QEvent.Type.MouseButtonRelease
+            and event.button() == Qt.MouseButton.LeftButton
+        ) or (
+            event.type() == QEvent.Type.KeyPress
+            and event.key() in (Qt.Key.Key_Space, Qt.Key.Key_Select)
+        )
+        if not toggle:
+            return False
+        checked = _is_checked(index.data(Qt.ItemDataRole.CheckStateRole))
+        new_state = Qt.CheckState.Unchecked if checked else Qt.CheckState.Checked
+        return model.setData(index, new_state, Qt.ItemDataRole.CheckStateRole)
 
 
 # ===================================================================
@@ -355,10 +780,19 @@ class LoreDiscoveryTab(BaseTab):
     """Web research tab for discovering and importing lore."""
 
     def __init__(self, db, parent=None):
+        # One pool for every search/summarize job run from this tab, so
+        # repeated searches reuse threads instead of spawning new ones.
+        self._pool = QThreadPool()
+        self._pool.setMaxThreadCount(min(8, (os.cpu_count() or 1) * 2))
         self._search_worker = None
         self._summarize_worker = None
-        self._result_rows: list[SearchResultRow] = []
+        # Bumped whenever a job is started or abandoned; signals carrying
+        # an older generation are ignored.
+        self._search_gen = 0
+        self._summarize_gen = 0
         self._summary_cards: list[SummaryCard] = []
+        # Index -> card still receiving streamed text.
+        self._streaming_cards: dict[int, SummaryCard] = {}
         self._search_results: list[SearchResult] = []
         super().__init__(db, parent)
 
@@ -367,7 +801,9 @@ class LoreDiscoveryTab(BaseTab):
     # ------------------------------------------------------------------
 
     def _init_ui(self):
-        self.setStyleSheet(_STYLESHEET)
+        # Styling comes from the application stylesheet, scoped by this
+        # property (see Theme.global_stylesheet()).
+        self.setProperty("class", "loreDiscovery")
         root = QVBoxLayout(self)
         root.setContentsMargins(8, 8, 8, 8)
         root.setSpacing(6)
@@ -408,15 +844,16 @@ class LoreDiscoveryTab(BaseTab):
         results_label.setObjectName("sectionLabel")
         left_layout.addWidget(results_label)
 
-        self._results_scroll = QScrollArea()
-        self._results_scroll.setWidgetResizable(True)
-        self._results_inner = QWidget()
-        self._results_layout = QVBoxLayout(self._results_inner)
-        self._results_layout.setContentsMargins(6, 6, 6, 6)
-        self._results_layout.setSpacing(4)
-        self._results_layout.addStretch()
-        self._results_scroll.setWidget(self._results_inner)
-        left_layout.addWidget(self._results_scroll, stretch=1)
+        self._results_model = SearchResultModel(self)
+        self._results_view = QListView()
+        self._results_view.setModel(self._results_model)
+        self._results_view.setItemDelegate(SearchResultDelegate(self._results_view))
+        self._results_view.setSelectionMode(QListView.SelectionMode.NoSelection)
+        self._results_view.setResizeMode(QListView.ResizeMode.Adjust)
+        self._results_view.setVerticalScrollMode(
+            QListView.ScrollMode.ScrollPerPixel
+        )
+        left_layout.addWidget(self._results_view, stretch=1)
 
         splitter.addWidget(left_widget)
 
@@ -436,10 +873,29 @@ class LoreDiscoveryTab(BaseTab):
         self._summary_layout = QVBoxLayout(self._summary_inner)
         self._summary_layout.setContentsMargins(6, 6, 6, 6)
         self._summary_layout.setSpacing(8)
-        self._summary_layout.addStretch()
+        # Fixed bottom spacer: new cards are inserted above it, so the
+        # layout never has to take and re-add a stretch item.
+        self._summary_spacer = QWidget()
+        self._summary_spacer.setSizePolicy(
+            QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding
+        )
+        self._summary_layout.addWidget(self._summary_spacer)
         self._summary_scroll.setWidget(self._summary_inner)
         right_layout.addWidget(self._summary_scroll, stretch=1)
 
+        # Fill in card text lazily as cards scroll into view.  The short
+        # delay lets a burst of new cards be laid out before checking.
+        self._hydrate_timer = QTimer(self)
+        self._hydrate_timer.setSingleShot(True)
+        self._hydrate_timer.setInterval(50)
+
+        # Coalesces rapid Search clicks / Enter presses into one search.
+        self._search_debounce = QTimer(self)
+        self._search_debounce.setSingleShot(True)
+        self._search_debounce.setInterval(
+            int(get_timeout(self.db, "search_debounce_ms"))
+        )
+
         # Add All to Lore button
         self.add_all_btn = QPushButton("Add All to Lore")
         self.add_all_btn.setEnabled(False)
@@ -485,10 +941,15 @@ class LoreDiscoveryTab(BaseTab):
     def _connect_signals(self):
         self.search_btn.clicked.connect(self._on_search)
         self.search_input.returnPressed.connect(self._on_search)
+        self._search_debounce.timeout.connect(self._do_search)
         self.select_all_btn.clicked.connect(self._select_all)
         self.deselect_all_btn.clicked.connect(self._deselect_all)
         self.summarize_btn.clicked.connect(self._on_summarize)
         self.add_all_btn.clicked.connect(self._add_all_to_lore)
+        self._hydrate_timer.timeout.connect(self._hydrate_visible_cards)
+        scrollbar = self._summary_scroll.verticalScrollBar()
+        scrollbar.valueChanged.connect(self._schedule_hydrate)
+        scrollbar.rangeChanged.connect(self._schedule_hydrate)
 
     # ------------------------------------------------------------------
     # Refresh
@@ -500,15 +961,36 @@ class LoreDiscoveryTab(BaseTab):
         self._clear_summaries()
         self.status_label.setText("Status: Idle")
 
+    def cleanup(self) -> None:
+        """Abandon in-flight jobs and wait briefly for the pool to drain."""
+        super().cleanup()
+        self._search_debounce.stop()
+        self._search_gen += 1
+        self._summarize_gen += 1
+        if self._search_worker is not None:
+            self._search_worker.request_stop()
+        if self._summarize_worker is not None:
+            self._summarize_worker.request_stop()
+        self._pool.waitForDone(3000)
+
     # ------------------------------------------------------------------
     # Search
     # ------------------------------------------------------------------
 
     def _on_search(self):
+        """Start (or restart) the debounce timer for a search."""
+        self._search_debounce.start()
+
+    def _do_search(self):
         query = self.search_input.text().strip()
         if not query:
             return
 
+        # Abandon any search still in flight
+        if self._search_worker is not None:
+            self._search_worker.request_stop()
+            self._search_worker = None
+
         # Disable search button while running
         self.search_btn.setEnabled(False)
         self.search_btn.setText("Searching...")
@@ -517,13 +999,27 @@ class LoreDiscoveryTab(BaseTab):
         # Clear previous results
         self._clear_results()
 
-        self._search_worker = SearchWorker(query, parent=self)
-        self.register_worker(self._search_worker)
-        self._search_worker.results_ready.connect(self._on_search_results)
-        self._search_worker.error.connect(self._on_search_error)
-        self._search_worker.start()
+        self._search_gen += 1
+
+        cached = self.db.get_search_cache(
+            query, _SEARCH_MAX_RESULTS, _SEARCH_CACHE_TTL_S
+        )
+        if cached is not None:
+            self._on_search_results(
+                self._search_gen, [SearchResult(**r) for r in cached]
+            )
+            return
+
+        self._search_worker = SearchWorker(
+            query, self._search_gen, db_path=str(self.db._db_path)
+        )
+        self._search_worker.signals.results_ready.connect(self._on_search_results)
+        self._search_worker.signals.error.connect(self._on_search_error)
+        self._pool.start(self._search_worker)
 
-    def _on_search_results(self, results: list):
+    def _on_search_results(self, gen: int, results: list):
+        if gen != self._search_gen:
+            return
         self.search_btn.setEnabled(True)
         self.search_btn.setText("Search")
 
@@ -533,16 +1029,7 @@ class LoreDiscoveryTab(BaseTab):
             self.status_label.setText("Status: No results found")
             return
 
-        # Remove the stretch from results layout
-        stretch_item = self._results_layout.takeAt(self._results_layout.count() - 1)
-
-        for i, result in enumerate(results):
-            row = SearchResultRow(i, result)
-            self._result_rows.append(row)
-            self._results_layout.addWidget(row)
-
-        # Re-add stretch at end
-        self._results_layout.addStretch()
+        self._results_model.set_results(results)
 
         # Enable selection buttons
         self.select_all_btn.setEnabled(True)
@@ -551,7 +1038,9 @@ class LoreDiscoveryTab(BaseTab):
 
         self.status_label.setText(f"Status: {len(results)} results found")
 
-    def _on_search_error(self, error_msg: str):
+    def _on_search_error(self, gen: int, error_msg: str):
+        if gen != self._search_gen:
+            return
         self.search_btn.setEnabled(True)
         self.search_btn.setText("Search")
         self.status_label.setText("Status: Search failed")
@@ -563,20 +1052,17 @@ class LoreDiscoveryTab(BaseTab):
     # ------------------------------------------------------------------
 
     def _select_all(self):
-        for row in self._result_rows:
-            row.checkbox.setChecked(True)
+        self._results_model.set_all_checked(True)
 
     def _deselect_all(self):
-        for row in self._result_rows:
-            row.checkbox.setChecked(False)
+        self._results_model.set_all_checked(False)
 
     def _get_selected(self) -> list[tuple[int, SearchResult]]:
         """Return (index, SearchResult) for every checked row."""
-        selected = []
-        for row in self._result_rows:
-            if row.checkbox.isChecked():
-                selected.append((row.index, row.result))
-        return selected
+        return [
+            (i, self._search_results[i])
+            for i in self._results_model.checked_rows()
+        ]
 
     # ------------------------------------------------------------------
     # Summarize
@@ -608,51 +1094,115 @@ class LoreDiscoveryTab(BaseTab):
 
         category = self.category_combo.currentText()
 
+        self._summarize_gen += 1
         self._summarize_worker = SummarizeWorker(
             api_key=api_key,
             items=selected,
+            generation=self._summarize_gen,
             category=category,
-            parent=self,
+            db_path=str(self.db._db_path),
         )
-        self.register_worker(self._summarize_worker)
-        self._summarize_worker.progress.connect(self._on_summarize_progress)
-        self._summarize_worker.item_complete.connect(self._on_item_complete)
-        self._summarize_worker.item_error.connect(self._on_item_error)
-        self._summarize_worker.all_complete.connect(self._on_all_complete)
-        self._summarize_worker.start()
-
-    def _on_summarize_progress(self, msg: str):
+        signals = self._summarize_worker.signals
+        signals.progress.connect(self._on_summarize_progress)
+        signals.item_started.connect(self._on_item_started)
+        signals.chunk_received.connect(self._on_chunk_received)
+        signals.item_complete.connect(self._on_item_complete)
+        signals.item_error.connect(self._on_item_error)
+        signals.all_complete.connect(self._on_all_complete)
+        self._pool.start(self._summarize_worker)
+
+    def _on_summarize_progress(self, gen: int, msg: str):
+        if gen != self._summarize_gen:
+            return
         self.status_label.setText(f"Status: {msg}")
 
-    def _on_item_complete(self, index: int, summary: dict):
-        # Remove stretch, add card, re-add stretch
-        if self._summary_layout.count() > 0:
-            self._summary_layout.takeAt(self._summary_layout.count() - 1)
-
+    def _add_summary_card(self, summary: dict) -> SummaryCard:
         card = SummaryCard(summary)
         card.add_btn.clicked.connect(lambda checked, c=card: self._add_card_to_lore(c))
         self._summary_cards.append(card)
-        self._summary_layout.addWidget(card)
-        self._summary_layout.addStretch()
+        self._insert_summary_widget(card)
+        self._schedule_hydrate()
+        return card
+
+    def _on_item_started(self, gen: int, index: int):
+        """Show an empty card that fills in as the summary streams."""
+        if gen != self._summarize_gen:
+            return
+        if not 0 <= index < len(self._search_results):
+            return
+        result = self._search_results[index]
+        card = self._add_summary_card({
+            "title": result.title,
+            "content": "",
+            "category": self.category_combo.currentText(),
+            "source_url": result.url,
+        })
+        card.add_btn.setEnabled(False)
+        self._streaming_cards[index] = card
+
+    def _on_chunk_received(self, gen: int, index: int, text: str):
+        if gen != self._summarize_gen:
+            return
+        card = self._streaming_cards.get(index)
+        if card is not None:
+            card.append_text(text)
+
+    def _on_item_complete(self, gen: int, index: int, summary: dict):
+        if gen != self._summarize_gen:
+            return
+        card = self._streaming_cards.pop(index, None)
+        if card is not None:
+            card.finalize(summary)
+        else:
+            self._add_summary_card(summary)
 
         self.add_all_btn.setEnabled(True)
 
-    def _on_item_error(self, index: int, error_msg: str):
-        # Show error inline as a label
-        if self._summary_layout.count() > 0:
-            self._summary_layout.takeAt(self._summary_layout.count() - 1)
+    def _on_item_error(self, gen: int, index: int, error_msg: str):
+        if gen != self._summarize_gen:
+            return
+        # Drop any partially streamed card for this item.
+        card = self._streaming_cards.pop(index, None)
+        if card is not None:
+            self._summary_cards.remove(card)
+            self._summary_layout.removeWidget(card)
+            card.deleteLater()
 
+        # Show error inline as a label
         title = ""
         if 0 <= index < len(self._search_results):
             title = self._search_results[index].title
 
         err_label = QLabel(f"Failed to summarize \"{title}\": {error_msg}")
         err_label.setWordWrap(True)
-        err_label.setStyleSheet(f"color: {Theme.ERROR}; font-size: 12px; padding: 8px;")
-        self._summary_layout.addWidget(err_label)
-        self._summary_layout.addStretch()
+        err_label.setStyleSheet(_ERROR_LABEL_QSS)
+        self._insert_summary_widget(err_label)
+
+    def _schedule_hydrate(self, *_args):
+        """(Re)start the short timer that hydrates visible summary cards."""
+        self._hydrate_timer.start()
+
+    def _hydrate_visible_cards(self):
+        """Populate the text of every card currently inside the viewport."""
+        for card in self._summary_cards:
+            if card.is_hydrated() or not card.isVisible():
+                continue
+            if not card.visibleRegion().isEmpty():
+                card.hydrate()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._schedule_hydrate()
+
+    def _insert_summary_widget(self, widget: QWidget):
+        """Append *widget* to the summary panel, just above the spacer."""
+        self._summary_layout.insertWidget(
+            self._summary_layout.indexOf(self._summary_spacer), widget
+        )
 
-    def _on_all_complete(self):
+    def _on_all_complete(self, gen: int):
+        if gen != self._summarize_gen:
+            return
         self.summarize_btn.setEnabled(True)
         self.summarize_btn.setText("Summarize Selected")
         self.search_btn.setEnabled(True)
@@ -683,23 +1233,28 @@ class LoreDiscoveryTab(BaseTab):
 
     def _add_all_to_lore(self):
         """Save all summary cards to the lore database."""
-        added = 0
+        rows = []
+        added_cards = []
         for card in self._summary_cards:
             if not card.add_btn.isEnabled():
                 continue  # already added
             data = card.get_data()
             if not data["title"].strip() or not data["content"].strip():
                 continue
-
-            self.db.add_lore(
-                title=data["title"],
-                content=data["content"],
-                category=data["category"],
-                active=True,
-            )
+            rows.append({
+                "title": data["title"],
+                "content": data["content"],
+                "category": data["category"],
+                "active": True,
+            })
+            added_cards.append(card)
+
+        # One transaction for the whole set instead of a commit per entry.
+        added = self.db.add_lore_bulk(rows)
+
+        for card in added_cards:
             card.add_btn.setText("Added!")
             card.add_btn.setEnabled(False)
-            added += 1
 
         if added > 0:
             self.status_label.setText(f"Status: Added {added} entries to lore")
@@ -712,16 +1267,8 @@ class LoreDiscoveryTab(BaseTab):
 
     def _clear_results(self):
         """Remove all search result rows."""
-        self._result_rows.clear()
-        self._search_results.clear()
-
-        while self._results_layout.count():
-            item = self._results_layout.takeAt(0)
-            w = item.widget()
-            if w:
-                w.deleteLater()
-
-        self._results_layout.addStretch()
+        self._search_results = []
+        self._results_model.clear()
 
         self.select_all_btn.setEnabled(False)
         self.deselect_all_btn.setEnabled(False)
@@ -730,12 +1277,13 @@ class LoreDiscoveryTab(BaseTab):
     def _clear_summaries(self):
         """Remove all summary cards."""
         self._summary_cards.clear()
+        self._streaming_cards.clear()
 
-        while self._summary_layout.count():
+        # Remove everything above the bottom spacer.
+        while self._summary_layout.count() > 1:
             item = self._summary_layout.takeAt(0)
             w = item.widget()
             if w:
                 w.deleteLater()
 
-        self._summary_layout.addStretch()
         self.add_all_btn.setEnabled(False)
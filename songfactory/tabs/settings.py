@@ -8,6 +8,7 @@ config table via the shared Database instance.
 
 from PyQt6.QtWidgets import (
     QWidget,
+    QDialog,
     QVBoxLayout,
     QHBoxLayout,
     QFormLayout,
@@ -22,103 +23,226 @@ from PyQt6.QtWidgets import (
     QInputDialog,
     QMessageBox,
     QScrollArea,
+    QTextBrowser,
 )
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QTimer, QThread, QUrl, pyqtSignal
+from PyQt6.QtGui import QDesktopServices
+from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest
+from datetime import datetime
+import functools
+import logging
 import os
 
 from tabs.base_tab import BaseTab
+from database import Database
+from platform_utils import supports_xvfb
 from theme import Theme
+from timeouts import invalidate_timeout_cache
 from secure_config import get_secret, set_secret, SENSITIVE_KEYS
 from ai_models import get_model_choices, DEFAULT_MODEL
 from event_bus import event_bus
+from widgets.status_badge import StatusBadge
 
+logger = logging.getLogger("songfactory.sync")
 
-_STYLESHEET = f"""
-    QWidget {{
-        background-color: {Theme.BG};
-        color: {Theme.TEXT};
-    }}
-
-    QGroupBox {{
-        background-color: {Theme.PANEL};
-        border: 1px solid #555555;
-        border-radius: 6px;
-        margin-top: 14px;
-        padding: 16px 12px 12px 12px;
-        font-weight: bold;
-        font-size: 13px;
-        color: {Theme.ACCENT};
-    }}
-    QGroupBox::title {{
-        subcontrol-origin: margin;
-        subcontrol-position: top left;
-        padding: 2px 10px;
-        color: {Theme.ACCENT};
-    }}
-
-    QLineEdit, QComboBox, QSpinBox {{
-        background-color: {Theme.BG};
-        color: {Theme.TEXT};
-        border: 1px solid #555555;
-        border-radius: 4px;
-        padding: 6px 8px;
-        font-size: 13px;
-        min-height: 24px;
-    }}
-    QLineEdit:focus, QComboBox:focus, QSpinBox:focus {{
-        border-color: {Theme.ACCENT};
-    }}
-
-    QComboBox::drop-down {{
-        border: none;
-    }}
-    QComboBox QAbstractItemView {{
-        background-color: {Theme.PANEL};
-        color: {Theme.TEXT};
-        selection-background-color: {Theme.ACCENT};
-        selection-color: #1e1e1e;
-    }}
-
-    QLabel {{
-        color: {Theme.TEXT};
-        font-size: 13px;
-    }}
-
-    QPushButton {{
-        background-color: #444444;
-        color: {Theme.TEXT};
-        border: 1px solid #666666;
-        border-radius: 4px;
-        padding: 6px 16px;
-        font-size: 13px;
-    }}
-    QPushButton:hover {{
-        background-color: #555555;
-    }}
-    QPushButton:pressed {{
-        background-color: #333333;
-    }}
-
-    QPushButton#saveButton {{
-        background-color: {Theme.ACCENT};
-        color: #1a1a1a;
-        border: none;
-        border-radius: 6px;
-        padding: 10px 28px;
-        font-weight: bold;
-        font-size: 14px;
-    }}
-    QPushButton#saveButton:hover {{
-        background-color: #f0b848;
-    }}
-    QPushButton#saveButton:pressed {{
-        background-color: #d09828;
-    }}
-"""
 
 # Default download directory
 _DEFAULT_DOWNLOAD_DIR = os.path.join(os.path.expanduser("~"), "Music", "SongFactory")
 
+# Diagnostic output locations
+_SNIFFER_LOG = os.path.expanduser("~/.songfactory/network_sniffer.log")
+_AUTOMATION_LOG = os.path.expanduser("~/.songfactory/automation.log")
+_SCREENSHOTS_DIR = os.path.expanduser("~/.songfactory/screenshots")
+
+
+# ------------------------------------------------------------------
+# Form builders
+# ------------------------------------------------------------------
+
+def _make_form() -> QFormLayout:
+    """Return a form layout with the tab's standard spacing and alignment."""
+    form = QFormLayout()
+    form.setSpacing(10)
+    form.setLabelAlignment(Qt.AlignmentFlag.AlignRight)
+    return form
+
+
+def _make_line_edit(placeholder: str = "", password: bool = False) -> QLineEdit:
+    """Return a line edit with an optional placeholder and password echo."""
+    edit = QLineEdit()
+    if password:
+        edit.setEchoMode(QLineEdit.EchoMode.Password)
+    if placeholder:
+        edit.setPlaceholderText(placeholder)
+    return edit
+
+
+# ------------------------------------------------------------------
+# Connection tests
+# ------------------------------------------------------------------
+
+# These modules pull in heavy SDKs, so they are imported on first use
+# rather than with the tab; the cache then skips the import machinery
+# on later clicks.
+
+@functools.cache
+def _song_generator_cls():
+    from api_client import SongGenerator
+    return SongGenerator
+
+
+@functools.cache
+def _segmind_generator_cls():
+    from automation.image_generator import SegmindImageGenerator
+    return SegmindImageGenerator
+
+
+@functools.cache
+def _network_sniffer_cls():
+    from automation.network_sniffer import NetworkSniffer
+    return NetworkSniffer
+
+
+def _probe_anthropic(api_key: str, model: str) -> tuple[str, str, str]:
+    """Return ``(level, title, message)`` for an Anthropic key test."""
+    try:
+        generator = _song_generator_cls()(api_key=api_key, model=model)
+        if generator.test_connection():
+            return (
+                "info", "Connection Successful",
+                "Successfully connected to the Anthropic API.\n\n"
+                f"Model: {model}",
+            )
+        return (
+            "critical", "Connection Failed",
+            "Could not connect to the Anthropic API.\n\n"
+            "Please check your API key and try again.",
+        )
+    except Exception as exc:
+        return (
+            "critical", "Connection Error",
+            f"An error occurred while testing the connection:\n\n{exc}",
+        )
+
+
+def _probe_segmind(api_key: str) -> tuple[str, str, str]:
+    """Return ``(level, title, message)`` for a Segmind key test."""
+    try:
+        gen = _segmind_generator_cls()(api_key=api_key)
+        if gen.test_connection():
+            return (
+                "info", "Connection Successful",
+                "Successfully connected to the Segmind API.\n\n"
+                "Cover art generation is ready to use.",
+            )
+        return (
+            "critical", "Connection Failed",
+            "Could not connect to the Segmind API.\n\n"
+            "Please check your API key and try again.",
+        )
+    except Exception as exc:
+        return (
+            "critical", "Connection Error",
+            f"Error testing Segmind connection:\n\n{exc}",
+        )
+
+
+_MUSICGPT_PROBE_URL = (
+    "https://api.musicgpt.com/api/public/v1/byId"
+    "?conversionType=MUSIC_AI&task_id=test-connection-probe"
+)
+
+
+def _musicgpt_result(status: int | None, error: str = "") -> tuple[str, str, str]:
+    """Return ``(level, title, message)`` for a MusicGPT key test reply.
+
+    *status* is the HTTP status code, or None if no response arrived (in
+    which case *error* describes the failure).  A 401/403 means invalid
+    key; a 404 (task not found) means valid key.
+    """
+    if status is None:
+        return (
+            "critical", "Connection Error",
+            f"Error testing MusicGPT connection:\n\n{error}",
+        )
+    if 200 <= status < 300:
+        # 2xx = valid key (unlikely for a fake task_id, but fine)
+        return "info", "Connection Successful", "MusicGPT API key is valid."
+    if status in (401, 403):
+        return (
+            "critical", "Invalid Key",
+            f"MusicGPT API returned HTTP {status}.\n\n"
+            "The API key appears to be invalid or expired.",
+        )
+    if status == 404:
+        # 404 = task not found but auth accepted
+        return (
+            "info", "Connection Successful",
+            "MusicGPT API key is valid.\n\n"
+            "(Test task not found — this is expected.)",
+        )
+    return (
+        "warning", "Unexpected Response",
+        f"MusicGPT API returned HTTP {status}.\n\n"
+        "The key may be valid but the API returned an "
+        "unexpected status.",
+    )
+
+
+class _ConnectionTestWorker(QThread):
+    """Runs a connection probe off the GUI thread."""
+
+    result = pyqtSignal(str, str, str)  # (level, title, message)
+
+    def __init__(self, probe, parent=None):
+        super().__init__(parent)
+        self._probe = probe
+
+    def run(self):
+        self.result.emit(*self._probe())
+
+
+class _SnifferWorker(QThread):
+    """Runs the network sniffer, reporting failures via ``error``."""
+
+    error = pyqtSignal(str)
+
+    def __init__(self, duration_s: int, parent=None):
+        super().__init__(parent)
+        self._duration_s = duration_s
+
+    def run(self):
+        try:
+            _network_sniffer_cls()().start(duration_s=self._duration_s)
+        except Exception as exc:
+            self.error.emit(str(exc))
+
+
+class _BackupWorker(QThread):
+    """Writes a database backup through its own connection."""
+
+    done = pyqtSignal(str)  # backup file path
+    failed = pyqtSignal(str)
+
+    def __init__(self, db_path: str, directory: str, parent=None):
+        super().__init__(parent)
+        self._db_path = db_path
+        self._directory = directory
+
+    def run(self):
+        try:
+            # The live database is already migrated; copying it must not
+            # write to it from this thread
+            db = Database(db_path=self._db_path, assume_migrated=True)
+            try:
+                path = db.backup_to(self._directory)
+            finally:
+                db.close()
+        except Exception as exc:
+            self.failed.emit(str(exc))
+            return
+        self.done.emit(path)
+
 
 class SettingsTab(BaseTab):
     """Application settings panel with grouped form fields."""
@@ -126,9 +250,14 @@ class SettingsTab(BaseTab):
     def __init__(self, db, parent=None):
         # Instance variables needed before _init_ui runs
         self._sniffer_thread = None
+        self._sniffer_error = None
         self._diag_thread = None
         self._diag_report = None
         self._auto_export_timer = None
+        self._deferred_built = False
+        self._nam = None
+        # File dialogs are built on first use and reused afterwards
+        self._file_dialogs = {}
         super().__init__(db, parent)
 
     # ------------------------------------------------------------------
@@ -137,14 +266,18 @@ class SettingsTab(BaseTab):
 
     def _init_ui(self):
         """Assemble the full settings layout inside a scroll area."""
-        self.setStyleSheet(_STYLESHEET)
+        # Styling comes from the application stylesheet, scoped by this
+        # property (see Theme.global_stylesheet()).
+        self.setProperty("class", "settings")
         outer = QVBoxLayout(self)
         outer.setContentsMargins(0, 0, 0, 0)
 
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setFrameShape(QScrollArea.Shape.NoFrame)
-        scroll.setStyleSheet("QScrollArea { border: none; }")
+        # The groups are laid out to the viewport width (the main window is
+        # at least 1200px wide), so only vertical overflow is possible.
+        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
 
         scroll_content = QWidget()
         root = QVBoxLayout(scroll_content)
@@ -153,27 +286,13 @@ class SettingsTab(BaseTab):
 
         # ---- API Settings group ----
         api_group = QGroupBox("API Settings")
-        api_form = QFormLayout()
-        api_form.setSpacing(10)
-        api_form.setLabelAlignment(Qt.AlignmentFlag.AlignRight)
+        api_form = _make_form()
 
         # Anthropic API Key
-        api_key_row = QHBoxLayout()
-        self.api_key_edit = QLineEdit()
-        self.api_key_edit.setEchoMode(QLineEdit.EchoMode.Password)
-        self.api_key_edit.setPlaceholderText("sk-ant-...")
-        self.api_key_edit.setMinimumWidth(300)
-        api_key_row.addWidget(self.api_key_edit, 1)
-
-        self.toggle_key_btn = QPushButton("Show")
-        self.toggle_key_btn.setFixedWidth(60)
-        self.toggle_key_btn.clicked.connect(self.toggle_api_key_visibility)
-        api_key_row.addWidget(self.toggle_key_btn)
-
-        self.test_conn_btn = QPushButton("Test Connection")
-        self.test_conn_btn.clicked.connect(self.test_connection)
-        api_key_row.addWidget(self.test_conn_btn)
-
+        (api_key_row, self.api_key_edit, self.toggle_key_btn,
+         self.test_conn_btn) = self._make_key_row(
+            "sk-ant-...", "Test Connection", self.test_connection
+        )
         api_form.addRow("Anthropic API Key:", api_key_row)
 
         # Default AI Model
@@ -183,22 +302,11 @@ class SettingsTab(BaseTab):
         api_form.addRow("Default AI Model:", self.model_combo)
 
         # Segmind API Key
-        segmind_key_row = QHBoxLayout()
-        self.segmind_key_edit = QLineEdit()
-        self.segmind_key_edit.setEchoMode(QLineEdit.EchoMode.Password)
-        self.segmind_key_edit.setPlaceholderText("Segmind API key for cover art generation...")
-        self.segmind_key_edit.setMinimumWidth(300)
-        segmind_key_row.addWidget(self.segmind_key_edit, 1)
-
-        self.toggle_segmind_key_btn = QPushButton("Show")
-        self.toggle_segmind_key_btn.setFixedWidth(60)
-        self.toggle_segmind_key_btn.clicked.connect(self._toggle_segmind_key_visibility)
-        segmind_key_row.addWidget(self.toggle_segmind_key_btn)
-
-        self.test_segmind_btn = QPushButton("Test Segmind")
-        self.test_segmind_btn.clicked.connect(self._test_segmind_connection)
-        segmind_key_row.addWidget(self.test_segmind_btn)
-
+        (segmind_key_row, self.segmind_key_edit, self.toggle_segmind_key_btn,
+         self.test_segmind_btn) = self._make_key_row(
+            "Segmind API key for cover art generation...",
+            "Test Segmind", self._test_segmind_connection,
+        )
         api_form.addRow("Segmind API Key:", segmind_key_row)
 
         api_group.setLayout(api_form)
@@ -206,9 +314,7 @@ class SettingsTab(BaseTab):
 
         # ---- Song Submission group ----
         submission_group = QGroupBox("Song Submission")
-        submission_form = QFormLayout()
-        submission_form.setSpacing(10)
-        submission_form.setLabelAlignment(Qt.AlignmentFlag.AlignRight)
+        submission_form = _make_form()
 
         # Submission mode combo
         self.submission_mode_combo = QComboBox()
@@ -220,31 +326,15 @@ class SettingsTab(BaseTab):
         submission_form.addRow("Submission Mode:", self.submission_mode_combo)
 
         # MusicGPT API Key
-        musicgpt_key_row = QHBoxLayout()
-        self.musicgpt_key_edit = QLineEdit()
-        self.musicgpt_key_edit.setEchoMode(QLineEdit.EchoMode.Password)
-        self.musicgpt_key_edit.setPlaceholderText("MusicGPT API key...")
-        self.musicgpt_key_edit.setMinimumWidth(300)
-        musicgpt_key_row.addWidget(self.musicgpt_key_edit, 1)
-
-        self.toggle_musicgpt_key_btn = QPushButton("Show")
-        self.toggle_musicgpt_key_btn.setFixedWidth(60)
-        self.toggle_musicgpt_key_btn.clicked.connect(
-            self._toggle_musicgpt_key_visibility
+        (musicgpt_key_row, self.musicgpt_key_edit, self.toggle_musicgpt_key_btn,
+         self.test_musicgpt_btn) = self._make_key_row(
+            "MusicGPT API key...", "Test MusicGPT", self._test_musicgpt_connection
         )
-        musicgpt_key_row.addWidget(self.toggle_musicgpt_key_btn)
-
-        self.test_musicgpt_btn = QPushButton("Test MusicGPT")
-        self.test_musicgpt_btn.clicked.connect(self._test_musicgpt_connection)
-        musicgpt_key_row.addWidget(self.test_musicgpt_btn)
-
         submission_form.addRow("MusicGPT API Key:", musicgpt_key_row)
 
         # Contextual hint label
         self.musicgpt_hint_label = QLabel("")
-        self.musicgpt_hint_label.setStyleSheet(
-            "color: #888888; font-size: 11px; font-style: italic;"
-        )
+        self.musicgpt_hint_label.setProperty("role", "hint")
         self.musicgpt_hint_label.setWordWrap(True)
         submission_form.addRow("", self.musicgpt_hint_label)
 
@@ -253,29 +343,23 @@ class SettingsTab(BaseTab):
 
         # ---- Lalals.com Settings group ----
         self.lalals_group = QGroupBox("Lalals.com Settings")
-        lalals_form = QFormLayout()
-        lalals_form.setSpacing(10)
-        lalals_form.setLabelAlignment(Qt.AlignmentFlag.AlignRight)
+        lalals_form = _make_form()
 
-        self.lalals_username_edit = QLineEdit()
-        self.lalals_username_edit.setPlaceholderText("johnstorlie")
+        self.lalals_username_edit = _make_line_edit("johnstorlie")
         self.lalals_username_edit.setToolTip(
             "Your lalals.com username (from your profile URL).\n"
             "Used by the Profile Page scraper to discover all songs."
         )
         lalals_form.addRow("Lalals.com Username:", self.lalals_username_edit)
 
-        self.lalals_email_edit = QLineEdit()
-        self.lalals_email_edit.setPlaceholderText("your@email.com")
+        self.lalals_email_edit = _make_line_edit("your@email.com")
         lalals_form.addRow("Lalals.com Email:", self.lalals_email_edit)
 
-        self.lalals_password_edit = QLineEdit()
-        self.lalals_password_edit.setEchoMode(QLineEdit.EchoMode.Password)
+        self.lalals_password_edit = _make_line_edit(password=True)
         lalals_form.addRow("Lalals.com Password:", self.lalals_password_edit)
 
         browser_row = QHBoxLayout()
-        self.browser_path_edit = QLineEdit()
-        self.browser_path_edit.setPlaceholderText("/usr/bin/chromium-browser")
+        self.browser_path_edit = _make_line_edit("/usr/bin/chromium-browser")
         browser_row.addWidget(self.browser_path_edit, 1)
 
         self.browse_browser_btn = QPushButton("Browse...")
@@ -289,13 +373,10 @@ class SettingsTab(BaseTab):
 
         # ---- General Settings group ----
         general_group = QGroupBox("General")
-        general_form = QFormLayout()
-        general_form.setSpacing(10)
-        general_form.setLabelAlignment(Qt.AlignmentFlag.AlignRight)
+        general_form = _make_form()
 
         download_row = QHBoxLayout()
-        self.download_dir_edit = QLineEdit()
-        self.download_dir_edit.setPlaceholderText(_DEFAULT_DOWNLOAD_DIR)
+        self.download_dir_edit = _make_line_edit(_DEFAULT_DOWNLOAD_DIR)
         download_row.addWidget(self.download_dir_edit, 1)
 
         self.browse_download_btn = QPushButton("Browse...")
@@ -315,9 +396,7 @@ class SettingsTab(BaseTab):
 
         # ---- Automation Settings group ----
         self.auto_group = QGroupBox("Automation")
-        auto_form = QFormLayout()
-        auto_form.setSpacing(10)
-        auto_form.setLabelAlignment(Qt.AlignmentFlag.AlignRight)
+        auto_form = _make_form()
 
         self.xvfb_checkbox = QCheckBox("Run browser in virtual display (Xvfb)")
         self.xvfb_checkbox.setToolTip(
@@ -326,7 +405,6 @@ class SettingsTab(BaseTab):
         )
         auto_form.addRow("", self.xvfb_checkbox)
 
-        from platform_utils import supports_xvfb
         if not supports_xvfb():
             self.xvfb_checkbox.setVisible(False)
 
@@ -335,29 +413,22 @@ class SettingsTab(BaseTab):
 
         # ---- DistroKid Settings group ----
         dk_group = QGroupBox("DistroKid (Distribution)")
-        dk_form = QFormLayout()
-        dk_form.setSpacing(10)
-        dk_form.setLabelAlignment(Qt.AlignmentFlag.AlignRight)
+        dk_form = _make_form()
 
-        self.dk_email_edit = QLineEdit()
-        self.dk_email_edit.setPlaceholderText("your@email.com")
+        self.dk_email_edit = _make_line_edit("your@email.com")
         dk_form.addRow("DistroKid Email:", self.dk_email_edit)
 
-        self.dk_password_edit = QLineEdit()
-        self.dk_password_edit.setEchoMode(QLineEdit.EchoMode.Password)
-        self.dk_password_edit.setPlaceholderText("DistroKid password")
+        self.dk_password_edit = _make_line_edit("DistroKid password", password=True)
         dk_form.addRow("DistroKid Password:", self.dk_password_edit)
 
-        self.dk_artist_edit = QLineEdit()
-        self.dk_artist_edit.setPlaceholderText("Yakima Finds")
+        self.dk_artist_edit = _make_line_edit("Yakima Finds")
         self.dk_artist_edit.setToolTip(
             "Default artist name for DistroKid uploads.\n"
             "Must match a registered artist on your DistroKid account."
         )
         dk_form.addRow("Default Artist:", self.dk_artist_edit)
 
-        self.dk_songwriter_edit = QLineEdit()
-        self.dk_songwriter_edit.setPlaceholderText("Legal name of songwriter")
+        self.dk_songwriter_edit = _make_line_edit("Legal name of songwriter")
         self.dk_songwriter_edit.setToolTip(
             "Legal name of the songwriter (required by DistroKid).\n"
             "This is NOT the stage name — use your real legal name."
@@ -368,17 +439,150 @@ class SettingsTab(BaseTab):
             "DistroKid requires email + password + 2FA on first login.\n"
             "The browser session will be saved for future uploads."
         )
-        dk_hint.setStyleSheet(
-            "color: #888888; font-size: 11px; font-style: italic;"
-        )
+        dk_hint.setProperty("role", "hint")
         dk_hint.setWordWrap(True)
         dk_form.addRow("", dk_hint)
 
         dk_group.setLayout(dk_form)
         root.addWidget(dk_group)
 
-        # ---- Diagnostics group ----
+        # ---- Diagnostics and Backup & Restore groups ----
+        # Only the empty group boxes are created here; their buttons are
+        # built the first time the tab is shown (see showEvent()).
         self.diag_group = QGroupBox("Diagnostics")
+        root.addWidget(self.diag_group)
+
+        self.backup_group = QGroupBox("Backup && Restore")
+        root.addWidget(self.backup_group)
+
+        # ---- Personal Data Sync group ----
+        sync_group = QGroupBox("Personal Data Sync")
+        sync_form = _make_form()
+
+        sync_folder_row = QHBoxLayout()
+        self.sync_folder_edit = _make_line_edit(
+            "Select a sync folder (e.g. Dropbox, Google Drive)..."
+        )
+        sync_folder_row.addWidget(self.sync_folder_edit, 1)
+
+        self.browse_sync_btn = QPushButton("Browse...")
+        self.browse_sync_btn.clicked.connect(self._browse_sync_folder)
+        sync_folder_row.addWidget(self.browse_sync_btn)
+
+        sync_form.addRow("Sync Folder:", sync_folder_row)
+
+        sync_btn_row = QHBoxLayout()
+        sync_btn_row.setSpacing(8)
+
+        self.export_bundle_btn = QPushButton("Export Now")
+        self.export_bundle_btn.setToolTip(
+            "Export lore, genres, presets, artists, and settings\n"
+            "to the sync folder as a portable JSON bundle."
+        )
+        self.export_bundle_btn.clicked.connect(self._export_bundle_now)
+        sync_btn_row.addWidget(self.export_bundle_btn)
+
+        self.import_bundle_btn = QPushButton("Import Now")
+        self.import_bundle_btn.setToolTip(
+            "Import a personal bundle from the sync folder.\n"
+            "Existing entries are updated; new entries are created."
+        )
+        self.import_bundle_btn.clicked.connect(self._import_bundle_now)
+        sync_btn_row.addWidget(self.import_bundle_btn)
+
+        sync_btn_row.addStretch()
+        sync_form.addRow("", sync_btn_row)
+
+        self.auto_export_check = QCheckBox("Auto-export on data changes")
+        self.auto_export_check.setToolTip(
+            "Automatically export the personal bundle when lore,\n"
+            "genres, or settings change (2-second debounce)."
+        )
+        sync_form.addRow("", self.auto_export_check)
+
+        self.auto_import_check = QCheckBox("Auto-import on startup")
+        self.auto_import_check.setToolTip(
+            "On app startup, check the sync folder for a newer\n"
+            "bundle and import it automatically."
+        )
+        sync_form.addRow("", self.auto_import_check)
+
+        self.sync_status_label = QLabel("")
+        self.sync_status_label.setProperty("role", "note")
+        self.sync_status_label.setWordWrap(True)
+        sync_form.addRow("", self.sync_status_label)
+
+        sync_group.setLayout(sync_form)
+        root.addWidget(sync_group)
+
+        # ---- Bottom: Save button + status label ----
+        bottom_row = QHBoxLayout()
+        bottom_row.setSpacing(12)
+
+        self.save_btn = QPushButton("Save Settings")
+        self.save_btn.setStyleSheet(Theme.save_button_style())
+        self.save_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.save_btn.clicked.connect(self.save_settings)
+        bottom_row.addWidget(self.save_btn)
+
+        self.status_label = QLabel("")
+        self._set_tone(self.status_label, "success")
+        bottom_row.addWidget(self.status_label)
+
+        bottom_row.addStretch()
+        root.addLayout(bottom_row)
+
+        root.addStretch()
+
+        scroll.setWidget(scroll_content)
+        outer.addWidget(scroll)
+
+        # Initial data load
+        self.load_settings()
+
+    def _make_key_row(self, placeholder: str, test_text: str, on_test):
+        """Build an API-key row: password edit, Show/Hide toggle, test button.
+
+        Returns ``(layout, edit, toggle_btn, test_btn)``.
+        """
+        row = QHBoxLayout()
+        edit = _make_line_edit(placeholder, password=True)
+        edit.setMinimumWidth(300)
+        row.addWidget(edit, 1)
+
+        toggle_btn = QPushButton("Show")
+        toggle_btn.setFixedWidth(60)
+        toggle_btn.clicked.connect(lambda: self._toggle_echo(edit, toggle_btn))
+        row.addWidget(toggle_btn)
+
+        test_btn = QPushButton(test_text)
+        test_btn.clicked.connect(on_test)
+        row.addWidget(test_btn)
+
+        return row, edit, toggle_btn, test_btn
+
+    # ------------------------------------------------------------------
+    # Deferred groups
+    # ------------------------------------------------------------------
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._deferred_built:
+            QTimer.singleShot(0, self._build_deferred_groups)
+
+    def _build_deferred_groups(self):
+        """Fill in the Diagnostics and Backup & Restore groups.
+
+        These groups hold only action buttons (no saved settings), so
+        they can wait until the tab is first shown.
+        """
+        if self._deferred_built:
+            return
+        self._deferred_built = True
+        self._build_diagnostics_group()
+        self._build_backup_group()
+
+    def _build_diagnostics_group(self):
         diag_layout = QHBoxLayout()
         diag_layout.setSpacing(10)
 
@@ -443,7 +647,6 @@ class SettingsTab(BaseTab):
         diag_pipeline_layout.addLayout(diag_top_row)
 
         # Phase status rows
-        from widgets.status_badge import StatusBadge
         self._diag_badges = {}
         diag_phases_row = QHBoxLayout()
         for phase_id, phase_name in [
@@ -468,10 +671,8 @@ class SettingsTab(BaseTab):
         diag_full_layout.addLayout(diag_layout)
         diag_full_layout.addLayout(diag_pipeline_layout)
         self.diag_group.setLayout(diag_full_layout)
-        root.addWidget(self.diag_group)
 
-        # ---- Backup & Restore group ----
-        backup_group = QGroupBox("Backup && Restore")
+    def _build_backup_group(self):
         backup_layout = QHBoxLayout()
         backup_layout.setSpacing(10)
 
@@ -492,102 +693,22 @@ class SettingsTab(BaseTab):
         backup_layout.addWidget(self.restore_btn)
 
         self.backup_status_label = QLabel("")
-        self.backup_status_label.setStyleSheet(
-            "color: #888888; font-size: 12px; font-style: italic;"
-        )
+        self.backup_status_label.setProperty("role", "note")
         backup_layout.addWidget(self.backup_status_label, 1)
 
         backup_layout.addStretch()
-        backup_group.setLayout(backup_layout)
-        root.addWidget(backup_group)
+        self.backup_group.setLayout(backup_layout)
 
-        # ---- Personal Data Sync group ----
-        sync_group = QGroupBox("Personal Data Sync")
-        sync_form = QFormLayout()
-        sync_form.setSpacing(10)
-        sync_form.setLabelAlignment(Qt.AlignmentFlag.AlignRight)
-
-        sync_folder_row = QHBoxLayout()
-        self.sync_folder_edit = QLineEdit()
-        self.sync_folder_edit.setPlaceholderText("Select a sync folder (e.g. Dropbox, Google Drive)...")
-        sync_folder_row.addWidget(self.sync_folder_edit, 1)
-
-        self.browse_sync_btn = QPushButton("Browse...")
-        self.browse_sync_btn.clicked.connect(self._browse_sync_folder)
-        sync_folder_row.addWidget(self.browse_sync_btn)
-
-        sync_form.addRow("Sync Folder:", sync_folder_row)
+    @staticmethod
+    def _set_tone(label: QLabel, tone: str) -> None:
+        """Recolour *label* via its ``tone`` property.
 
-        sync_btn_row = QHBoxLayout()
-        sync_btn_row.setSpacing(8)
-
-        self.export_bundle_btn = QPushButton("Export Now")
-        self.export_bundle_btn.setToolTip(
-            "Export lore, genres, presets, artists, and settings\n"
-            "to the sync folder as a portable JSON bundle."
-        )
-        self.export_bundle_btn.clicked.connect(self._export_bundle_now)
-        sync_btn_row.addWidget(self.export_bundle_btn)
-
-        self.import_bundle_btn = QPushButton("Import Now")
-        self.import_bundle_btn.setToolTip(
-            "Import a personal bundle from the sync folder.\n"
-            "Existing entries are updated; new entries are created."
-        )
-        self.import_bundle_btn.clicked.connect(self._import_bundle_now)
-        sync_btn_row.addWidget(self.import_bundle_btn)
-
-        sync_btn_row.addStretch()
-        sync_form.addRow("", sync_btn_row)
-
-        self.auto_export_check = QCheckBox("Auto-export on data changes")
-        self.auto_export_check.setToolTip(
-            "Automatically export the personal bundle when lore,\n"
-            "genres, or settings change (2-second debounce)."
-        )
-        sync_form.addRow("", self.auto_export_check)
-
-        self.auto_import_check = QCheckBox("Auto-import on startup")
-        self.auto_import_check.setToolTip(
-            "On app startup, check the sync folder for a newer\n"
-            "bundle and import it automatically."
-        )
-        sync_form.addRow("", self.auto_import_check)
-
-        self.sync_status_label = QLabel("")
-        self.sync_status_label.setStyleSheet(
-            "color: #888888; font-size: 12px; font-style: italic;"
-        )
-        self.sync_status_label.setWordWrap(True)
-        sync_form.addRow("", self.sync_status_label)
-
-        sync_group.setLayout(sync_form)
-        root.addWidget(sync_group)
-
-        # ---- Bottom: Save button + status label ----
-        bottom_row = QHBoxLayout()
-        bottom_row.setSpacing(12)
-
-        self.save_btn = QPushButton("Save Settings")
-        self.save_btn.setObjectName("saveButton")
-        self.save_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.save_btn.clicked.connect(self.save_settings)
-        bottom_row.addWidget(self.save_btn)
-
-        self.status_label = QLabel("")
-        self.status_label.setStyleSheet(f"color: #4CAF50; font-size: 13px;")
-        bottom_row.addWidget(self.status_label)
-
-        bottom_row.addStretch()
-        root.addLayout(bottom_row)
-
-        root.addStretch()
-
-        scroll.setWidget(scroll_content)
-        outer.addWidget(scroll)
-
-        # Initial data load
-        self.load_settings()
+        The colours live in the application stylesheet, so a re-polish is
+        enough — no stylesheet is parsed.
+        """
+        label.setProperty("tone", tone)
+        label.style().unpolish(label)
+        label.style().polish(label)
 
     # ------------------------------------------------------------------
     # Refresh (BaseTab hook)
@@ -603,6 +724,9 @@ class SettingsTab(BaseTab):
 
     def load_settings(self):
         """Populate all fields from the database config table."""
+        cfg = self.db.get_all_config()
+        parse_bool = self.db.parse_bool
+
         self.api_key_edit.setText(
             get_secret("api_key", fallback_db=self.db) or ""
         )
@@ -612,7 +736,7 @@ class SettingsTab(BaseTab):
         )
 
         # AI model - use stored model ID
-        model = self.db.get_config("ai_model", "")
+        model = cfg.get("ai_model", "")
         for i in range(self.model_combo.count()):
             if self.model_combo.itemData(i) == model:
                 self.model_combo.setCurrentIndex(i)
@@ -620,24 +744,24 @@ class SettingsTab(BaseTab):
 
         # Lalals.com
         self.lalals_username_edit.setText(
-            self.db.get_config("lalals_username", "")
+            cfg.get("lalals_username", "")
         )
         self.lalals_email_edit.setText(
-            self.db.get_config("lalals_email", "")
+            cfg.get("lalals_email", "")
         )
         self.lalals_password_edit.setText(
             get_secret("lalals_password", fallback_db=self.db) or ""
         )
         self.browser_path_edit.setText(
-            self.db.get_config("browser_path", "")
+            cfg.get("browser_path", "")
         )
 
         # General
         self.download_dir_edit.setText(
-            self.db.get_config("download_dir", _DEFAULT_DOWNLOAD_DIR)
+            cfg.get("download_dir", _DEFAULT_DOWNLOAD_DIR)
         )
 
-        max_prompt = self.db.get_config("max_prompt_length", "300")
+        max_prompt = cfg.get("max_prompt_length", "300")
         try:
             self.max_prompt_spin.setValue(int(max_prompt))
         except (ValueError, TypeError):
@@ -645,44 +769,44 @@ class SettingsTab(BaseTab):
 
         # Automation
         self.xvfb_checkbox.setChecked(
-            self.db.get_config("use_xvfb", "false").lower() == "true"
+            parse_bool(cfg.get("use_xvfb"))
         )
 
         # Song Submission
         self.musicgpt_key_edit.setText(
             get_secret("musicgpt_api_key", fallback_db=self.db) or ""
         )
-        mode = self.db.get_config("submission_mode", "browser")
+        mode = cfg.get("submission_mode", "browser")
         idx = self.submission_mode_combo.findData(mode)
         self.submission_mode_combo.setCurrentIndex(max(idx, 0))
         self._apply_submission_mode()
 
         # DistroKid
         self.dk_email_edit.setText(
-            self.db.get_config("dk_email", "")
+            cfg.get("dk_email", "")
         )
         self.dk_password_edit.setText(
             get_secret("dk_password", fallback_db=self.db) or ""
         )
         self.dk_artist_edit.setText(
-            self.db.get_config("dk_artist", "Yakima Finds")
+            cfg.get("dk_artist", "Yakima Finds")
         )
         self.dk_songwriter_edit.setText(
-            self.db.get_config("dk_songwriter", "")
+            cfg.get("dk_songwriter", "")
         )
 
         # Personal Data Sync
         self.sync_folder_edit.setText(
-            self.db.get_config("sync_folder", "")
+            cfg.get("sync_folder", "")
         )
         self.auto_export_check.setChecked(
-            self.db.get_config("auto_export_enabled", "false").lower() == "true"
+            parse_bool(cfg.get("auto_export_enabled"))
         )
         self.auto_import_check.setChecked(
-            self.db.get_config("auto_import_on_startup", "false").lower() == "true"
+            parse_bool(cfg.get("auto_import_on_startup"))
         )
-        last_export = self.db.get_config("last_export_at", "")
-        last_import = self.db.get_config("last_import_at", "")
+        last_export = cfg.get("last_export_at", "")
+        last_import = cfg.get("last_import_at", "")
         parts = []
         if last_export:
             parts.append(f"Last export: {last_export}")
@@ -697,58 +821,61 @@ class SettingsTab(BaseTab):
         """Persist all field values to the database config table."""
         set_secret("api_key", self.api_key_edit.text().strip(), fallback_db=self.db)
         set_secret("segmind_api_key", self.segmind_key_edit.text().strip(), fallback_db=self.db)
-        self.db.set_config("ai_model", self.model_combo.currentData() or self.model_combo.currentText())
-        self.db.set_config("lalals_username", self.lalals_username_edit.text().strip())
-        self.db.set_config("lalals_email", self.lalals_email_edit.text().strip())
         set_secret("lalals_password", self.lalals_password_edit.text(), fallback_db=self.db)
-        self.db.set_config("browser_path", self.browser_path_edit.text().strip())
+        set_secret(
+            "musicgpt_api_key", self.musicgpt_key_edit.text().strip(), fallback_db=self.db
+        )
+        set_secret("dk_password", self.dk_password_edit.text(), fallback_db=self.db)
 
         download_dir = self.download_dir_edit.text().strip()
         if not download_dir:
             download_dir = _DEFAULT_DOWNLOAD_DIR
-        self.db.set_config("download_dir", download_dir)
-
-        # Create the download directory if it does not exist
-        os.makedirs(download_dir, exist_ok=True)
-
-        self.db.set_config("max_prompt_length", str(self.max_prompt_spin.value()))
 
-        # Automation
-        self.db.set_config(
-            "use_xvfb", "true" if self.xvfb_checkbox.isChecked() else "false"
-        )
-
-        # Song Submission
-        set_secret(
-            "musicgpt_api_key", self.musicgpt_key_edit.text().strip(), fallback_db=self.db
-        )
-        self.db.set_config(
-            "submission_mode", self.submission_mode_combo.currentData()
-        )
-
-        # DistroKid
-        self.db.set_config("dk_email", self.dk_email_edit.text().strip())
-        set_secret("dk_password", self.dk_password_edit.text(), fallback_db=self.db)
-        self.db.set_config(
-            "dk_artist", self.dk_artist_edit.text().strip() or "Yakima Finds"
-        )
-        self.db.set_config("dk_songwriter", self.dk_songwriter_edit.text().strip())
+        format_bool = self.db.format_bool
+        values = {
+            "ai_model": self.model_combo.currentData() or self.model_combo.currentText(),
+            "lalals_username": self.lalals_username_edit.text().strip(),
+            "lalals_email": self.lalals_email_edit.text().strip(),
+            "browser_path": self.browser_path_edit.text().strip(),
+            "download_dir": download_dir,
+            "max_prompt_length": str(self.max_prompt_spin.value()),
+            # Automation
+            "use_xvfb": format_bool(self.xvfb_checkbox.isChecked()),
+            # Song Submission
+            "submission_mode": self.submission_mode_combo.currentData(),
+            # DistroKid
+            "dk_email": self.dk_email_edit.text().strip(),
+            "dk_artist": self.dk_artist_edit.text().strip() or "Yakima Finds",
+            "dk_songwriter": self.dk_songwriter_edit.text().strip(),
+            # Personal Data Sync
+            "sync_folder": self.sync_folder_edit.text().strip(),
+            "auto_export_enabled":
+                format_bool(self.auto_export_check.isChecked()),
+            "auto_import_on_startup":
+                format_bool(self.auto_import_check.isChecked()),
+        }
+
+        # Only keys that differ from the stored values are written, all in
+        # a single transaction.  Compare against the table itself: restores
+        # and bundle imports rewrite it behind the form's back.
+        stored = self.db.get_all_config()
+        changed = {
+            key: value for key, value in values.items()
+            if stored.get(key) != value
+        }
+        if changed:
+            self.db.set_configs(changed)
+            invalidate_timeout_cache()
+
+        # Create the download directory when it is first set or moved
+        if "download_dir" in changed:
+            os.makedirs(download_dir, exist_ok=True)
 
-        # Personal Data Sync
-        self.db.set_config("sync_folder", self.sync_folder_edit.text().strip())
-        self.db.set_config(
-            "auto_export_enabled",
-            "true" if self.auto_export_check.isChecked() else "false",
-        )
-        self.db.set_config(
-            "auto_import_on_startup",
-            "true" if self.auto_import_check.isChecked() else "false",
-        )
         self._setup_auto_export()
 
         # Show temporary success message
         self.status_label.setText("Settings saved!")
-        self.status_label.setStyleSheet("color: #4CAF50; font-size: 13px;")
+        self._set_tone(self.status_label, "success")
         QTimer.singleShot(3000, lambda: self.status_label.setText(""))
 
     # ------------------------------------------------------------------
@@ -761,12 +888,8 @@ class SettingsTab(BaseTab):
         if not current:
             current = _DEFAULT_DOWNLOAD_DIR
 
-        directory = QFileDialog.getExistingDirectory(
-            self,
-            "Select Download Directory",
-            current,
-            QFileDialog.Option.ShowDirsOnly,
-        )
+        directory = self._pick_path("Select Download Directory", current,
+                                    directory=True)
         if directory:
             self.download_dir_edit.setText(directory)
 
@@ -775,36 +898,48 @@ class SettingsTab(BaseTab):
         current = self.browser_path_edit.text().strip()
         start_dir = os.path.dirname(current) if current else "/usr/bin"
 
-        file_path, _ = QFileDialog.getOpenFileName(
-            self,
-            "Select Browser Executable",
-            start_dir,
-            "All Files (*)",
-        )
+        file_path = self._pick_path("Select Browser Executable", start_dir)
         if file_path:
             self.browser_path_edit.setText(file_path)
 
+    def _pick_path(self, caption: str, start: str, directory: bool = False,
+                   name_filter: str = "All Files (*)") -> str:
+        """Show the file dialog for *caption* and return the chosen path.
+
+        Each dialog is created once and kept, so later Browse clicks skip
+        building and styling a fresh dialog.  Returns ``""`` on cancel.
+        """
+        dialog = self._file_dialogs.get(caption)
+        if dialog is None:
+            dialog = QFileDialog(self, caption)
+            if directory:
+                dialog.setFileMode(QFileDialog.FileMode.Directory)
+                dialog.setOption(QFileDialog.Option.ShowDirsOnly)
+            else:
+                dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+                dialog.setNameFilter(name_filter)
+            self._file_dialogs[caption] = dialog
+
+        dialog.setDirectory(start)
+        if not dialog.exec():
+            return ""
+        selected = dialog.selectedFiles()
+        return selected[0] if selected else ""
+
     # ------------------------------------------------------------------
     # API key visibility toggle
     # ------------------------------------------------------------------
 
-    def toggle_api_key_visibility(self):
-        """Toggle between showing and hiding the API key."""
-        if self.api_key_edit.echoMode() == QLineEdit.EchoMode.Password:
-            self.api_key_edit.setEchoMode(QLineEdit.EchoMode.Normal)
-            self.toggle_key_btn.setText("Hide")
-        else:
-            self.api_key_edit.setEchoMode(QLineEdit.EchoMode.Password)
-            self.toggle_key_btn.setText("Show")
-
-    def _toggle_segmind_key_visibility(self):
-        """Toggle between showing and hiding the Segmind API key."""
-        if self.segmind_key_edit.echoMode() == QLineEdit.EchoMode.Password:
-            self.segmind_key_edit.setEchoMode(QLineEdit.EchoMode.Normal)
-            self.toggle_segmind_key_btn.setText("Hide")
+    @staticmethod
+    def _toggle_echo(edit: QLineEdit, button: QPushButton) -> None:
+        """Flip *edit* between password and normal echo, relabelling *button*."""
+        echo = QLineEdit.EchoMode
+        if edit.echoMode() == echo.Password:
+            edit.setEchoMode(echo.Normal)
+            button.setText("Hide")
         else:
-            self.segmind_key_edit.setEchoMode(QLineEdit.EchoMode.Password)
-            self.toggle_segmind_key_btn.setText("Show")
+            edit.setEchoMode(echo.Password)
+            button.setText("Show")
 
     def _test_segmind_connection(self):
         """Test the Segmind API key with a small image generation."""
@@ -817,38 +952,10 @@ class SettingsTab(BaseTab):
             )
             return
 
-        self.test_segmind_btn.setEnabled(False)
-        self.test_segmind_btn.setText("Testing...")
-
-        try:
-            from automation.image_generator import SegmindImageGenerator
-
-            gen = SegmindImageGenerator(api_key=api_key)
-            success = gen.test_connection()
-
-            if success:
-                QMessageBox.information(
-                    self,
-                    "Connection Successful",
-                    "Successfully connected to the Segmind API.\n\n"
-                    "Cover art generation is ready to use.",
-                )
-            else:
-                QMessageBox.critical(
-                    self,
-                    "Connection Failed",
-                    "Could not connect to the Segmind API.\n\n"
-                    "Please check your API key and try again.",
-                )
-        except Exception as exc:
-            QMessageBox.critical(
-                self,
-                "Connection Error",
-                f"Error testing Segmind connection:\n\n{exc}",
-            )
-        finally:
-            self.test_segmind_btn.setEnabled(True)
-            self.test_segmind_btn.setText("Test Segmind")
+        self._start_connection_test(
+            self.test_segmind_btn, "Test Segmind",
+            lambda: _probe_segmind(api_key),
+        )
 
     # ------------------------------------------------------------------
     # Connection test
@@ -865,39 +972,40 @@ class SettingsTab(BaseTab):
             )
             return
 
-        self.test_conn_btn.setEnabled(False)
-        self.test_conn_btn.setText("Testing...")
+        model = self.model_combo.currentData() or self.model_combo.currentText()
+        self._start_connection_test(
+            self.test_conn_btn, "Test Connection",
+            lambda: _probe_anthropic(api_key, model),
+        )
 
-        try:
-            from api_client import SongGenerator
-
-            model = self.model_combo.currentData() or self.model_combo.currentText()
-            generator = SongGenerator(api_key=api_key, model=model)
-            success = generator.test_connection()
-
-            if success:
-                QMessageBox.information(
-                    self,
-                    "Connection Successful",
-                    "Successfully connected to the Anthropic API.\n\n"
-                    f"Model: {model}",
-                )
-            else:
-                QMessageBox.critical(
-                    self,
-                    "Connection Failed",
-                    "Could not connect to the Anthropic API.\n\n"
-                    "Please check your API key and try again.",
-                )
-        except Exception as exc:
-            QMessageBox.critical(
-                self,
-                "Connection Error",
-                f"An error occurred while testing the connection:\n\n{exc}",
+    def _start_connection_test(self, button, idle_text: str, probe):
+        """Run *probe* on a worker thread, disabling *button* meanwhile.
+
+        *probe* returns ``(level, title, message)``; the result is shown
+        in a message box of that level once the thread finishes.
+        """
+        button.setEnabled(False)
+        button.setText("Testing...")
+
+        worker = _ConnectionTestWorker(probe, parent=self)
+        self.register_worker(worker)
+        worker.result.connect(
+            lambda level, title, message: self._show_test_result(
+                button, idle_text, level, title, message
             )
-        finally:
-            self.test_conn_btn.setEnabled(True)
-            self.test_conn_btn.setText("Test Connection")
+        )
+        worker.start()
+
+    def _show_test_result(self, button, idle_text: str,
+                          level: str, title: str, message: str):
+        """Re-enable *button* and report a connection test result."""
+        button.setEnabled(True)
+        button.setText(idle_text)
+        show = {
+            "info": QMessageBox.information,
+            "warning": QMessageBox.warning,
+        }.get(level, QMessageBox.critical)
+        show(self, title, message)
 
     # ------------------------------------------------------------------
     # Song Submission mode
@@ -914,13 +1022,12 @@ class SettingsTab(BaseTab):
             self.browser_path_edit,
             self.browse_browser_btn,
             self.xvfb_checkbox,
-            self.sniffer_btn,
-            self.open_log_btn,
         ]
         for widget in browser_widgets:
             widget.setEnabled(not is_api)
 
-        # Dim the entire groups in API mode
+        # Dim the entire groups in API mode (this also covers the sniffer
+        # buttons, which may not be built yet)
         self.lalals_group.setEnabled(not is_api)
         self.auto_group.setEnabled(not is_api)
         self.diag_group.setEnabled(not is_api)
@@ -936,20 +1043,8 @@ class SettingsTab(BaseTab):
                 "is the primary submission mode."
             )
 
-    def _toggle_musicgpt_key_visibility(self):
-        """Toggle between showing and hiding the MusicGPT API key."""
-        if self.musicgpt_key_edit.echoMode() == QLineEdit.EchoMode.Password:
-            self.musicgpt_key_edit.setEchoMode(QLineEdit.EchoMode.Normal)
-            self.toggle_musicgpt_key_btn.setText("Hide")
-        else:
-            self.musicgpt_key_edit.setEchoMode(QLineEdit.EchoMode.Password)
-            self.toggle_musicgpt_key_btn.setText("Show")
-
     def _test_musicgpt_connection(self):
-        """Test the MusicGPT API key by hitting the byId endpoint.
-
-        A 401/403 means invalid key; a 404 (task not found) means valid key.
-        """
+        """Test the MusicGPT API key by hitting the byId endpoint."""
         api_key = self.musicgpt_key_edit.text().strip()
         if not api_key:
             QMessageBox.warning(
@@ -959,64 +1054,33 @@ class SettingsTab(BaseTab):
             )
             return
 
-        self.test_musicgpt_btn.setEnabled(False)
-        self.test_musicgpt_btn.setText("Testing...")
+        # Qt's network stack is asynchronous and keeps connections (and
+        # TLS sessions) alive between probes, so no worker thread is needed
+        if self._nam is None:
+            self._nam = QNetworkAccessManager(self)
 
-        try:
-            import urllib.request
-            import urllib.error
+        request = QNetworkRequest(QUrl(_MUSICGPT_PROBE_URL))
+        request.setRawHeader(b"Authorization", f"Bearer {api_key}".encode())
+        request.setTransferTimeout(10000)
 
-            url = (
-                "https://api.musicgpt.com/api/public/v1/byId"
-                "?conversionType=MUSIC_AI&task_id=test-connection-probe"
-            )
-            req = urllib.request.Request(
-                url,
-                headers={"Authorization": f"Bearer {api_key}"},
-                method="GET",
-            )
+        self.test_musicgpt_btn.setEnabled(False)
+        self.test_musicgpt_btn.setText("Testing...")
+        reply = self._nam.get(request)
+        reply.finished.connect(lambda: self._handle_musicgpt_reply(reply))
 
-            try:
-                with urllib.request.urlopen(req, timeout=10) as resp:
-                    # 2xx = valid key (unlikely for a fake task_id, but fine)
-                    QMessageBox.information(
-                        self,
-                        "Connection Successful",
-                        "MusicGPT API key is valid.",
-                    )
-            except urllib.error.HTTPError as e:
-                if e.code in (401, 403):
-                    QMessageBox.critical(
-                        self,
-                        "Invalid Key",
-                        f"MusicGPT API returned HTTP {e.code}.\n\n"
-                        "The API key appears to be invalid or expired.",
-                    )
-                elif e.code == 404:
-                    # 404 = task not found but auth accepted
-                    QMessageBox.information(
-                        self,
-                        "Connection Successful",
-                        "MusicGPT API key is valid.\n\n"
-                        "(Test task not found — this is expected.)",
-                    )
-                else:
-                    QMessageBox.warning(
-                        self,
-                        "Unexpected Response",
-                        f"MusicGPT API returned HTTP {e.code}.\n\n"
-                        "The key may be valid but the API returned an "
-                        "unexpected status.",
-                    )
-        except Exception as exc:
-            QMessageBox.critical(
-                self,
-                "Connection Error",
-                f"Error testing MusicGPT connection:\n\n{exc}",
-            )
-        finally:
-            self.test_musicgpt_btn.setEnabled(True)
-            self.test_musicgpt_btn.setText("Test MusicGPT")
+    def _handle_musicgpt_reply(self, reply):
+        """Report the outcome of a MusicGPT probe request."""
+        status = reply.attribute(
+            QNetworkRequest.Attribute.HttpStatusCodeAttribute
+        )
+        error = ""
+        if status is None:
+            error = reply.errorString()
+        reply.deleteLater()
+        self._show_test_result(
+            self.test_musicgpt_btn, "Test MusicGPT",
+            *_musicgpt_result(status, error),
+        )
 
     # ------------------------------------------------------------------
     # Diagnostics
@@ -1027,39 +1091,36 @@ class SettingsTab(BaseTab):
         self.sniffer_btn.setEnabled(False)
         self.sniffer_btn.setText("Sniffer running...")
         self.status_label.setText("Network sniffer starting... browser will open.")
-        self.status_label.setStyleSheet("color: #2196F3; font-size: 13px;")
+        self._set_tone(self.status_label, "info")
 
-        from PyQt6.QtCore import QThread
-
-        class SnifferThread(QThread):
-            def run(self_thread):
-                try:
-                    from automation.network_sniffer import NetworkSniffer
-                    sniffer = NetworkSniffer()
-                    sniffer.start(duration_s=60)
-                except Exception as e:
-                    pass  # Logged inside sniffer
-
-        self._sniffer_thread = SnifferThread()
+        self._sniffer_error = None
+        self._sniffer_thread = _SnifferWorker(duration_s=60, parent=self)
         self.register_worker(self._sniffer_thread)
+        self._sniffer_thread.error.connect(self._on_sniffer_error)
         self._sniffer_thread.finished.connect(self._on_sniffer_done)
         self._sniffer_thread.start()
 
+    def _on_sniffer_error(self, message: str):
+        """Remember a sniffer failure so _on_sniffer_done() can report it."""
+        self._sniffer_error = message
+
     def _on_sniffer_done(self):
         """Sniffer thread completed."""
         self.sniffer_btn.setEnabled(True)
         self.sniffer_btn.setText("Run Network Sniffer (60s)")
-        log_path = os.path.expanduser("~/.songfactory/network_sniffer.log")
-        self.status_label.setText(f"Sniffer complete. Log: {log_path}")
-        self.status_label.setStyleSheet("color: #4CAF50; font-size: 13px;")
+        if self._sniffer_error:
+            self.status_label.setText(f"Sniffer failed: {self._sniffer_error}")
+            self._set_tone(self.status_label, "error")
+            QTimer.singleShot(10000, lambda: self.status_label.setText(""))
+            return
+        self.status_label.setText(f"Sniffer complete. Log: {_SNIFFER_LOG}")
+        self._set_tone(self.status_label, "success")
         QTimer.singleShot(5000, lambda: self.status_label.setText(""))
 
     def _open_sniffer_log(self):
         """Open the sniffer log file with the system default viewer."""
-        log_path = os.path.expanduser("~/.songfactory/network_sniffer.log")
+        log_path = _SNIFFER_LOG
         if os.path.exists(log_path):
-            from PyQt6.QtGui import QDesktopServices
-            from PyQt6.QtCore import QUrl
             QDesktopServices.openUrl(QUrl.fromLocalFile(log_path))
         else:
             QMessageBox.information(
@@ -1071,10 +1132,8 @@ class SettingsTab(BaseTab):
 
     def _open_auto_log(self):
         """Open the automation log file."""
-        log_path = os.path.expanduser("~/.songfactory/automation.log")
+        log_path = _AUTOMATION_LOG
         if os.path.exists(log_path):
-            from PyQt6.QtGui import QDesktopServices
-            from PyQt6.QtCore import QUrl
             QDesktopServices.openUrl(QUrl.fromLocalFile(log_path))
         else:
             QMessageBox.information(
@@ -1086,10 +1145,8 @@ class SettingsTab(BaseTab):
 
     def _open_screenshots_folder(self):
         """Open the debug screenshots folder in the file manager."""
-        screenshots_dir = os.path.expanduser("~/.songfactory/screenshots")
+        screenshots_dir = _SCREENSHOTS_DIR
         os.makedirs(screenshots_dir, exist_ok=True)
-        from PyQt6.QtGui import QDesktopServices
-        from PyQt6.QtCore import QUrl
         QDesktopServices.openUrl(QUrl.fromLocalFile(screenshots_dir))
 
     # ------------------------------------------------------------------
@@ -1137,10 +1194,10 @@ class SettingsTab(BaseTab):
         self.view_diag_report_btn.setEnabled(True)
         overall = report.overall_status.upper()
         self.status_label.setText(f"Diagnostic complete: {overall}")
-        color = {"PASS": "#4CAF50", "FAIL": "#f44336", "WARN": "#FF9800"}.get(
-            overall, "#888888"
+        tone = {"PASS": "success", "FAIL": "error", "WARN": "warning"}.get(
+            overall, "neutral"
         )
-        self.status_label.setStyleSheet(f"color: {color}; font-size: 13px;")
+        self._set_tone(self.status_label, tone)
         QTimer.singleShot(10000, lambda: self.status_label.setText(""))
 
     def _view_diag_report(self):
@@ -1151,8 +1208,6 @@ class SettingsTab(BaseTab):
             )
             return
 
-        from PyQt6.QtWidgets import QDialog, QTextBrowser
-
         dlg = QDialog(self)
         dlg.setWindowTitle("Pipeline Diagnostic Report")
         dlg.resize(800, 500)
@@ -1177,30 +1232,45 @@ class SettingsTab(BaseTab):
 
     def _backup_now(self):
         """Create a database backup in the download directory."""
-        download_dir = self._get_download_dir()
-        try:
-            path = self.db.backup_to(download_dir)
-            filename = os.path.basename(path)
-            self.backup_status_label.setText(f"Last backup: {filename}")
-            self.backup_status_label.setStyleSheet(
-                "color: #4CAF50; font-size: 12px; font-style: italic;"
-            )
-            QMessageBox.information(
-                self,
-                "Backup Created",
-                f"Database backed up successfully.\n\n{path}",
-            )
-        except Exception as exc:
-            QMessageBox.critical(
-                self,
-                "Backup Failed",
-                f"Could not create backup:\n\n{exc}",
-            )
+        # A restore would overwrite the file the worker is still reading
+        self.backup_btn.setEnabled(False)
+        self.restore_btn.setEnabled(False)
+        self.backup_status_label.setText("Backing up...")
+        self._set_tone(self.backup_status_label, "neutral")
+
+        worker = _BackupWorker(
+            str(self.db._db_path), self._get_download_dir(), parent=self
+        )
+        self.register_worker(worker)
+        worker.done.connect(self._on_backup_done)
+        worker.failed.connect(self._on_backup_failed)
+        worker.start()
+
+    def _on_backup_done(self, path: str):
+        self.backup_btn.setEnabled(True)
+        self.restore_btn.setEnabled(True)
+        self.backup_status_label.setText(
+            f"Last backup: {os.path.basename(path)}"
+        )
+        self._set_tone(self.backup_status_label, "success")
+        QMessageBox.information(
+            self,
+            "Backup Created",
+            f"Database backed up successfully.\n\n{path}",
+        )
+
+    def _on_backup_failed(self, message: str):
+        self.backup_btn.setEnabled(True)
+        self.restore_btn.setEnabled(True)
+        self.backup_status_label.setText("")
+        QMessageBox.critical(
+            self,
+            "Backup Failed",
+            f"Could not create backup:\n\n{message}",
+        )
 
     def _restore_from_backup(self):
         """Let the user pick a backup and restore it."""
-        from database import Database
-
         download_dir = self._get_download_dir()
         backups = Database.detect_backups(download_dir)
 
@@ -1208,10 +1278,14 @@ class SettingsTab(BaseTab):
 
         if backups:
             # Build choice list: "2026-02-08 14:30:22  (1.2 MB)"
-            items = []
+            paths_by_label = {}
             for b in backups:
                 size_mb = b["size"] / (1024 * 1024)
-                items.append(f"{b['date']}  ({size_mb:.1f} MB)  —  {b['filename']}")
+                label = f"{b['date']}  ({size_mb:.1f} MB)  —  {b['filename']}"
+                if label in paths_by_label:
+                    label = f"{label} ({len(paths_by_label) + 1})"
+                paths_by_label[label] = b["path"]
+            items = list(paths_by_label)
 
             choice, ok = QInputDialog.getItem(
                 self,
@@ -1222,8 +1296,7 @@ class SettingsTab(BaseTab):
                 False,
             )
             if ok and choice:
-                idx = items.index(choice)
-                selected_path = backups[idx]["path"]
+                selected_path = paths_by_label[choice]
             elif ok:
                 return  # cancelled
             else:
@@ -1260,10 +1333,10 @@ class SettingsTab(BaseTab):
 
         try:
             self.db.restore_from(selected_path)
+            invalidate_timeout_cache()
+            self.load_settings()
             self.backup_status_label.setText("Database restored — restart recommended")
-            self.backup_status_label.setStyleSheet(
-                "color: #2196F3; font-size: 12px; font-style: italic;"
-            )
+            self._set_tone(self.backup_status_label, "info")
             QMessageBox.information(
                 self,
                 "Restore Complete",
@@ -1279,11 +1352,10 @@ class SettingsTab(BaseTab):
 
     def _browse_for_backup(self) -> str | None:
         """Open a file dialog to pick a .db backup file."""
-        path, _ = QFileDialog.getOpenFileName(
-            self,
+        path = self._pick_path(
             "Select Backup File",
             self._get_download_dir(),
-            "SQLite Database (*.db);;All Files (*)",
+            name_filter="SQLite Database (*.db);;All Files (*)",
         )
         return path if path else None
 
@@ -1298,12 +1370,8 @@ class SettingsTab(BaseTab):
         current = self.sync_folder_edit.text().strip()
         if not current:
             current = os.path.expanduser("~")
-        directory = QFileDialog.getExistingDirectory(
-            self,
-            "Select Sync Folder",
-            current,
-            QFileDialog.Option.ShowDirsOnly,
-        )
+        directory = self._pick_path("Select Sync Folder", current,
+                                    directory=True)
         if directory:
             self.sync_folder_edit.setText(directory)
 
@@ -1327,15 +1395,12 @@ class SettingsTab(BaseTab):
 
         try:
             from export_import import export_personal_bundle
-            from datetime import datetime
 
             export_personal_bundle(self.db, sync_path)
             now = datetime.now().isoformat(timespec="seconds")
             self.db.set_config("last_export_at", now)
             self.sync_status_label.setText(f"Last export: {now}")
-            self.sync_status_label.setStyleSheet(
-                "color: #4CAF50; font-size: 12px; font-style: italic;"
-            )
+            self._set_tone(self.sync_status_label, "success")
             QMessageBox.information(
                 self,
                 "Export Complete",
@@ -1369,11 +1434,12 @@ class SettingsTab(BaseTab):
 
         try:
             from export_import import import_personal_bundle
-            from datetime import datetime
 
             report = import_personal_bundle(self.db, sync_path)
             now = datetime.now().isoformat(timespec="seconds")
             self.db.set_config("last_import_at", now)
+            # The bundle may have changed config shown in the form
+            self.load_settings()
 
             # Build report message
             lines = []
@@ -1384,9 +1450,7 @@ class SettingsTab(BaseTab):
 
             msg = "\n".join(lines) if lines else "  No changes needed."
             self.sync_status_label.setText(f"Last import: {now}")
-            self.sync_status_label.setStyleSheet(
-                "color: #4CAF50; font-size: 12px; font-style: italic;"
-            )
+            self._set_tone(self.sync_status_label, "success")
 
             QMessageBox.information(
                 self,
@@ -1487,22 +1551,17 @@ class SettingsTab(BaseTab):
         if not sync_path:
             return
         try:
-            import logging
             from export_import import export_personal_bundle
-            from datetime import datetime
 
             export_personal_bundle(self.db, sync_path)
             now = datetime.now().isoformat(timespec="seconds")
             self.db.set_config("last_export_at", now)
             self.sync_status_label.setText(f"Auto-exported: {now}")
-            self.sync_status_label.setStyleSheet(
-                "color: #4CAF50; font-size: 12px; font-style: italic;"
-            )
-            logging.getLogger("songfactory.sync").info(
+            self._set_tone(self.sync_status_label, "success")
+            logger.info(
                 "Auto-exported personal bundle to %s", sync_path
             )
         except Exception as exc:
-            import logging
-            logging.getLogger("songfactory.sync").error(
+            logger.error(
                 "Auto-export failed: %s", exc
             )
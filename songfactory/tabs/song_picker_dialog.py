@@ -6,16 +6,115 @@ Shows only songs that have audio files (file_path_1 IS NOT NULL).
 """
 
 import os
+import sys
 from PyQt6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QLineEdit, QTableWidget,
-    QTableWidgetItem, QHeaderView, QPushButton, QLabel,
-    QAbstractItemView,
+    QDialog, QVBoxLayout, QHBoxLayout, QLineEdit, QTableView,
+    QHeaderView, QPushButton, QLabel, QAbstractItemView,
 )
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QTimer, QAbstractTableModel, QModelIndex
 
 from theme import Theme
 
 
+def _existing_paths(paths) -> set[str]:
+    """Return the members of *paths* that exist on disk.
+
+    Lists each parent directory once with os.scandir instead of stat-ing
+    every file, so a library spread over a few folders costs a few
+    directory reads rather than one syscall per song.
+    """
+    by_dir: dict[str, list[str]] = {}
+    for path in paths:
+        by_dir.setdefault(os.path.dirname(path), []).append(path)
+
+    found = set()
+    for directory, members in by_dir.items():
+        try:
+            with os.scandir(directory or ".") as entries:
+                names = {entry.name for entry in entries}
+        except OSError:
+            continue
+        found.update(p for p in members if os.path.basename(p) in names)
+    return found
+
+
+class SongTableModel(QAbstractTableModel):
+    """Table model over song dicts: title, genre, duration, file type.
+
+    Reads the ``_dur_str`` / ``_ext_str`` display strings that
+    SongPickerDialog caches on each song when it loads them.
+    """
+
+    _HEADERS = ("Title", "Genre", "Duration", "File")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._songs: list[dict] = []
+
+    # -- Qt model API --------------------------------------------------
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._songs)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        song = self._songs[index.row()]
+        col = index.column()
+        if col == 0:
+            return song.get("title", "")
+        if col == 1:
+            return song.get("genre_label") or ""
+        if col == 2:
+            return song["_dur_str"]
+        return song["_ext_str"]
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (
+            orientation == Qt.Orientation.Horizontal
+            and role == Qt.ItemDataRole.DisplayRole
+        ):
+            return self._HEADERS[section]
+        return None
+
+    # -- Helpers -------------------------------------------------------
+
+    def set_songs(self, songs: list[dict]):
+        """Replace all rows."""
+        self.beginResetModel()
+        self._songs = list(songs)
+        self.endResetModel()
+
+    def append_songs(self, songs: list[dict]):
+        """Add rows at the end, keeping the existing rows and selection."""
+        if not songs:
+            return
+        first = len(self._songs)
+        self.beginInsertRows(QModelIndex(), first, first + len(songs) - 1)
+        self._songs.extend(songs)
+        self.endInsertRows()
+
+    def song_at(self, row: int) -> dict:
+        return self._songs[row]
+
+
+# Search debounce: short for small libraries, longer once each re-filter
+# costs enough that skipping intermediate keystrokes pays off.
+_DEBOUNCE_SMALL_MS = 150
+_DEBOUNCE_LARGE_MS = 400
+_LARGE_LIBRARY_SONGS = 500
+
+# Matches are shown this many at a time; "Show More" adds another page.
+_PAGE_SIZE = 500
+
+
 class SongPickerDialog(QDialog):
     """Dialog for selecting songs to add to a CD project."""
 
@@ -27,17 +126,21 @@ class SongPickerDialog(QDialog):
         self.resize(800, 550)
 
         self._all_songs = []
+        # Every match for the current query; the model shows a prefix
         self._filtered_songs = []
+        self._filter_query = ""  # query that produced _filtered_songs
         self._selected_songs = []
 
         self._search_timer = QTimer(self)
         self._search_timer.setSingleShot(True)
-        self._search_timer.setInterval(250)
+        self._search_timer.setInterval(_DEBOUNCE_SMALL_MS)
         self._search_timer.timeout.connect(self._apply_filter)
 
         self._build_ui()
         self._apply_styles()
-        self._load_songs()
+        # Load on the first event-loop pass so the dialog paints at once
+        self.count_label.setText("Loading songs...")
+        QTimer.singleShot(0, self._load_songs)
 
     def _build_ui(self):
         layout = QVBoxLayout(self)
@@ -53,17 +156,21 @@ class SongPickerDialog(QDialog):
         self.search_box.setPlaceholderText("Search by title, genre, or lyrics...")
         self.search_box.setClearButtonEnabled(True)
         self.search_box.textChanged.connect(self._on_search_changed)
+        # Enter filters immediately, skipping the debounce
+        self.search_box.returnPressed.connect(self._filter_now)
         layout.addWidget(self.search_box)
 
-        # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(["Title", "Genre", "Duration", "File"])
+        # Table -- rows are painted on demand from the model, so no
+        # per-cell item objects are built however large the library is
+        self.model = SongTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
         self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
         self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
         self.table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
         self.table.verticalHeader().setVisible(False)
+        self.table.verticalHeader().setDefaultSectionSize(32)
         self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.setSelectionMode(QAbstractItemView.SelectionMode.MultiSelection)
         self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
@@ -73,11 +180,17 @@ class SongPickerDialog(QDialog):
         # Count label
         self.count_label = QLabel("0 songs selected")
         self.count_label.setStyleSheet(f"color: {Theme.TEXT}; font-size: 12px;")
-        self.table.itemSelectionChanged.connect(self._update_count)
+        self.table.selectionModel().selectionChanged.connect(self._update_count)
         layout.addWidget(self.count_label)
 
         # Buttons
         btn_row = QHBoxLayout()
+
+        self.more_btn = QPushButton("Show More")
+        self.more_btn.clicked.connect(self._show_more)
+        self.more_btn.setVisible(False)
+        btn_row.addWidget(self.more_btn)
+
         btn_row.addStretch()
 
         cancel_btn = QPushButton("Cancel")
@@ -100,11 +213,11 @@ class SongPickerDialog(QDialog):
                 border: 1px solid #555555; border-radius: 4px; padding: 6px;
             }}
             QLineEdit:focus {{ border: 1px solid {Theme.ACCENT}; }}
-            QTableWidget {{
+            QTableView {{
                 background-color: {Theme.BG}; alternate-background-color: #323232;
                 color: {Theme.TEXT}; border: 1px solid #555555; gridline-color: transparent;
             }}
-            QTableWidget::item:selected {{
+            QTableView::item:selected {{
                 background-color: {Theme.ACCENT}; color: #000000;
             }}
             QHeaderView::section {{
@@ -126,70 +239,88 @@ class SongPickerDialog(QDialog):
 
     def _load_songs(self):
         """Load songs with audio files from the database."""
-        all_songs = self.db.get_all_songs()
-        self._all_songs = [
-            s for s in all_songs
-            if s.get("file_path_1") and os.path.exists(s["file_path_1"])
-        ]
+        all_songs = self.db.get_songs_for_picker()
+        existing = _existing_paths(s["file_path_1"] for s in all_songs)
+        self._all_songs = [s for s in all_songs if s["file_path_1"] in existing]
+        # Format the display columns and the lowercase search text once,
+        # rather than on every repaint or keystroke
+        for song in self._all_songs:
+            dur = song.get("duration_seconds")
+            if dur:
+                m, sec = divmod(int(dur), 60)
+                song["_dur_str"] = f"{m}:{sec:02d}"
+            else:
+                song["_dur_str"] = "—"
+            # Interned: a library has only a handful of distinct extensions
+            song["_ext_str"] = sys.intern(
+                os.path.splitext(song["file_path_1"])[1].upper()
+            )
+            # Lowercased here rather than in SQL, whose lower() only
+            # folds ASCII
+            song["_search_blob"] = song.pop("search_text").lower()
+        self._filter_query = ""
+        self._filtered_songs = []
+        self._search_timer.setInterval(
+            _DEBOUNCE_LARGE_MS if len(self._all_songs) >= _LARGE_LIBRARY_SONGS
+            else _DEBOUNCE_SMALL_MS
+        )
         self._apply_filter()
 
     def _on_search_changed(self):
         self._search_timer.stop()
         self._search_timer.start()
 
+    def _filter_now(self):
+        self._search_timer.stop()
+        self._apply_filter()
+
     def _apply_filter(self):
         query = self.search_box.text().strip().lower()
+        if query == self._filter_query and self._filtered_songs:
+            return
         if query:
+            # A query that extends the previous one can only match a
+            # subset of its results, so typing narrows the last pass
+            source = self._all_songs
+            if self._filter_query and self._filter_query in query:
+                source = self._filtered_songs
             self._filtered_songs = [
-                s for s in self._all_songs
-                if query in (s.get("title") or "").lower()
-                or query in (s.get("genre_label") or "").lower()
-                or query in (s.get("lyrics") or "").lower()
+                s for s in source if query in s["_search_blob"]
             ]
         else:
             self._filtered_songs = list(self._all_songs)
-
-        self._populate_table()
-
-    def _populate_table(self):
-        songs = self._filtered_songs
-        self.table.setRowCount(len(songs))
-
-        for row, song in enumerate(songs):
-            title_item = QTableWidgetItem(song.get("title", ""))
-            title_item.setData(Qt.ItemDataRole.UserRole, song)
-            self.table.setItem(row, 0, title_item)
-
-            genre = song.get("genre_label") or ""
-            self.table.setItem(row, 1, QTableWidgetItem(genre))
-
-            dur = song.get("duration_seconds")
-            if dur:
-                m = int(dur) // 60
-                s = int(dur) % 60
-                dur_str = f"{m}:{s:02d}"
-            else:
-                dur_str = "—"
-            self.table.setItem(row, 2, QTableWidgetItem(dur_str))
-
-            fp = song.get("file_path_1", "")
-            ext = os.path.splitext(fp)[1].upper() if fp else ""
-            self.table.setItem(row, 3, QTableWidgetItem(ext))
-
-            self.table.setRowHeight(row, 32)
+        self._filter_query = query
+
+        # One repaint for the whole reset rather than one per view update
+        self.table.setUpdatesEnabled(False)
+        try:
+            self.model.set_songs(self._filtered_songs[:_PAGE_SIZE])
+        finally:
+            self.table.setUpdatesEnabled(True)
+        # A model reset drops the selection without selectionChanged
+        self._update_count()
+
+    def _show_more(self):
+        shown = self.model.rowCount()
+        self.model.append_songs(self._filtered_songs[shown:shown + _PAGE_SIZE])
+        self._update_count()
 
     def _update_count(self):
         count = len(self.table.selectionModel().selectedRows())
-        self.count_label.setText(f"{count} song{'s' if count != 1 else ''} selected")
+        text = f"{count} song{'s' if count != 1 else ''} selected"
+        shown = self.model.rowCount()
+        total = len(self._filtered_songs)
+        if shown < total:
+            text += f" · {shown}/{total} shown"
+        self.count_label.setText(text)
+        self.more_btn.setVisible(shown < total)
 
     def _on_add(self):
-        self._selected_songs = []
-        for idx in self.table.selectionModel().selectedRows():
-            item = self.table.item(idx.row(), 0)
-            if item:
-                song = item.data(Qt.ItemDataRole.UserRole)
-                if song:
-                    self._selected_songs.append(song)
+        # Added in table order, whatever order the rows were clicked in
+        rows = sorted(
+            {idx.row() for idx in self.table.selectionModel().selectedRows()}
+        )
+        self._selected_songs = [self.model.song_at(row) for row in rows]
         self.accept()
 
     def get_selected_songs(self) -> list[dict]:
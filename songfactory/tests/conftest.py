@@ -0,0 +1,13 @@
+"""
+Song Factory Package Test Setup
+
+Makes the songfactory modules importable for the tests in this directory.
+"""
+
+import os
+import sys
+
+# Ensure the songfactory package is importable (once, even on re-collection)
+_SONGFACTORY_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _SONGFACTORY_DIR not in sys.path:
+    sys.path.insert(0, _SONGFACTORY_DIR)
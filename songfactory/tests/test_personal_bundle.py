@@ -12,44 +12,66 @@ Verifies:
 
 import json
 import os
-import sys
+import shutil
+from pathlib import Path
 
 import pytest
 
-# Ensure the songfactory package is importable
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+import export_import
+from database import Database
+from export_import import (
+    apply_personal_bundle,
+    build_personal_bundle,
+    export_personal_bundle,
+    import_personal_bundle,
+    preview_personal_bundle,
+)
+from secure_config import SENSITIVE_KEYS
+
+
+@pytest.fixture(scope="session")
+def _bundle_template(tmp_path_factory):
+    """Build the populated test database once and return its path."""
+    path = os.fspath(tmp_path_factory.mktemp("bundle_template") / "template.db")
+    db = Database(db_path=path)
+
+    # One transaction for all the seed writes
+    with db.transaction():
+        # Add genres
+        db.add_genre(name="Rock", prompt_template="rock template", description="Rock music", bpm_range="120-140")
+        db.add_genre(name="Jazz", prompt_template="jazz template", description="Jazz music", bpm_range="80-120")
+
+        # Add lore
+        db.add_lore(title="Origin Story", content="The beginning of Yakima", category="events", active=True)
+        db.add_lore(title="The Mountain", content="A sacred place", category="places", active=True)
+        db.add_lore(title="Elder Wisdom", content="Ancient knowledge", category="people", active=False)
+
+        # Add a preset (using the lore IDs)
+        all_lore = db.get_all_lore()
+        active_ids = [e["id"] for e in all_lore if e["active"]]
+        db.add_lore_preset("Active Set", active_ids)
+
+        # "Yakima Finds" artist is already created by the v4 migration,
+        # so we just add a second artist for testing
+        db.add_artist(name="Side Project", is_default=False)
+
+        # Add some config
+        db.set_config("ai_model", "claude-sonnet-4-5-20250929")
+        db.set_config("max_prompt_length", "300")
+        db.set_config("browser_path", "/usr/bin/chromium")
+
+    # Closing the only connection checkpoints the WAL into the main file,
+    # so the .db file alone is a complete copy
+    db.close()
+    return path
 
 
 @pytest.fixture
-def bundle_db(tmp_path):
+def bundle_db(_bundle_template, tmp_path):
     """Provide a fresh Database with some test data."""
-    from database import Database
-
-    db = Database(db_path=str(tmp_path / "bundle_test.db"))
-
-    # Add genres
-    db.add_genre(name="Rock", prompt_template="rock template", description="Rock music", bpm_range="120-140")
-    db.add_genre(name="Jazz", prompt_template="jazz template", description="Jazz music", bpm_range="80-120")
-
-    # Add lore
-    db.add_lore(title="Origin Story", content="The beginning of Yakima", category="events", active=True)
-    db.add_lore(title="The Mountain", content="A sacred place", category="places", active=True)
-    db.add_lore(title="Elder Wisdom", content="Ancient knowledge", category="people", active=False)
-
-    # Add a preset (using the lore IDs)
-    all_lore = db.get_all_lore()
-    active_ids = [e["id"] for e in all_lore if e["active"]]
-    db.add_lore_preset("Active Set", active_ids)
-
-    # "Yakima Finds" artist is already created by the v4 migration,
-    # so we just add a second artist for testing
-    db.add_artist(name="Side Project", is_default=False)
-
-    # Add some config
-    db.set_config("ai_model", "claude-sonnet-4-5-20250929")
-    db.set_config("max_prompt_length", "300")
-    db.set_config("browser_path", "/usr/bin/chromium")
-
+    path = os.fspath(tmp_path / "bundle_test.db")
+    shutil.copyfile(_bundle_template, path)
+    db = Database(db_path=path, assume_migrated=True)
     yield db
     db.close()
 
@@ -59,14 +81,11 @@ class TestExportPersonalBundle:
 
     def test_export_structure(self, bundle_db, tmp_path):
         """Exported JSON has correct structure and metadata."""
-        from export_import import export_personal_bundle
-
-        path = str(tmp_path / "bundle.json")
+        path = os.fspath(tmp_path / "bundle.json")
         result = export_personal_bundle(bundle_db, path)
         assert os.path.exists(result)
 
-        with open(result) as f:
-            data = json.load(f)
+        data = json.loads(Path(result).read_bytes())
 
         assert data["bundle_version"] == 1
         assert data["app"] == "Song Factory"
@@ -85,18 +104,14 @@ class TestExportPersonalBundle:
 
     def test_export_excludes_sensitive_keys(self, bundle_db, tmp_path):
         """Sensitive keys (API keys, passwords) are never exported."""
-        from export_import import export_personal_bundle
-        from secure_config import SENSITIVE_KEYS
-
         # Store some sensitive values
         bundle_db.set_config("api_key", "sk-ant-secret-key")
         bundle_db.set_config("lalals_password", "supersecret")
 
-        path = str(tmp_path / "bundle.json")
+        path = os.fspath(tmp_path / "bundle.json")
         export_personal_bundle(bundle_db, path)
 
-        with open(path) as f:
-            data = json.load(f)
+        data = json.loads(Path(path).read_bytes())
 
         config = data.get("config", {})
         for key in SENSITIVE_KEYS:
@@ -104,13 +119,10 @@ class TestExportPersonalBundle:
 
     def test_export_lore_only(self, bundle_db, tmp_path):
         """lore_only=True exports only lore, no genres/presets/etc."""
-        from export_import import export_personal_bundle
-
-        path = str(tmp_path / "lore_only.json")
+        path = os.fspath(tmp_path / "lore_only.json")
         export_personal_bundle(bundle_db, path, lore_only=True)
 
-        with open(path) as f:
-            data = json.load(f)
+        data = json.loads(Path(path).read_bytes())
 
         assert "lore" in data
         assert len(data["lore"]) == 3
@@ -121,13 +133,10 @@ class TestExportPersonalBundle:
 
     def test_export_no_internal_ids(self, bundle_db, tmp_path):
         """Exported entries do not contain internal database IDs."""
-        from export_import import export_personal_bundle
-
-        path = str(tmp_path / "bundle.json")
+        path = os.fspath(tmp_path / "bundle.json")
         export_personal_bundle(bundle_db, path)
 
-        with open(path) as f:
-            data = json.load(f)
+        data = json.loads(Path(path).read_bytes())
 
         for lore in data["lore"]:
             assert "id" not in lore
@@ -138,13 +147,10 @@ class TestExportPersonalBundle:
 
     def test_preset_lore_titles(self, bundle_db, tmp_path):
         """Presets resolve lore IDs to titles for portability."""
-        from export_import import export_personal_bundle
-
-        path = str(tmp_path / "bundle.json")
+        path = os.fspath(tmp_path / "bundle.json")
         export_personal_bundle(bundle_db, path)
 
-        with open(path) as f:
-            data = json.load(f)
+        data = json.loads(Path(path).read_bytes())
 
         preset = data["presets"][0]
         assert preset["name"] == "Active Set"
@@ -159,15 +165,13 @@ class TestImportPersonalBundle:
 
     def test_import_creates_new_entries(self, bundle_db, tmp_path):
         """Import into an empty DB creates all entries."""
-        from database import Database
-        from export_import import export_personal_bundle, import_personal_bundle
-
         # Export from populated DB
-        path = str(tmp_path / "bundle.json")
+        path = os.fspath(tmp_path / "bundle.json")
         export_personal_bundle(bundle_db, path)
 
         # Import into empty DB
-        empty_db = Database(db_path=str(tmp_path / "empty.db"))
+        db_path = os.fspath(tmp_path / "empty.db")
+        empty_db = Database(db_path=db_path)
         try:
             report = import_personal_bundle(empty_db, path)
 
@@ -190,30 +194,18 @@ class TestImportPersonalBundle:
         finally:
             empty_db.close()
 
-    def test_import_upserts_existing(self, bundle_db, tmp_path):
+    def test_import_upserts_existing(self, bundle_db):
         """Import with matching names updates content instead of creating duplicates."""
-        from export_import import export_personal_bundle, import_personal_bundle
-
-        path = str(tmp_path / "bundle.json")
-        export_personal_bundle(bundle_db, path)
-
-        # Modify the exported data to have different content
-        with open(path) as f:
-            data = json.load(f)
+        data = build_personal_bundle(bundle_db)
 
         # Find the specific entries by name (order may vary)
-        for entry in data["lore"]:
-            if entry["title"] == "Origin Story":
-                entry["content"] = "UPDATED content for origin story"
-        for entry in data["genres"]:
-            if entry["name"] == "Rock":
-                entry["description"] = "UPDATED rock description"
-
-        with open(path, "w") as f:
-            json.dump(data, f)
+        lore_by_title = {e["title"]: e for e in data["lore"]}
+        genres_by_name = {g["name"]: g for g in data["genres"]}
+        lore_by_title["Origin Story"]["content"] = "UPDATED content for origin story"
+        genres_by_name["Rock"]["description"] = "UPDATED rock description"
 
-        # Import back into the same DB
-        report = import_personal_bundle(bundle_db, path)
+        # Apply back onto the same DB
+        report = apply_personal_bundle(bundle_db, data)
 
         assert report["lore_created"] == 0
         assert report["lore_updated"] == 3  # all 3 lore entries updated
@@ -221,19 +213,34 @@ class TestImportPersonalBundle:
         assert report["genres_updated"] == 2  # both genres updated
 
         # Verify the content was actually updated
-        all_lore = bundle_db.get_all_lore()
-        origin = next(e for e in all_lore if e["title"] == "Origin Story")
-        assert origin["content"] == "UPDATED content for origin story"
+        lore_by_title = {e["title"]: e for e in bundle_db.get_all_lore()}
+        assert lore_by_title["Origin Story"]["content"] == "UPDATED content for origin story"
 
-        all_genres = bundle_db.get_all_genres()
-        rock = next(g for g in all_genres if g["name"] == "Rock")
-        assert rock["description"] == "UPDATED rock description"
+        genres_by_name = {g["name"]: g for g in bundle_db.get_all_genres()}
+        assert genres_by_name["Rock"]["description"] == "UPDATED rock description"
+
+    def test_failed_import_rolls_back(self, bundle_db, tmp_path, monkeypatch):
+        """An error part-way through leaves the target database unchanged."""
+        data = build_personal_bundle(bundle_db)
+
+        db_path = os.fspath(tmp_path / "rollback.db")
+        db = Database(db_path=db_path)
+        try:
+            def fail(*args, **kwargs):
+                raise RuntimeError("boom")
+
+            # Config is merged last, after every other section was written
+            monkeypatch.setattr(db, "set_config", fail)
+            with pytest.raises(RuntimeError):
+                apply_personal_bundle(db, data)
+
+            assert db.get_all_lore() == []
+            assert db.get_all_genres() == []
+        finally:
+            db.close()
 
     def test_import_resolves_preset_lore_titles(self, tmp_path):
         """Preset lore_titles are mapped back to IDs in the target database."""
-        from database import Database
-        from export_import import import_personal_bundle
-
         # Create a bundle with a preset that references lore by title
         bundle = {
             "bundle_version": 1,
@@ -251,11 +258,13 @@ class TestImportPersonalBundle:
             "config": {},
         }
 
-        path = str(tmp_path / "preset_bundle.json")
+        path = os.fspath(tmp_path / "preset_bundle.json")
         with open(path, "w") as f:
             json.dump(bundle, f)
 
-        db = Database(db_path=str(tmp_path / "preset_test.db"))
+        db_path = os.fspath(tmp_path / "preset_test.db")
+
+        db = Database(db_path=db_path)
         try:
             report = import_personal_bundle(db, path)
 
@@ -275,9 +284,6 @@ class TestImportPersonalBundle:
 
     def test_import_skips_sensitive_config(self, tmp_path):
         """Even if sensitive keys appear in a bundle, they are skipped."""
-        from database import Database
-        from export_import import import_personal_bundle
-
         bundle = {
             "bundle_version": 1,
             "exported_at": "2026-01-01T00:00:00",
@@ -293,11 +299,13 @@ class TestImportPersonalBundle:
             },
         }
 
-        path = str(tmp_path / "sneaky.json")
+        path = os.fspath(tmp_path / "sneaky.json")
         with open(path, "w") as f:
             json.dump(bundle, f)
 
-        db = Database(db_path=str(tmp_path / "secure_test.db"))
+        db_path = os.fspath(tmp_path / "secure_test.db")
+
+        db = Database(db_path=db_path)
         try:
             report = import_personal_bundle(db, path)
 
@@ -316,9 +324,7 @@ class TestPreviewPersonalBundle:
 
     def test_preview_returns_counts(self, bundle_db, tmp_path):
         """Preview returns counts and metadata without importing."""
-        from export_import import export_personal_bundle, preview_personal_bundle
-
-        path = str(tmp_path / "bundle.json")
+        path = os.fspath(tmp_path / "bundle.json")
         export_personal_bundle(bundle_db, path)
 
         preview = preview_personal_bundle(path)
@@ -330,15 +336,30 @@ class TestPreviewPersonalBundle:
         assert "exported_at" in preview
         assert isinstance(preview["config_keys"], list)
 
+    def test_streaming_preview_matches_full_parse(self, bundle_db, tmp_path):
+        """The ijson preview reports the same counts as a full parse."""
+        pytest.importorskip("ijson")
+
+        path = os.fspath(tmp_path / "bundle.json")
+        export_personal_bundle(bundle_db, path)
+
+        streamed = export_import._stream_bundle_preview(path)
+        data = json.loads(Path(path).read_bytes())
+        assert streamed["lore_count"] == len(data["lore"])
+        assert streamed["genre_count"] == len(data["genres"])
+        assert streamed["preset_count"] == len(data["presets"])
+        assert streamed["artist_count"] == len(data["artists"])
+        assert streamed["config_keys"] == list(data["config"])
+        assert streamed["bundle_version"] == data["bundle_version"]
+
     def test_preview_has_no_side_effects(self, bundle_db, tmp_path):
         """Preview does not modify the database."""
-        from database import Database
-        from export_import import export_personal_bundle, preview_personal_bundle
-
-        path = str(tmp_path / "bundle.json")
+        path = os.fspath(tmp_path / "bundle.json")
         export_personal_bundle(bundle_db, path)
 
-        empty_db = Database(db_path=str(tmp_path / "pristine.db"))
+        db_path = os.fspath(tmp_path / "pristine.db")
+
+        empty_db = Database(db_path=db_path)
         try:
             # Get initial state
             initial_lore = len(empty_db.get_all_lore())
@@ -353,58 +374,51 @@ class TestPreviewPersonalBundle:
             empty_db.close()
 
 
+def _snapshot(db) -> dict:
+    """Read each bundled table from *db* once, in a comparable form."""
+    lore = db.get_all_lore()
+    titles = {e["id"]: e["title"] for e in lore}
+    config = db.get_all_config()
+    return {
+        "lore": sorted((e["title"], e["content"], e["category"]) for e in lore),
+        "genres": sorted(
+            (g["name"], g["prompt_template"], g["description"])
+            for g in db.get_all_genres()
+        ),
+        "presets": {
+            p["name"]: {titles[i] for i in p["lore_ids"]}
+            for p in db.get_all_lore_presets()
+        },
+        "artists": sorted(
+            (a["name"], bool(a["is_default"])) for a in db.get_all_artists()
+        ),
+        "config": {k: config.get(k) for k in ("ai_model", "max_prompt_length")},
+    }
+
+
 class TestRoundTrip:
     """Test full export-then-import cycle."""
 
     def test_round_trip_produces_identical_data(self, bundle_db, tmp_path):
         """Export then import into a fresh DB produces equivalent data."""
-        from database import Database
-        from export_import import export_personal_bundle, import_personal_bundle
-
         # Export
-        path = str(tmp_path / "roundtrip.json")
+        path = os.fspath(tmp_path / "roundtrip.json")
         export_personal_bundle(bundle_db, path)
 
         # Import into fresh DB
-        target_db = Database(db_path=str(tmp_path / "target.db"))
+        db_path = os.fspath(tmp_path / "target.db")
+        target_db = Database(db_path=db_path)
         try:
             import_personal_bundle(target_db, path)
 
-            # Compare lore
-            orig_lore = sorted(
-                [(e["title"], e["content"], e["category"]) for e in bundle_db.get_all_lore()]
-            )
-            target_lore = sorted(
-                [(e["title"], e["content"], e["category"]) for e in target_db.get_all_lore()]
-            )
-            assert orig_lore == target_lore
-
-            # Compare genres
-            orig_genres = sorted(
-                [(g["name"], g["prompt_template"], g["description"]) for g in bundle_db.get_all_genres()]
-            )
-            target_genres = sorted(
-                [(g["name"], g["prompt_template"], g["description"]) for g in target_db.get_all_genres()]
-            )
-            assert orig_genres == target_genres
-
-            # Compare presets by name and lore title mapping
-            orig_presets = bundle_db.get_all_lore_presets()
-            target_presets = target_db.get_all_lore_presets()
-            assert len(orig_presets) == len(target_presets)
-            assert orig_presets[0]["name"] == target_presets[0]["name"]
-
-            # Compare artists
-            orig_artists = sorted(
-                [(a["name"], bool(a["is_default"])) for a in bundle_db.get_all_artists()]
-            )
-            target_artists = sorted(
-                [(a["name"], bool(a["is_default"])) for a in target_db.get_all_artists()]
-            )
-            assert orig_artists == target_artists
-
-            # Compare config
-            assert target_db.get_config("ai_model") == bundle_db.get_config("ai_model")
-            assert target_db.get_config("max_prompt_length") == bundle_db.get_config("max_prompt_length")
+            orig = _snapshot(bundle_db)
+            target = _snapshot(target_db)
+
+            assert orig["lore"] == target["lore"]
+            assert orig["genres"] == target["genres"]
+            # Presets compare by name and the lore titles they resolve to
+            assert orig["presets"] == target["presets"]
+            assert orig["artists"] == target["artists"]
+            assert orig["config"] == target["config"]
         finally:
             target_db.close()
@@ -6,6 +6,9 @@ Verifies:
 - DiagnosticReport overall status aggregation
 """
 
+import re
+from functools import lru_cache
+
 import pytest
 
 from automation.pipeline_diagnostics import DiagnosticResult, DiagnosticReport
@@ -50,54 +53,50 @@ class TestDiagnosticResult:
         r1.selectors_tried.append("foo")
         assert "foo" not in r2.selectors_tried
 
+    def test_uses_slots(self):
+        r = DiagnosticResult(phase="A", name="Test", status="pass")
+        assert not hasattr(r, "__dict__")
+        with pytest.raises(AttributeError):
+            r.unknown_field = 1
 
-class TestDiagnosticReport:
-    """Test the DiagnosticReport aggregation and rendering."""
-
-    def _make_report(self, statuses: list[str]) -> DiagnosticReport:
-        return DiagnosticReport(results=[
-            DiagnosticResult(phase=chr(65 + i), name=f"Phase {chr(65 + i)}", status=s)
-            for i, s in enumerate(statuses)
-        ])
 
-    def test_overall_status_all_pass(self):
-        report = self._make_report(["pass", "pass", "pass"])
-        assert report.overall_status == "pass"
+def _make_report(statuses) -> DiagnosticReport:
+    """Build a report with one result per status, phases A, B, C..."""
+    return DiagnosticReport(results=[
+        DiagnosticResult(phase=chr(65 + i), name=f"Phase {chr(65 + i)}", status=s)
+        for i, s in enumerate(statuses)
+    ])
 
-    def test_overall_status_one_fail(self):
-        report = self._make_report(["pass", "fail", "pass"])
-        assert report.overall_status == "fail"
 
-    def test_overall_status_warn_no_fail(self):
-        report = self._make_report(["pass", "warn", "pass"])
-        assert report.overall_status == "warn"
+@lru_cache(maxsize=None)
+def _render(statuses: tuple[str, ...]) -> str:
+    """Return the HTML for _make_report(statuses), rendered once per shape."""
+    return _make_report(statuses).to_html()
 
-    def test_overall_status_fail_overrides_warn(self):
-        report = self._make_report(["warn", "fail", "pass"])
-        assert report.overall_status == "fail"
 
-    def test_overall_status_empty(self):
-        report = DiagnosticReport()
-        assert report.overall_status == "skip"
+class TestDiagnosticReport:
+    """Test the DiagnosticReport aggregation and rendering."""
 
-    def test_overall_status_all_skip(self):
-        report = self._make_report(["skip", "skip"])
-        assert report.overall_status == "pass"  # no fail or warn
+    @pytest.mark.parametrize("statuses, expected", [
+        (["pass", "pass", "pass"], "pass"),
+        (["pass", "fail", "pass"], "fail"),
+        (["pass", "warn", "pass"], "warn"),
+        (["warn", "fail", "pass"], "fail"),  # fail overrides warn
+        ([], "skip"),
+        (["skip", "skip"], "pass"),  # no fail or warn
+    ], ids=["all_pass", "one_fail", "warn_no_fail", "fail_overrides_warn",
+            "empty", "all_skip"])
+    def test_overall_status(self, statuses, expected):
+        assert _make_report(statuses).overall_status == expected
 
     def test_to_html_contains_phases(self):
-        report = self._make_report(["pass", "fail", "warn"])
-        html = report.to_html()
+        html = _render(("pass", "fail", "warn"))
         assert "<html>" in html
-        assert "Phase A" in html
-        assert "Phase B" in html
-        assert "Phase C" in html
-        assert "PASS" in html
-        assert "FAIL" in html
-        assert "WARN" in html
+        assert set(re.findall(r"Phase [A-C]", html)) == {"Phase A", "Phase B", "Phase C"}
+        assert set(re.findall(r"PASS|FAIL|WARN", html)) == {"PASS", "FAIL", "WARN"}
 
     def test_to_html_includes_overall(self):
-        report = self._make_report(["pass", "pass"])
-        html = report.to_html()
+        html = _render(("pass", "pass"))
         assert "Overall" in html
         assert "PASS" in html
 
@@ -113,8 +112,7 @@ class TestDiagnosticReport:
         assert "Screenshots" in html
 
     def test_to_html_no_screenshots_section_when_empty(self):
-        report = self._make_report(["pass"])
-        html = report.to_html()
+        html = _render(("pass",))
         assert "Screenshots" not in html
 
     def test_to_html_shows_matched_selector(self):
@@ -6,6 +6,8 @@ stylesheet live here.  Individual tabs import from this module instead of
 defining their own local color constants.
 """
 
+from functools import cache
+
 
 class Theme:
     """Application-wide color and style constants."""
@@ -60,9 +62,13 @@ class Theme:
 
     # -----------------------------------------------------------------
     # Reusable style fragments
+    #
+    # The palette never changes at runtime, so each stylesheet is built
+    # once and the same string is returned on every later call.
     # -----------------------------------------------------------------
 
     @staticmethod
+    @cache
     def accent_button_style() -> str:
         """Gold accent button style (primary actions)."""
         return f"""
@@ -88,6 +94,7 @@ class Theme:
         """
 
     @staticmethod
+    @cache
     def secondary_button_style() -> str:
         """Gray secondary button style."""
         return f"""
@@ -115,6 +122,7 @@ class Theme:
         """
 
     @staticmethod
+    @cache
     def danger_button_style() -> str:
         """Red danger button style (destructive actions)."""
         return f"""
@@ -136,6 +144,29 @@ class Theme:
         """
 
     @staticmethod
+    @cache
+    def save_button_style() -> str:
+        """Large gold Save button style (Settings tab)."""
+        return f"""
+            QPushButton {{
+                background-color: {Theme.ACCENT};
+                color: {Theme.DARK_TEXT};
+                border: none;
+                border-radius: 6px;
+                padding: 10px 28px;
+                font-weight: bold;
+                font-size: 14px;
+            }}
+            QPushButton:hover {{
+                background-color: #f0b848;
+            }}
+            QPushButton:pressed {{
+                background-color: #d09828;
+            }}
+        """
+
+    @staticmethod
+    @cache
     def collapsible_toggle_style() -> str:
         """Transparent toggle button with accent text."""
         return f"""
@@ -154,6 +185,7 @@ class Theme:
         """
 
     @staticmethod
+    @cache
     def panel_style() -> str:
         """Base panel input styling (for inner panels)."""
         return f"""
@@ -181,6 +213,7 @@ class Theme:
         """
 
     @staticmethod
+    @cache
     def global_stylesheet() -> str:
         """Return the full application stylesheet."""
         return f"""
@@ -385,4 +418,205 @@ QMessageBox {{
 QMessageBox QLabel {{
     color: {Theme.TEXT};
 }}
+{Theme._lore_discovery_rules('QWidget[class="loreDiscovery"]')}
+{Theme._settings_rules('QWidget[class="settings"]')}"""
+
+    @staticmethod
+    @cache
+    def _settings_rules(scope: str) -> str:
+        """Return the Settings tab's rules, each prefixed with *scope*.
+
+        Combo box drop-downs and popups use the global rules; the Save
+        button styles itself with ``save_button_style()``.  Small grey
+        labels set a ``role`` property of ``"hint"`` or ``"note"``, and
+        status labels are recoloured through a ``tone`` property.
+        """
+        return f"""
+{scope} QGroupBox {{
+    background-color: {Theme.PANEL};
+    border: 1px solid {Theme.BORDER};
+    border-radius: 6px;
+    margin-top: 14px;
+    padding: 16px 12px 12px 12px;
+    font-weight: bold;
+    font-size: 13px;
+    color: {Theme.ACCENT};
+}}
+{scope} QGroupBox::title {{
+    subcontrol-origin: margin;
+    subcontrol-position: top left;
+    padding: 2px 10px;
+    color: {Theme.ACCENT};
+}}
+{scope} QLineEdit, {scope} QComboBox, {scope} QSpinBox {{
+    background-color: {Theme.BG};
+    color: {Theme.TEXT};
+    border: 1px solid {Theme.BORDER};
+    border-radius: 4px;
+    padding: 6px 8px;
+    font-size: 13px;
+    min-height: 24px;
+}}
+{scope} QLineEdit:focus, {scope} QComboBox:focus, {scope} QSpinBox:focus {{
+    border-color: {Theme.ACCENT};
+}}
+{scope} QLabel {{
+    color: {Theme.TEXT};
+    font-size: 13px;
+}}
+{scope} QLabel[role="hint"] {{
+    color: #888888;
+    font-size: 11px;
+    font-style: italic;
+}}
+{scope} QLabel[role="note"] {{
+    color: #888888;
+    font-size: 12px;
+    font-style: italic;
+}}
+{scope} QLabel[tone="success"] {{
+    color: {Theme.SUCCESS};
+}}
+{scope} QLabel[tone="info"] {{
+    color: {Theme.INFO};
+}}
+{scope} QLabel[tone="warning"] {{
+    color: {Theme.WARNING};
+}}
+{scope} QLabel[tone="error"] {{
+    color: {Theme.ERROR};
+}}
+{scope} QLabel[tone="neutral"] {{
+    color: #888888;
+}}
+{scope} QPushButton {{
+    background-color: #444444;
+    color: {Theme.TEXT};
+    border: 1px solid #666666;
+    border-radius: 4px;
+    padding: 6px 16px;
+    font-size: 13px;
+}}
+{scope} QPushButton:hover {{
+    background-color: {Theme.BORDER};
+}}
+{scope} QPushButton:pressed {{
+    background-color: #333333;
+}}
+"""
+
+    @staticmethod
+    @cache
+    def _lore_discovery_rules(scope: str) -> str:
+        """Return the Lore Discovery tab's rules, each prefixed with *scope*.
+
+        Kept in the application stylesheet so Qt parses them once at
+        startup rather than on every tab construction.
+        """
+        return f"""
+{scope} QSplitter::handle {{
+    background-color: {Theme.HOVER};
+    width: 3px;
+}}
+{scope} QLineEdit {{
+    background-color: {Theme.PANEL};
+    border: 1px solid {Theme.BORDER};
+    border-radius: 4px;
+    padding: 6px 8px;
+    color: {Theme.TEXT};
+    font-size: 14px;
+}}
+{scope} QLineEdit:focus {{
+    border-color: {Theme.ACCENT};
+}}
+{scope} QComboBox {{
+    background-color: {Theme.PANEL};
+    border: 1px solid {Theme.BORDER};
+    border-radius: 4px;
+    padding: 5px 8px;
+    color: {Theme.TEXT};
+    min-height: 24px;
+}}
+{scope} QComboBox::drop-down {{
+    border: none;
+}}
+{scope} QComboBox QAbstractItemView {{
+    background-color: {Theme.PANEL};
+    color: {Theme.TEXT};
+    selection-background-color: {Theme.ACCENT};
+    selection-color: #1e1e1e;
+}}
+{scope} QTextEdit {{
+    background-color: {Theme.PANEL};
+    border: 1px solid {Theme.BORDER};
+    border-radius: 4px;
+    padding: 6px;
+    color: {Theme.TEXT};
+    font-size: 13px;
+}}
+{scope} QTextEdit:focus {{
+    border-color: {Theme.ACCENT};
+}}
+{scope} QPushButton {{
+    background-color: {Theme.ACCENT};
+    color: #1e1e1e;
+    border: none;
+    border-radius: 4px;
+    padding: 8px 16px;
+    font-weight: bold;
+    font-size: 13px;
+}}
+{scope} QPushButton:hover {{
+    background-color: #f0b848;
+}}
+{scope} QPushButton:pressed {{
+    background-color: #d09828;
+}}
+{scope} QPushButton:disabled {{
+    background-color: {Theme.DISABLED_BG};
+    color: {Theme.DISABLED_TEXT};
+    border: 1px solid #444444;
+}}
+{scope} QPushButton#secondaryBtn {{
+    background-color: {Theme.HOVER};
+    color: {Theme.TEXT};
+    border: 1px solid {Theme.BORDER};
+}}
+{scope} QPushButton#secondaryBtn:hover {{
+    background-color: {Theme.BORDER};
+    border-color: {Theme.ACCENT};
+}}
+{scope} QPushButton#secondaryBtn:disabled {{
+    background-color: {Theme.DISABLED_BG};
+    color: {Theme.DISABLED_TEXT};
+}}
+{scope} QLabel {{
+    color: {Theme.TEXT};
+    font-size: 12px;
+}}
+{scope} QLabel#sectionLabel {{
+    font-weight: bold;
+    font-size: 13px;
+    color: {Theme.ACCENT};
+}}
+{scope} QLabel#statusLabel {{
+    color: {Theme.DIMMED};
+    font-size: 12px;
+}}
+{scope} QScrollArea, {scope} QListView {{
+    border: 1px solid {Theme.BORDER};
+    border-radius: 4px;
+    background-color: {Theme.PANEL};
+}}
+{scope} QListView::indicator {{
+    width: 16px;
+    height: 16px;
+    border: 1px solid {Theme.BORDER};
+    border-radius: 3px;
+    background-color: {Theme.PANEL};
+}}
+{scope} QListView::indicator:checked {{
+    background-color: {Theme.ACCENT};
+    border-color: {Theme.ACCENT};
+}}
 """
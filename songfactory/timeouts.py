@@ -5,6 +5,8 @@ Centralized timeout defaults with database override support.
 Usage: ``get_timeout(db, "login_wait_s")`` returns the configured or default value.
 """
 
+from weakref import WeakKeyDictionary
+
 
 # Default timeouts — keys describe the operation and unit
 TIMEOUTS = {
@@ -24,9 +26,20 @@ TIMEOUTS = {
 }
 
 
+# Config table key for each timeout, built once
+_TIMEOUT_CONFIG_KEYS = {key: f"timeout_{key}" for key in TIMEOUTS}
+
+# Resolved values per Database.  Weak keys, so a closed database's entries
+# go away with it and a new one at the same address never sees them.
+_TIMEOUT_CACHE: "WeakKeyDictionary[object, dict[str, int | float]]" = WeakKeyDictionary()
+
+
 def get_timeout(db, key: str) -> int | float:
     """Get a timeout value, checking the config table first.
 
+    Each database's value is looked up once and then served from memory;
+    call invalidate_timeout_cache() after changing a ``timeout_*`` key.
+
     Args:
         db: Database instance (or None for defaults only).
         key: Timeout key from TIMEOUTS dict.
@@ -37,13 +50,27 @@ def get_timeout(db, key: str) -> int | float:
     Raises:
         KeyError: If key is not in TIMEOUTS.
     """
-    if key not in TIMEOUTS:
+    config_key = _TIMEOUT_CONFIG_KEYS.get(key)
+    if config_key is None:
         raise KeyError(f"Unknown timeout key: {key!r}")
-    if db is not None:
-        override = db.get_config(f"timeout_{key}")
-        if override is not None:
-            try:
-                return type(TIMEOUTS[key])(override)
-            except (ValueError, TypeError):
-                pass
-    return TIMEOUTS[key]
+    if db is None:
+        return TIMEOUTS[key]
+
+    cached = _TIMEOUT_CACHE.setdefault(db, {})
+    if key in cached:
+        return cached[key]
+
+    value = TIMEOUTS[key]
+    override = db.get_config(config_key)
+    if override is not None:
+        try:
+            value = type(value)(override)
+        except (ValueError, TypeError):
+            pass
+    cached[key] = value
+    return value
+
+
+def invalidate_timeout_cache() -> None:
+    """Forget every cached timeout so the next lookups re-read the config."""
+    _TIMEOUT_CACHE.clear()
@@ -5,10 +5,14 @@ Validation functions for user-facing forms.  Each returns a list of
 ``ValidationError`` instances (empty list means valid).
 """
 
+import os
+
 
 class ValidationError:
     """Represents a single validation failure."""
 
+    __slots__ = ("field", "message")
+
     def __init__(self, field: str, message: str):
         self.field = field
         self.message = message
@@ -17,6 +21,14 @@ class ValidationError:
         return f"ValidationError({self.field!r}, {self.message!r})"
 
 
+def _require_nonblank(
+    errors: list[ValidationError], field: str, value: str | None, message: str
+) -> None:
+    """Append ``ValidationError(field, message)`` if *value* is empty or blank."""
+    if not value or value.isspace():
+        errors.append(ValidationError(field, message))
+
+
 def validate_song(
     title: str,
     prompt: str,
@@ -25,11 +37,9 @@ def validate_song(
 ) -> list[ValidationError]:
     """Validate song creation/edit inputs."""
     errors = []
-    if not title or not title.strip():
-        errors.append(ValidationError("title", "Title cannot be empty"))
-    if not prompt or not prompt.strip():
-        errors.append(ValidationError("prompt", "Prompt cannot be empty"))
-    if len(prompt) > max_prompt_length:
+    _require_nonblank(errors, "title", title, "Title cannot be empty")
+    _require_nonblank(errors, "prompt", prompt, "Prompt cannot be empty")
+    if prompt and len(prompt) > max_prompt_length:
         errors.append(
             ValidationError(
                 "prompt",
@@ -37,30 +47,25 @@ def validate_song(
                 f"({len(prompt)} / {max_prompt_length})",
             )
         )
-    if not lyrics or not lyrics.strip():
-        errors.append(ValidationError("lyrics", "Lyrics cannot be empty"))
+    _require_nonblank(errors, "lyrics", lyrics, "Lyrics cannot be empty")
     return errors
 
 
 def validate_genre(name: str, prompt_template: str) -> list[ValidationError]:
     """Validate genre creation/edit inputs."""
     errors = []
-    if not name or not name.strip():
-        errors.append(ValidationError("name", "Genre name cannot be empty"))
-    if not prompt_template or not prompt_template.strip():
-        errors.append(
-            ValidationError("prompt_template", "Prompt template cannot be empty")
-        )
+    _require_nonblank(errors, "name", name, "Genre name cannot be empty")
+    _require_nonblank(
+        errors, "prompt_template", prompt_template, "Prompt template cannot be empty"
+    )
     return errors
 
 
 def validate_lore(title: str, content: str) -> list[ValidationError]:
     """Validate lore creation/edit inputs."""
     errors = []
-    if not title or not title.strip():
-        errors.append(ValidationError("title", "Title cannot be empty"))
-    if not content or not content.strip():
-        errors.append(ValidationError("content", "Content cannot be empty"))
+    _require_nonblank(errors, "title", title, "Title cannot be empty")
+    _require_nonblank(errors, "content", content, "Content cannot be empty")
     return errors
 
 
@@ -73,13 +78,10 @@ def validate_distribution(
     errors = []
     if not song_id:
         errors.append(ValidationError("song_id", "Song is required"))
-    if not songwriter or not songwriter.strip():
-        errors.append(
-            ValidationError("songwriter", "Songwriter legal name is required")
-        )
+    _require_nonblank(
+        errors, "songwriter", songwriter, "Songwriter legal name is required"
+    )
     if cover_art_path:
-        import os
-
         if not os.path.isfile(cover_art_path):
             errors.append(
                 ValidationError("cover_art", f"Cover art file not found: {cover_art_path}")
@@ -5,17 +5,31 @@ Provides DuckDuckGo web search and HTML content fetching for the
 Lore Discovery tab.  No API keys required.
 """
 
+import codecs
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from html.parser import HTMLParser
-from typing import Optional
+from typing import Callable, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 try:
     from ddgs import DDGS
 except ImportError:
     from duckduckgo_search import DDGS
 
+try:
+    from lxml import etree as _etree
+    from lxml import html as _lxml_html
+except ImportError:
+    _etree = _lxml_html = None
+
 
 # ---------------------------------------------------------------------------
 # Exceptions
@@ -25,27 +39,95 @@ class WebSearchError(Exception):
     """Raised when a web search or page fetch fails."""
 
 
+# ---------------------------------------------------------------------------
+# HTTP session
+# ---------------------------------------------------------------------------
+
+_USER_AGENT = "Mozilla/5.0 (compatible; SongFactory/1.0)"
+
+
+# Transient failures worth one or two quick retries before giving up.
+# Read timeouts are not retried (each would cost a full fetch timeout),
+# and a server's Retry-After is ignored so it cannot stall the pool.
+_RETRY = Retry(
+    total=2,
+    read=0,
+    backoff_factor=0.3,
+    status_forcelist=(500, 502, 503, 504),
+    allowed_methods=frozenset({"GET", "HEAD"}),
+    respect_retry_after_header=False,
+    raise_on_status=False,
+)
+
+
+def _make_session() -> requests.Session:
+    """Build the shared session used for page fetches.
+
+    Reusing one session keeps connections alive between fetches, so
+    repeat requests to a host skip the DNS lookup and TLS handshake.  The
+    pool is sized for the Lore Discovery tab's concurrent fetches, and
+    connection errors and busy/5xx responses are retried with backoff.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=_RETRY)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        "User-Agent": _USER_AGENT,
+        "Accept": "text/html,application/xhtml+xml;q=0.9,text/plain;q=0.8",
+        "Accept-Language": "en-US,en;q=0.8",
+    })
+    return session
+
+
+_SESSION = _make_session()
+
+
+# ---------------------------------------------------------------------------
+# Fetch cache
+# ---------------------------------------------------------------------------
+
+# Maximum number of fetched pages kept in memory by fetch_content_cached().
+_FETCH_CACHE_SIZE = 256
+
+_fetch_cache: "OrderedDict[str, str]" = OrderedDict()
+_fetch_inflight: dict[str, Future] = {}
+_fetch_lock = threading.Lock()
+
+
 # ---------------------------------------------------------------------------
 # Data
 # ---------------------------------------------------------------------------
 
-@dataclass
+# Length of SearchResult.snippet_short, the snippet shown in result lists.
+_SNIPPET_SHORT_CHARS = 200
+
+
+@dataclass(slots=True)
 class SearchResult:
     """A single search result from DuckDuckGo."""
     title: str
     url: str
     snippet: str
     body: str = ""
+    snippet_short: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.snippet_short = self.snippet[:_SNIPPET_SHORT_CHARS]
 
 
 # ---------------------------------------------------------------------------
-# HTML stripping (stdlib only)
+# HTML stripping
 # ---------------------------------------------------------------------------
 
+# Elements whose text is never page content.
+_SKIP_TAGS = frozenset({"script", "style", "nav", "header", "footer", "noscript", "svg"})
+
+
 class _HTMLTextExtractor(HTMLParser):
     """Simple HTML-to-text extractor that skips script/style/nav tags."""
 
-    _SKIP_TAGS = {"script", "style", "nav", "header", "footer", "noscript", "svg"}
+    _SKIP_TAGS = _SKIP_TAGS
 
     def __init__(self):
         super().__init__()
@@ -71,7 +153,28 @@ class _HTMLTextExtractor(HTMLParser):
 
 
 def _strip_html(html: str) -> str:
-    """Strip HTML tags and return plain text."""
+    """Strip HTML tags and return plain text.
+
+    Uses lxml's C parser when it is installed (it comes with the
+    DuckDuckGo search package) and the stdlib extractor otherwise, or
+    when lxml rejects the document.  Both return the same text: one
+    stripped line per text node, skipping ``_SKIP_TAGS`` and comments.
+    """
+    if _lxml_html is not None:
+        try:
+            doc = _lxml_html.document_fromstring(html)
+        except (ValueError, _etree.LxmlError):
+            pass
+        else:
+            _etree.strip_elements(
+                doc, *_SKIP_TAGS, _etree.Comment, _etree.ProcessingInstruction,
+                with_tail=False,
+            )
+            return "\n".join(
+                text for text in (piece.strip() for piece in doc.itertext())
+                if text
+            )
+
     extractor = _HTMLTextExtractor()
     try:
         extractor.feed(html)
@@ -80,6 +183,80 @@ def _strip_html(html: str) -> str:
     return extractor.get_text()
 
 
+# ---------------------------------------------------------------------------
+# URL normalization
+# ---------------------------------------------------------------------------
+
+# Query parameters that only track clicks and never change the page.
+_TRACKING_PARAMS = frozenset({"fbclid", "gclid", "msclkid", "mc_cid", "mc_eid"})
+
+
+def normalize_url(url: str) -> str:
+    """Return a canonical form of *url* for duplicate detection.
+
+    Lowercases the scheme and host, drops ``utm_*`` and other tracking
+    query parameters, the fragment, and any trailing slash on the path.
+    """
+    parts = urlsplit(url.strip())
+    query = urlencode([
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in _TRACKING_PARAMS
+    ])
+    return urlunsplit((
+        parts.scheme.lower(),
+        parts.netloc.lower(),
+        parts.path.rstrip("/"),
+        query,
+        "",
+    ))
+
+
+def dedupe_results(results: list[SearchResult]) -> list[SearchResult]:
+    """Drop results whose URL normalizes to one already seen, keeping order."""
+    seen = set()
+    unique = []
+    for result in results:
+        key = normalize_url(result.url)
+        if key in seen:
+            continue
+        seen.add(key)
+        unique.append(result)
+    return unique
+
+
+# ---------------------------------------------------------------------------
+# Page decoding
+# ---------------------------------------------------------------------------
+
+# Bytes of HTML read per character of text wanted.  Markup, inline
+# scripts and styles typically outweigh the visible text many times over.
+_HTML_BYTES_PER_CHAR = 16
+
+_TEXT_CONTENT_TYPES = frozenset({"text/html", "application/xhtml+xml", "text/plain"})
+
+_CHARSET_RE = re.compile(r"charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+
+
+def _decode_page(raw: bytes, encoding: Optional[str]) -> str:
+    """Decode page bytes using the declared *encoding*, else UTF-8.
+
+    An incremental decoder is used so that a multi-byte character cut in
+    half by the read cap is dropped instead of failing the decode.
+    Undeclared pages that are not valid UTF-8 are read as cp1252.
+    """
+    if encoding:
+        try:
+            decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        except LookupError:
+            pass
+        else:
+            return decoder.decode(raw)
+    try:
+        return codecs.getincrementaldecoder("utf-8")().decode(raw)
+    except UnicodeDecodeError:
+        return raw.decode("cp1252", errors="replace")
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -92,7 +269,7 @@ def search(query: str, max_results: int = 10) -> list[SearchResult]:
         max_results: Maximum number of results to return.
 
     Returns:
-        List of SearchResult objects.
+        List of SearchResult objects, with duplicate URLs removed.
 
     Raises:
         WebSearchError: If the search fails.
@@ -110,12 +287,18 @@ def search(query: str, max_results: int = 10) -> list[SearchResult]:
             url=item.get("href", ""),
             snippet=item.get("body", ""),
         ))
-    return results
+    return dedupe_results(results)
 
 
 def fetch_content(url: str, timeout: int = 15, max_chars: int = 15000) -> str:
     """Fetch a web page and return its text content.
 
+    The body is streamed and only the first ``max_chars *
+    _HTML_BYTES_PER_CHAR`` bytes are read, so a huge page costs no more
+    to download and parse than a large one.  Responses that are not
+    HTML or plain text (PDFs, images, ...) are rejected before any of
+    the body is read.
+
     Args:
         url: The URL to fetch.
         timeout: Request timeout in seconds.
@@ -125,19 +308,119 @@ def fetch_content(url: str, timeout: int = 15, max_chars: int = 15000) -> str:
         Plain text extracted from the page HTML.
 
     Raises:
-        WebSearchError: If the fetch fails.
+        WebSearchError: If the fetch fails or the page is not text.
     """
     try:
-        resp = requests.get(
-            url,
-            timeout=timeout,
-            headers={"User-Agent": "Mozilla/5.0 (compatible; SongFactory/1.0)"},
-        )
-        resp.raise_for_status()
+        resp = _SESSION.get(url, timeout=timeout, stream=True)
+        try:
+            resp.raise_for_status()
+            content_type = resp.headers.get("Content-Type", "")
+            mime = content_type.partition(";")[0].strip().lower()
+            if mime and mime not in _TEXT_CONTENT_TYPES:
+                raise WebSearchError(f"Not a web page ({mime}): {url}")
+            raw = resp.raw.read(max_chars * _HTML_BYTES_PER_CHAR, decode_content=True)
+        finally:
+            resp.close()
+    except WebSearchError:
+        raise
     except Exception as exc:
         raise WebSearchError(f"Failed to fetch {url}: {exc}") from exc
 
-    text = _strip_html(resp.text)
+    match = _CHARSET_RE.search(content_type)
+    text = _strip_html(_decode_page(raw, match.group(1) if match else None))
     if len(text) > max_chars:
         text = text[:max_chars]
     return text
+
+
+def fetch_many(urls: list[str], timeout: int = 15, max_chars: int = 15000,
+               workers: int = 8,
+               fetch: Optional[Callable[[str], str]] = None,
+               on_result: Optional[Callable[[str, str], None]] = None,
+               ) -> list[str]:
+    """Fetch several pages concurrently.
+
+    Page fetches spend nearly all their time waiting on the network, so
+    a small thread pool brings the total wait close to that of the
+    slowest page instead of the sum of all of them.
+
+    Args:
+        urls: The URLs to fetch.
+        timeout: Per-request timeout in seconds.
+        max_chars: Maximum characters to return per page.
+        workers: Maximum number of concurrent fetches.
+        fetch: Called with each URL to download it; defaults to
+            fetch_content() with *timeout* and *max_chars*.  It should
+            raise WebSearchError on failure.
+        on_result: Called as ``on_result(url, text)`` in the calling
+            thread as each page finishes, in completion order.
+
+    Returns:
+        The text of each page, in the same order as *urls*.  Pages that
+        fail to download are returned as empty strings.
+    """
+    if not urls:
+        return []
+    if fetch is None:
+        def fetch(url: str) -> str:
+            return fetch_content(url, timeout=timeout, max_chars=max_chars)
+
+    texts = [""] * len(urls)
+    with ThreadPoolExecutor(max_workers=min(workers, len(urls))) as pool:
+        futures = {pool.submit(fetch, url): i for i, url in enumerate(urls)}
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                texts[i] = future.result()
+            except WebSearchError:
+                pass
+            if on_result is not None:
+                on_result(urls[i], texts[i])
+    return texts
+
+
+def fetch_content_cached(url: str) -> str:
+    """Like fetch_content(), but cached and coalesced per URL.
+
+    Successful fetches are kept in a small in-memory LRU cache.  When
+    several threads ask for the same URL at once, only the first one
+    downloads it and the others wait for and share its result.  Failures
+    are not cached.
+
+    Raises:
+        WebSearchError: If the fetch fails.
+    """
+    with _fetch_lock:
+        if url in _fetch_cache:
+            _fetch_cache.move_to_end(url)
+            return _fetch_cache[url]
+        future = _fetch_inflight.get(url)
+        owner = future is None
+        if owner:
+            future = Future()
+            _fetch_inflight[url] = future
+
+    if not owner:
+        return future.result()
+
+    try:
+        text = fetch_content(url)
+    except Exception as exc:
+        future.set_exception(exc)
+        raise
+    else:
+        with _fetch_lock:
+            _fetch_cache[url] = text
+            if len(_fetch_cache) > _FETCH_CACHE_SIZE:
+                _fetch_cache.popitem(last=False)
+        future.set_result(text)
+        return text
+    finally:
+        with _fetch_lock:
+            _fetch_inflight.pop(url, None)
+
+
+def clear_fetch_cache() -> None:
+    """Drop every page held by fetch_content_cached()."""
+    with _fetch_lock:
+        _fetch_cache.clear()
@@ -23,23 +23,45 @@ class StatusBadge(QLabel):
                    Defaults to ``Theme.STATUS_COLORS``.
     """
 
+    # Stylesheet per background color, shared by every badge
+    _STYLE_CACHE: dict[str, str] = {}
+
     def __init__(self, status: str = "", color_map: dict = None, parent=None):
         super().__init__(parent)
         self._color_map = color_map or Theme.STATUS_COLORS
+        self.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.set_status(status)
 
+    @classmethod
+    def _style_for(cls, color: str) -> str:
+        """Return the badge stylesheet for *color*, building it on first use."""
+        style = cls._STYLE_CACHE.get(color)
+        if style is None:
+            style = cls._STYLE_CACHE[color] = (
+                f"QLabel {{"
+                f"  background-color: {color};"
+                f"  color: white;"
+                f"  padding: 2px 8px;"
+                f"  border-radius: 3px;"
+                f"  font-size: 11px;"
+                f"  font-weight: bold;"
+                f"}}"
+            )
+        return style
+
     def set_status(self, status: str) -> None:
         """Update the displayed status and color."""
         self.setText(status.capitalize())
-        color = self._color_map.get(status, Theme.DIMMED)
-        self.setStyleSheet(
-            f"QLabel {{"
-            f"  background-color: {color};"
-            f"  color: white;"
-            f"  padding: 2px 8px;"
-            f"  border-radius: 3px;"
-            f"  font-size: 11px;"
-            f"  font-weight: bold;"
-            f"}}"
-        )
-        self.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        style = self._style_for(self._color_map.get(status, Theme.DIMMED))
+        # Re-applying an identical stylesheet still makes Qt re-polish
+        if style != self.styleSheet():
+            self.setStyleSheet(style)
+
+
+for _color in (
+    *Theme.STATUS_COLORS.values(),
+    *Theme.DIST_STATUS_COLORS.values(),
+    Theme.DIMMED,
+):
+    StatusBadge._style_for(_color)
+del _color
@@ -5,11 +5,35 @@ flow layout. Limits display to 4 visible chips with a "+N" overflow
 indicator.
 """
 
+from functools import lru_cache
+
 from PyQt6.QtWidgets import QWidget, QHBoxLayout, QLabel, QSizePolicy
 
 
 _MAX_VISIBLE = 4
 
+_OVERFLOW_STYLE = (
+    "color: #AAAAAA;"
+    "font-size: 10px;"
+    "font-weight: bold;"
+    "padding: 1px 4px;"
+)
+
+
+@lru_cache(maxsize=256)
+def _chip_style(color: str) -> str:
+    """Return the chip stylesheet for a tag *color*, built once per color."""
+    # Pick foreground based on color brightness
+    fg = TagChipsWidget._foreground_for(color)
+    return (
+        f"background-color: {color};"
+        f"color: {fg};"
+        "border-radius: 3px;"
+        "padding: 1px 6px;"
+        "font-size: 10px;"
+        "font-weight: bold;"
+    )
+
 
 class TagChipsWidget(QWidget):
     """Displays a row of colored tag chips for use in table cells."""
@@ -25,35 +49,21 @@ class TagChipsWidget(QWidget):
 
         for tag in visible:
             chip = QLabel(tag.get("name", ""))
-            color = tag.get("color", "#888888")
-            # Pick foreground based on color brightness
-            fg = self._foreground_for(color)
-            chip.setStyleSheet(
-                f"background-color: {color};"
-                f"color: {fg};"
-                "border-radius: 3px;"
-                "padding: 1px 6px;"
-                "font-size: 10px;"
-                "font-weight: bold;"
-            )
+            chip.setStyleSheet(_chip_style(tag.get("color", "#888888")))
             chip.setSizePolicy(QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Fixed)
             chip.setFixedHeight(18)
             layout.addWidget(chip)
 
         if overflow > 0:
             more = QLabel(f"+{overflow}")
-            more.setStyleSheet(
-                "color: #AAAAAA;"
-                "font-size: 10px;"
-                "font-weight: bold;"
-                "padding: 1px 4px;"
-            )
+            more.setStyleSheet(_OVERFLOW_STYLE)
             more.setFixedHeight(18)
             layout.addWidget(more)
 
         layout.addStretch()
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def _foreground_for(hex_color: str) -> str:
         """Return black or white foreground depending on background brightness."""
         try:
@@ -14,6 +14,34 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "songfactory"))
 os.environ["QT_QPA_PLATFORM"] = "offscreen"
 
 
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "durable_db: keep the production synchronous pragma for this test",
+    )
+
+
+@pytest.fixture(autouse=True)
+def _fast_sqlite(request, monkeypatch):
+    """Open test databases with ``synchronous=OFF``.
+
+    Test databases are thrown away, so there is no point waiting for
+    the disk; tests marked ``durable_db`` keep the real setting.
+    """
+    if request.node.get_closest_marker("durable_db"):
+        return
+    from database import Database
+
+    connect = Database._connect
+
+    def _connect(self):
+        conn = connect(self)
+        conn.execute("PRAGMA synchronous=OFF;")
+        return conn
+
+    monkeypatch.setattr(Database, "_connect", _connect)
+
+
 @pytest.fixture(scope="session")
 def qt_app():
     """Create a single QApplication instance for the entire test session."""
@@ -38,39 +66,41 @@ def seeded_db(temp_db):
     """Provide a Database pre-populated with seed genres, lore, and songs."""
     from seed_data import SEED_GENRES, SEED_LORE, SEED_SONGS
 
-    for genre in SEED_GENRES:
-        temp_db.add_genre(
-            name=genre["name"],
-            prompt_template=genre["prompt_template"],
-            description=genre.get("description", ""),
-            bpm_range=genre.get("bpm_range", ""),
-            active=genre.get("active", True),
-        )
-    for lore in SEED_LORE:
-        temp_db.add_lore(
-            title=lore["title"],
-            content=lore["content"],
-            category=lore.get("category", "general"),
-            active=lore.get("active", True),
-        )
-    genres = temp_db.get_all_genres()
-    genre_map = {}
-    for g in genres:
-        genre_map[g["name"].upper()] = g["id"]
-
-    for song in SEED_SONGS:
-        genre_id = None
-        label = song.get("genre_label", "")
-        for gname, gid in genre_map.items():
-            if gname in label.upper():
-                genre_id = gid
-                break
-        temp_db.add_song(
-            title=song["title"],
-            genre_id=genre_id,
-            genre_label=song.get("genre_label", ""),
-            prompt=song.get("prompt", ""),
-            lyrics=song.get("lyrics", ""),
-            status=song.get("status", "completed"),
-        )
+    # One commit for the whole seed set
+    with temp_db.transaction():
+        for genre in SEED_GENRES:
+            temp_db.add_genre(
+                name=genre["name"],
+                prompt_template=genre["prompt_template"],
+                description=genre.get("description", ""),
+                bpm_range=genre.get("bpm_range", ""),
+                active=genre.get("active", True),
+            )
+        for lore in SEED_LORE:
+            temp_db.add_lore(
+                title=lore["title"],
+                content=lore["content"],
+                category=lore.get("category", "general"),
+                active=lore.get("active", True),
+            )
+        genres = temp_db.get_all_genres()
+        genre_map = {}
+        for g in genres:
+            genre_map[g["name"].upper()] = g["id"]
+
+        for song in SEED_SONGS:
+            genre_id = None
+            label = song.get("genre_label", "")
+            for gname, gid in genre_map.items():
+                if gname in label.upper():
+                    genre_id = gid
+                    break
+            temp_db.add_song(
+                title=song["title"],
+                genre_id=genre_id,
+                genre_label=song.get("genre_label", ""),
+                prompt=song.get("prompt", ""),
+                lyrics=song.get("lyrics", ""),
+                status=song.get("status", "completed"),
+            )
     yield temp_db
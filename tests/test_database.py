@@ -34,6 +34,26 @@ class TestSchemaVersioning:
         issues = temp_db._conn.execute("PRAGMA foreign_key_check").fetchall()
         assert len(issues) == 0
 
+    def test_assume_migrated_skips_schema_setup(self, tmp_path):
+        from database import Database
+        path = str(tmp_path / "bare.db")
+        db = Database(db_path=path, assume_migrated=True)
+        assert db._conn.execute("PRAGMA user_version").fetchone()[0] == 0
+        assert db._conn.execute(
+            "SELECT COUNT(*) FROM sqlite_master WHERE type='table'"
+        ).fetchone()[0] == 0
+        db.close()
+
+    def test_assume_migrated_reopens_existing_db(self, tmp_path):
+        from database import Database
+        path = str(tmp_path / "existing.db")
+        db = Database(db_path=path)
+        db.add_genre("Test", "template")
+        db.close()
+        db = Database(db_path=path, assume_migrated=True)
+        assert [g["name"] for g in db.get_all_genres()] == ["Test"]
+        db.close()
+
 
 class TestForeignKeyBehavior:
     """F-003: FK cascade and SET NULL."""
@@ -87,6 +107,26 @@ class TestLoreCRUD:
         assert temp_db.get_lore(ids[0])["active"] == 1
         assert temp_db.get_lore(ids[2])["active"] == 0
 
+    def test_add_lore_bulk(self, temp_db):
+        added = temp_db.add_lore_bulk([
+            {"title": "A", "content": "C1", "category": "places"},
+            {"title": "B", "content": "C2", "active": False},
+        ])
+        assert added == 2
+        by_title = {l["title"]: l for l in temp_db.get_all_lore()}
+        assert by_title["A"]["category"] == "places"
+        assert by_title["B"]["category"] == "general"
+        assert by_title["B"]["active"] == 0
+        assert temp_db.add_lore_bulk([]) == 0
+
+    def test_category_active_stats(self, temp_db):
+        temp_db.add_lore("A", "C", "places", active=True)
+        temp_db.add_lore("B", "C", "places", active=False)
+        temp_db.add_lore("C", "C", "places", active=True)
+        temp_db.add_lore("D", "C", "people", active=True)
+        assert temp_db.get_category_active_stats("places") == (2, 3)
+        assert temp_db.get_category_active_stats("events") == (0, 0)
+
     def test_get_active_lore(self, temp_db):
         temp_db.add_lore("Active", "C", active=True)
         temp_db.add_lore("Inactive", "C", active=False)
@@ -166,6 +206,45 @@ class TestSongCRUD:
         temp_db.add_song("B", gid, "G", "p", "l")
         assert temp_db.get_song_count() == 2
 
+    def test_get_songs_for_picker(self, temp_db):
+        with_audio = temp_db.add_song("Song", None, "Folk", "p", "river lyrics")
+        temp_db.update_song(with_audio, file_path_1="/music/song.mp3")
+        temp_db.add_song("No Audio", None, "Folk", "p", "l")
+
+        songs = temp_db.get_songs_for_picker()
+        assert [s["id"] for s in songs] == [with_audio]
+        assert "lyrics" not in songs[0]
+        assert songs[0]["search_text"] == "Song\x1fFolk\x1friver lyrics"
+
+    def test_get_songs_for_picker_sorted_by_title(self, temp_db):
+        for title, genre in [("beta", "Rock"), ("Alpha", "Pop"), ("beta", "Folk")]:
+            sid = temp_db.add_song(title, None, genre, "p", "l")
+            temp_db.update_song(sid, file_path_1=f"/music/{title}.mp3")
+
+        songs = temp_db.get_songs_for_picker()
+        assert [(s["title"], s["genre_label"]) for s in songs] == [
+            ("Alpha", "Pop"), ("beta", "Folk"), ("beta", "Rock"),
+        ]
+
+    def test_get_all_songs_cache_sees_writes(self, temp_db, tmp_path):
+        from database import Database
+
+        gid = temp_db.add_genre("G", "t")
+        sid = temp_db.add_song("A", gid, "G", "p", "l")
+        first = temp_db.get_all_songs()
+        first[0]["title"] = "mutated"
+        assert temp_db.get_all_songs()[0]["title"] == "A"
+
+        temp_db.update_song(sid, title="B")
+        assert temp_db.get_all_songs()[0]["title"] == "B"
+
+        other = Database(db_path=str(tmp_path / "test.db"))
+        try:
+            other.add_song("C", gid, "G", "p", "l")
+        finally:
+            other.close()
+        assert {s["title"] for s in temp_db.get_all_songs()} == {"B", "C"}
+
 
 class TestConfigCRUD:
     def test_set_and_get_config(self, temp_db):
@@ -188,6 +267,21 @@ class TestConfigCRUD:
         assert cfg["a"] == "1"
         assert cfg["b"] == "2"
 
+    def test_bool_config(self, temp_db):
+        assert temp_db.get_bool("flag") is False
+        assert temp_db.get_bool("flag", True) is True
+        temp_db.set_bool("flag", True)
+        assert temp_db.get_config("flag") == "true"
+        assert temp_db.get_bool("flag") is True
+        temp_db.set_config("flag", "FALSE")
+        assert temp_db.get_bool("flag", True) is False
+
+    def test_set_configs(self, temp_db):
+        temp_db.set_config("a", "old")
+        temp_db.set_configs({"a": "1", "b": "2"})
+        assert temp_db.get_config("a") == "1"
+        assert temp_db.get_config("b") == "2"
+
 
 class TestCDProjectCRUD:
     def test_add_and_get_project(self, temp_db):
@@ -272,6 +366,34 @@ class TestLorePresets:
         assert temp_db.get_lore(l3)["active"] == 1
 
 
+class TestLoreSummaryCache:
+    def test_put_and_get(self, temp_db):
+        summary = {"title": "T", "content": "C", "category": "places",
+                   "source_url": "https://example.com"}
+        temp_db.put_cached_summary("abc", "places", summary)
+        assert temp_db.get_cached_summary("abc", max_age_s=60) == summary
+
+    def test_missing_and_stale(self, temp_db):
+        assert temp_db.get_cached_summary("nope", max_age_s=60) is None
+        temp_db.put_cached_summary("old", "places", {"title": "T"})
+        temp_db._conn.execute("UPDATE lore_summary_cache SET ts = 0;")
+        assert temp_db.get_cached_summary("old", max_age_s=60) is None
+
+
+class TestSearchCache:
+    def test_put_and_get_ignores_query_case(self, temp_db):
+        results = [{"title": "T", "url": "https://example.com",
+                    "snippet": "S", "body": ""}]
+        temp_db.put_search_cache("Yakima History", 10, results)
+        assert temp_db.get_search_cache("yakima history ", 10, max_age_s=60) == results
+        assert temp_db.get_search_cache("yakima history", 20, max_age_s=60) is None
+
+    def test_stale_entry_is_ignored(self, temp_db):
+        temp_db.put_search_cache("q", 10, [])
+        temp_db._conn.execute("UPDATE search_cache SET ts = 0;")
+        assert temp_db.get_search_cache("q", 10, max_age_s=60) is None
+
+
 class TestBackupRestore:
     def test_backup_and_restore(self, temp_db, tmp_path):
         gid = temp_db.add_genre("G", "t")
@@ -286,6 +408,40 @@ class TestBackupRestore:
         song = temp_db.get_song(sid)
         assert song["title"] == "Original"
 
+    def test_backup_checkpoints_wal(self, temp_db, tmp_path):
+        import os
+
+        temp_db.add_song("Song", None, "G", "p", "l")
+        temp_db.backup_to(str(tmp_path / "backups"))
+        assert os.path.getsize(temp_db._db_path + "-wal") == 0
+
+    def test_restore_rejects_invalid_backup(self, temp_db, tmp_path):
+        sid = temp_db.add_song("Keep", None, "G", "p", "l")
+        garbage = tmp_path / "garbage.db"
+        garbage.write_bytes(b"not a database" * 100)
+        unrelated = tmp_path / "unrelated.db"
+        sqlite3.connect(unrelated).execute("CREATE TABLE t (x);").connection.close()
+
+        for path in (garbage, unrelated):
+            with pytest.raises(ValueError):
+                temp_db.restore_from(str(path))
+        assert temp_db.get_song(sid)["title"] == "Keep"
+
+    def test_check_backup_in_read_only_folder(self, temp_db, tmp_path):
+        import os
+        import stat
+        from database import Database
+
+        temp_db.add_song("Song", None, "G", "p", "l")
+        folder = tmp_path / "backups"
+        backup_path = temp_db.backup_to(str(folder))
+        folder.chmod(stat.S_IRUSR | stat.S_IXUSR)
+        try:
+            Database._check_backup(backup_path)
+            assert os.listdir(folder) == [os.path.basename(backup_path)]
+        finally:
+            folder.chmod(stat.S_IRWXU)
+
     def test_detect_backups(self, temp_db, tmp_path):
         backup_dir = str(tmp_path / "backups")
         temp_db.backup_to(backup_dir)
@@ -293,6 +449,19 @@ class TestBackupRestore:
         assert len(backups) == 1
         assert "songfactory_backup_" in backups[0]["filename"]
 
+    def test_detect_backups_reads_date_from_filename(self, tmp_path):
+        from database import Database
+
+        (tmp_path / "songfactory_backup_20260208_143022.db").write_bytes(b"x")
+        (tmp_path / "songfactory_backup_manual.db").write_bytes(b"xy")
+        (tmp_path / "other.db").write_bytes(b"")
+
+        backups = Database.detect_backups(str(tmp_path))
+        assert [(b["filename"], b["date"], b["size"]) for b in backups] == [
+            ("songfactory_backup_manual.db", "Unknown", 2),
+            ("songfactory_backup_20260208_143022.db", "2026-02-08 14:30:22", 1),
+        ]
+
 
 class TestDbPathOverride:
     def test_custom_db_path(self, tmp_path):
@@ -303,3 +472,46 @@ class TestDbPathOverride:
         db.add_genre("Test", "template")
         assert len(db.get_all_genres()) == 1
         db.close()
+
+
+class TestTransaction:
+    def test_writes_commit_together(self, temp_db):
+        with temp_db.transaction():
+            temp_db.add_genre("G", "t")
+            temp_db.set_config("k", "v")
+            temp_db.add_artist("Side Project")
+            assert temp_db._conn.in_transaction
+        assert not temp_db._conn.in_transaction
+        assert temp_db.get_config("k") == "v"
+
+    def test_error_rolls_back_everything(self, temp_db):
+        with pytest.raises(RuntimeError):
+            with temp_db.transaction():
+                temp_db.set_config("k", "v")
+                with temp_db.transaction():
+                    temp_db.add_genre("G", "t")
+                raise RuntimeError("boom")
+        assert temp_db.get_config("k") is None
+        assert temp_db.get_all_genres() == []
+
+    def test_rollback_drops_cached_songs(self, temp_db):
+        with pytest.raises(RuntimeError):
+            with temp_db.transaction():
+                temp_db.add_song("Ghost", None, "G", "p", "l")
+                assert [s["title"] for s in temp_db.get_all_songs()] == ["Ghost"]
+                raise RuntimeError("boom")
+        assert temp_db.get_all_songs() == []
+
+
+class TestConnectionPragmas:
+    @pytest.mark.durable_db
+    def test_wal_and_normal_sync(self, temp_db):
+        conn = temp_db._conn
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+        assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+    def test_cache_and_mmap_sizes(self, temp_db):
+        conn = temp_db._conn
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -40000
+        assert conn.execute("PRAGMA mmap_size").fetchone()[0] == 268435456
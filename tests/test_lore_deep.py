@@ -216,6 +216,19 @@ class TestLoreEditorSave:
         from PyQt6.QtCore import Qt
         assert current.data(Qt.ItemDataRole.UserRole) == original_id
 
+    def test_save_current_updates_item_in_place(self, lore_tab):
+        """save_current should edit the existing list item, not rebuild the list."""
+        item = lore_tab.lore_list.item(0)
+        lore_tab.lore_list.setCurrentItem(item)
+        lore_tab.title_edit.setText("In Place Title")
+
+        with patch.object(lore_tab, "load_lore_list") as mock_load:
+            lore_tab.save_current()
+
+        mock_load.assert_not_called()
+        assert lore_tab.lore_list.item(0) is item
+        assert item.text().startswith("In Place Title")
+
 
 # =====================================================================
 # Lore Editor Tab — Add / Delete
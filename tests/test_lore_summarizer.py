@@ -0,0 +1,30 @@
+"""Tests for lore_summarizer content preprocessing."""
+
+from lore_summarizer import preprocess_content
+
+
+def test_short_text_only_collapses_whitespace():
+    assert preprocess_content("Hello   world.\n\n Second  line.") == (
+        "Hello world. Second line."
+    )
+
+
+def test_long_text_fits_budget():
+    text = " ".join(f"Sentence number {i} is filler text here." for i in range(500))
+    out = preprocess_content(text, "filler", max_chars=1000)
+    assert 0 < len(out) <= 1000
+
+
+def test_title_relevant_sentences_are_kept_in_order():
+    filler = " ".join(
+        f"Unrelated padding sentence number {i} goes here." for i in range(200)
+    )
+    text = (
+        "The Capitol Theatre opened in Yakima in 1920. "
+        + filler
+        + " The Capitol Theatre was restored after a fire in 1975."
+    )
+    out = preprocess_content(text, "Capitol Theatre Yakima", max_chars=110)
+    assert out.startswith("The Capitol Theatre opened in Yakima in 1920.")
+    assert "restored after a fire" in out
+    assert "padding" not in out
@@ -108,3 +108,128 @@ class TestBaseTabContract:
             assert hasattr(tab, "register_worker")
             assert hasattr(tab, "show_error")
             assert hasattr(tab, "confirm")
+
+
+class TestSongPickerDialog:
+    """The song picker lists only songs whose audio file exists."""
+
+    def test_lists_songs_with_audio(self, qt_app, db, tmp_path):
+        from tabs.song_picker_dialog import SongPickerDialog
+
+        audio = tmp_path / "song.mp3"
+        audio.write_bytes(b"")
+        with_audio = db.add_song("Harbor Lights", None, "Folk", "", "")
+        db.update_song(with_audio, file_path_1=str(audio), duration_seconds=125)
+        db.add_song("No Audio", None, "Folk", "", "")
+
+        dialog = SongPickerDialog(db)
+        qt_app.processEvents()  # songs load on the first event-loop pass
+        model = dialog.model
+        assert model.rowCount() == 1
+        assert model.data(model.index(0, 0)) == "Harbor Lights"
+        assert model.data(model.index(0, 2)) == "2:05"
+        assert model.data(model.index(0, 3)) == ".MP3"
+
+        dialog.table.selectRow(0)
+        dialog._on_add()
+        assert [s["id"] for s in dialog.get_selected_songs()] == [with_audio]
+
+    def test_search_filters_title_genre_and_lyrics(self, qt_app, db, tmp_path):
+        from tabs.song_picker_dialog import SongPickerDialog
+
+        for n, (title, genre, lyrics) in enumerate([
+            ("Harbor Lights", "Folk", "down by the water"),
+            ("Orchard Road", "Country", "apples in the fall"),
+        ]):
+            audio = tmp_path / f"{n}.wav"
+            audio.write_bytes(b"")
+            song_id = db.add_song(title, None, genre, "", lyrics)
+            db.update_song(song_id, file_path_1=str(audio))
+
+        dialog = SongPickerDialog(db)
+        qt_app.processEvents()  # songs load on the first event-loop pass
+        for query, expected in [
+            ("harbor", ["Harbor Lights"]),
+            ("COUNTRY", ["Orchard Road"]),
+            ("apples", ["Orchard Road"]),
+            ("or", ["Harbor Lights", "Orchard Road"]),
+            ("orc", ["Orchard Road"]),
+            ("or", ["Harbor Lights", "Orchard Road"]),
+            ("", ["Harbor Lights", "Orchard Road"]),
+        ]:
+            dialog.search_box.setText(query)
+            dialog._apply_filter()
+            titles = sorted(s["title"] for s in dialog._filtered_songs)
+            assert titles == expected
+
+    def test_existing_paths(self, tmp_path):
+        from tabs.song_picker_dialog import _existing_paths
+
+        (tmp_path / "a.mp3").write_bytes(b"")
+        sub = tmp_path / "sub"
+        sub.mkdir()
+        (sub / "b.wav").write_bytes(b"")
+        paths = [
+            str(tmp_path / "a.mp3"),
+            str(sub / "b.wav"),
+            str(sub / "missing.wav"),
+            str(tmp_path / "gone" / "c.mp3"),
+        ]
+        assert _existing_paths(paths) == set(paths[:2])
+
+    def test_show_more_pages_results(self, qt_app, db, tmp_path, monkeypatch):
+        import tabs.song_picker_dialog as picker
+
+        monkeypatch.setattr(picker, "_PAGE_SIZE", 2)
+        for n in range(5):
+            audio = tmp_path / f"{n}.mp3"
+            audio.write_bytes(b"")
+            song_id = db.add_song(f"Song {n}", None, "Folk", "", "")
+            db.update_song(song_id, file_path_1=str(audio))
+
+        dialog = picker.SongPickerDialog(db)
+        qt_app.processEvents()  # songs load on the first event-loop pass
+        assert dialog.model.rowCount() == 2
+        assert "2/5 shown" in dialog.count_label.text()
+
+        dialog.table.selectRow(0)
+        dialog._show_more()
+        dialog._show_more()
+        assert dialog.model.rowCount() == 5
+        assert "shown" not in dialog.count_label.text()
+        assert len(dialog.table.selectionModel().selectedRows()) == 1
+
+
+class TestSettingsSave:
+    """Save writes what the form shows, even after the config table changed."""
+
+    def test_save_after_bundle_import(self, qt_app, db, tmp_path, monkeypatch):
+        from types import SimpleNamespace
+        from database import Database
+        from export_import import export_personal_bundle
+        import tabs.settings as settings
+
+        monkeypatch.setattr(settings, "QMessageBox", SimpleNamespace(
+            information=lambda *a: None,
+            warning=lambda *a: None,
+            critical=lambda *a: pytest.fail(a[-1]),
+        ))
+        # Keep the (blank) API keys out of the real system keyring
+        monkeypatch.setattr(settings, "set_secret", lambda *a, **k: None)
+        tab = settings.SettingsTab(db)
+        tab.sync_folder_edit.setText(str(tmp_path))
+        tab.download_dir_edit.setText(str(tmp_path))
+        tab.save_settings()
+        model = tab.model_combo.itemData(tab.model_combo.count() - 1)
+
+        other = Database(db_path=str(tmp_path / "other.db"))
+        other.set_configs({"ai_model": model, "dk_artist": "Bundle Artist"})
+        export_personal_bundle(other, str(tmp_path / tab._BUNDLE_FILENAME))
+        other.close()
+
+        tab._import_bundle_now()
+        assert tab.dk_artist_edit.text() == "Bundle Artist"
+        tab.dk_artist_edit.setText("Form Artist")
+        tab.save_settings()
+        assert db.get_config("ai_model") == tab.model_combo.currentData() == model
+        assert db.get_config("dk_artist") == "Form Artist"
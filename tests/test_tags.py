@@ -11,7 +11,7 @@ class TestTagsSchemaV5:
         from database import _SCHEMA_VERSION
         ver = temp_db._conn.execute("PRAGMA user_version").fetchone()[0]
         assert ver == _SCHEMA_VERSION
-        assert _SCHEMA_VERSION == 5
+        assert _SCHEMA_VERSION >= 5
 
     def test_tags_table_exists(self, temp_db):
         rows = temp_db._conn.execute(
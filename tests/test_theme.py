@@ -48,3 +48,8 @@ def test_panel_style():
     style = Theme.panel_style()
     assert "QWidget" in style
     assert Theme.PANEL in style
+
+
+def test_stylesheets_are_built_once():
+    assert Theme.global_stylesheet() is Theme.global_stylesheet()
+    assert Theme.accent_button_style() is Theme.accent_button_style()
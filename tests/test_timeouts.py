@@ -36,3 +36,12 @@ def test_get_timeout_unknown_key(temp_db):
 def test_get_timeout_bad_override_falls_back(temp_db):
     temp_db.set_config("timeout_login_wait_s", "not_a_number")
     assert get_timeout(temp_db, "login_wait_s") == 300
+
+
+def test_get_timeout_is_cached_until_invalidated(temp_db):
+    from timeouts import invalidate_timeout_cache
+    assert get_timeout(temp_db, "download_s") == 120
+    temp_db.set_config("timeout_download_s", "60")
+    assert get_timeout(temp_db, "download_s") == 120
+    invalidate_timeout_cache()
+    assert get_timeout(temp_db, "download_s") == 60
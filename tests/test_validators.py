@@ -65,3 +65,14 @@ class TestValidateDistribution:
     def test_nonexistent_cover_art(self):
         errors = validate_distribution(1, "W", cover_art_path="/nonexistent/art.png")
         assert any(e.field == "cover_art" for e in errors)
+
+
+def test_validation_error_uses_slots():
+    err = ValidationError("title", "Title cannot be empty")
+    assert not hasattr(err, "__dict__")
+    assert repr(err) == "ValidationError('title', 'Title cannot be empty')"
+
+
+def test_none_inputs_report_missing_fields():
+    errors = validate_song(None, None, None)
+    assert [e.field for e in errors] == ["title", "prompt", "lyrics"]
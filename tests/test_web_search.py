@@ -0,0 +1,146 @@
+"""Tests for web_search URL normalization and result de-duplication."""
+
+from web_search import SearchResult, dedupe_results, normalize_url
+
+
+def test_normalize_url_strips_tracking_params():
+    assert normalize_url(
+        "https://Example.com/story/?utm_source=x&id=7&fbclid=abc#top"
+    ) == "https://example.com/story?id=7"
+
+
+def test_normalize_url_keeps_distinct_paths():
+    assert normalize_url("https://example.com/a") != normalize_url(
+        "https://example.com/b"
+    )
+
+
+def test_dedupe_results_keeps_first_occurrence():
+    results = [
+        SearchResult("First", "https://example.com/page", "one"),
+        SearchResult("Other", "https://example.com/other", "two"),
+        SearchResult("Dup", "https://EXAMPLE.com/page/?utm_medium=email", "three"),
+    ]
+    assert [r.title for r in dedupe_results(results)] == ["First", "Other"]
+
+
+_PAGE = (
+    "<html><head><title>Yakima</title><style>p { color: red }</style></head>"
+    "<body><!-- comment --><nav>Menu</nav><header>Top</header>"
+    "<p>Fruit <b>bowl</b> of the nation</p><script>var x;</script>"
+    "<footer>Bottom</footer><svg><text>icon</text></svg>after</body></html>"
+)
+
+
+def test_strip_html_skips_boilerplate():
+    from web_search import _strip_html
+    assert _strip_html(_PAGE) == "Yakima\nFruit\nbowl\nof the nation\nafter"
+
+
+def test_strip_html_stdlib_fallback_matches(monkeypatch):
+    import web_search
+    expected = web_search._strip_html(_PAGE)
+    monkeypatch.setattr(web_search, "_lxml_html", None)
+    assert web_search._strip_html(_PAGE) == expected
+
+
+def test_strip_html_handles_empty_and_xml_declared_pages():
+    from web_search import _strip_html
+    assert _strip_html("") == ""
+    xhtml = '<?xml version="1.0" encoding="utf-8"?><html><body><p>Hi</p></body></html>'
+    assert _strip_html(xhtml) == "Hi"
+
+
+class _FakeRaw:
+    """Stands in for urllib3's response body in fetch_content tests."""
+
+    def __init__(self, data: bytes):
+        self.data = data
+        self.requested = None
+
+    def read(self, amt=None, decode_content=False):
+        self.requested = amt
+        return self.data[:amt]
+
+    def close(self):
+        pass
+
+
+def _fake_response(body: bytes, content_type: str, status: int = 200):
+    import requests
+    resp = requests.Response()
+    resp.status_code = status
+    resp.headers["Content-Type"] = content_type
+    resp.raw = _FakeRaw(body)
+    resp.url = "https://example.com/"
+    return resp
+
+
+def test_fetch_content_caps_bytes_read(monkeypatch):
+    import web_search
+    body = ("<p>" + "x" * 100 + "</p>").encode() * 1000
+    resp = _fake_response(body, "text/html; charset=utf-8")
+    monkeypatch.setattr(web_search._SESSION, "get", lambda *a, **kw: resp)
+    text = web_search.fetch_content("https://example.com/", max_chars=50)
+    assert resp.raw.requested == 50 * web_search._HTML_BYTES_PER_CHAR
+    assert len(text) == 50
+
+
+def test_fetch_content_rejects_non_html(monkeypatch):
+    import pytest
+    import web_search
+    resp = _fake_response(b"%PDF-1.7", "application/pdf")
+    monkeypatch.setattr(web_search._SESSION, "get", lambda *a, **kw: resp)
+    with pytest.raises(web_search.WebSearchError):
+        web_search.fetch_content("https://example.com/doc.pdf")
+    assert resp.raw.requested is None
+
+
+def test_decode_page_drops_character_cut_by_cap():
+    from web_search import _decode_page
+    raw = "<p>café</p>".encode("utf-8")
+    assert _decode_page(raw[:7], None) == "<p>caf"
+    assert _decode_page("<p>café</p>".encode("latin-1"), "iso-8859-1") == "<p>café</p>"
+    assert _decode_page(b"<p>caf\xe9</p>", None) == "<p>café</p>"
+
+
+def test_session_retries_transient_errors():
+    from web_search import _SESSION
+    retry = _SESSION.get_adapter("https://example.com/").max_retries
+    assert retry.total == 2
+    assert 503 in retry.status_forcelist
+    assert 429 not in retry.status_forcelist
+    assert retry.read == 0
+    assert not retry.respect_retry_after_header
+    assert "text/html" in _SESSION.headers["Accept"]
+
+
+def test_fetch_many_keeps_order_and_blanks_failures(monkeypatch):
+    import web_search
+
+    def fake_fetch(url, timeout=15, max_chars=15000):
+        if "bad" in url:
+            raise web_search.WebSearchError("boom")
+        return url.upper()
+
+    monkeypatch.setattr(web_search, "fetch_content", fake_fetch)
+    urls = ["https://a", "https://bad", "https://c"]
+    assert web_search.fetch_many(urls) == ["HTTPS://A", "", "HTTPS://C"]
+    assert web_search.fetch_many([]) == []
+
+
+def test_fetch_many_custom_fetch_reports_each_page():
+    import web_search
+
+    def fetch(url):
+        if "bad" in url:
+            raise web_search.WebSearchError("boom")
+        return url[::-1]
+
+    seen = []
+    urls = ["ab", "bad", "cd"]
+    texts = web_search.fetch_many(
+        urls, fetch=fetch, on_result=lambda url, text: seen.append((url, text)),
+    )
+    assert texts == ["ba", "", "dc"]
+    assert sorted(seen) == [("ab", "ba"), ("bad", ""), ("cd", "dc")]
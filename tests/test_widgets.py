@@ -47,3 +47,25 @@ def test_log_viewer_creation(qt_app):
     viewer = LogViewer()
     viewer.append_line("Test message")
     assert "Test message" in viewer.toPlainText()
+
+
+def test_status_badge_shares_stylesheets(qt_app):
+    from widgets.status_badge import StatusBadge
+    a = StatusBadge("completed")
+    b = StatusBadge("completed")
+    assert a.styleSheet() == b.styleSheet()
+    assert "#4CAF50" in a.styleSheet()
+    b.set_status("error")
+    assert "#F44336" in b.styleSheet()
+
+
+def test_tag_chips_overflow_and_contrast(qt_app):
+    from PyQt6.QtWidgets import QLabel
+    from widgets.tag_chips import TagChipsWidget
+    tags = [{"name": f"t{i}", "color": "#FFFF00" if i else "#000080"} for i in range(6)]
+    widget = TagChipsWidget(tags)
+    labels = widget.findChildren(QLabel)
+    assert [l.text() for l in labels] == ["t0", "t1", "t2", "t3", "+2"]
+    assert "color: #FFFFFF" in labels[0].styleSheet()
+    assert "color: #000000" in labels[1].styleSheet()
+    assert labels[1].styleSheet() == labels[2].styleSheet()